@@ -22,6 +22,55 @@ from .git_ops import (
 )
 
 
+# Messages for required command arguments, keyed by error field name.
+_REQUIRED = {
+    "branch": "branch name is required",
+    "purpose": "branch purpose is required",
+    "contribution": "contribution is required",
+    "source_branch": "source_branch is required",
+    "from_ref": "from_ref is required",
+    "ref": "ref is required",
+}
+
+
+def _require(**fields: Any) -> None:
+    """Check that required command arguments are non-empty.
+
+    Args:
+        **fields: Argument values keyed by error field name
+
+    Raises:
+        ValidationError: For the first empty field, in argument order
+    """
+    for field, value in fields.items():
+        if not value:
+            raise ValidationError(_REQUIRED[field], field=field)
+
+
+def _run_read(root: Path, session: str, func) -> Dict[str, Any]:
+    """Run a read-only git query under the shared session lock.
+
+    The first access to a session still has to create its directory
+    and repository, which is done under the exclusive lock.
+
+    Args:
+        root: Project root directory
+        session: Normalized session identifier
+        func: Callable taking the repository root
+
+    Returns:
+        Return value of func
+    """
+    repo_root = storage.session_root(root, session)
+    if not (repo_root / ".git").exists():
+        def _prepare() -> None:
+            storage.ensure_gcc(root, None, None, session)
+            ensure_repo(repo_root)
+
+        storage.with_lock(root, session, _prepare)
+    return storage.with_read_lock(root, session, func, repo_root)
+
+
 def init(
     root: Path,
     goal: Optional[str],
@@ -46,14 +95,15 @@ def init(
         GCCError: If initialization fails
     """
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, goal, todo, session)
-        ensure_repo(storage.session_root(root, session))
+        ensure_repo(ctx.session_root)
         return {
-            "gcc_root": str(storage.gcc_root(root)),
+            "gcc_root": str(ctx.gcc_root),
             "session": session,
-            "main": str(storage.main_path(root, session)),
+            "main": str(ctx.main_path),
         }
 
     return storage.with_lock(root, session, _run)
@@ -83,26 +133,21 @@ def branch(
         ValidationError: If branch_name or purpose are empty
         GCCError: If branch creation fails
     """
-    if not branch_name:
-        raise ValidationError("branch name is required", field="branch")
-    if not purpose:
-        raise ValidationError("branch purpose is required", field="purpose")
+    _require(branch=branch_name, purpose=purpose)
 
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
+        repo_root = ctx.session_root
         ensure_repo(repo_root)
         checkout_branch(repo_root, branch_name)
         storage.ensure_branch(root, session, branch_name, purpose)
+        paths = ctx.branch_paths(branch_name)
         add_and_commit(
             repo_root,
-            [
-                storage.commit_path(root, session, branch_name),
-                storage.log_path(root, session, branch_name),
-                storage.metadata_path(root, session, branch_name),
-            ],
+            [paths.commit, paths.log, paths.metadata],
             f"GCC branch {branch_name}",
         )
         return {"branch": branch_name, "purpose": purpose, "session": session}
@@ -134,25 +179,24 @@ def log(
         BranchNotFoundError: If branch doesn't exist
         GCCError: If operation fails
     """
-    if not branch_name:
-        raise ValidationError("branch name is required", field="branch")
+    _require(branch=branch_name)
 
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
+        repo_root = ctx.session_root
         ensure_repo(repo_root)
 
-        branches = storage.list_branches(root, session)
-        if branch_name not in branches:
-            raise BranchNotFoundError(branch_name, available=branches)
+        if not storage.branch_exists(root, session, branch_name):
+            raise BranchNotFoundError(branch_name, available=lambda: storage.list_branches(root, session))
 
         checkout_branch(repo_root, branch_name)
         storage.append_log(root, session, branch_name, entries)
         add_and_commit(
             repo_root,
-            [storage.log_path(root, session, branch_name)],
+            [ctx.branch_paths(branch_name).log],
             f"GCC log {branch_name}",
         )
         return {"branch": branch_name, "entries": len(entries), "session": session}
@@ -193,48 +237,55 @@ def commit(
         BranchNotFoundError: If branch doesn't exist and purpose not provided
         GCCError: If operation fails
     """
-    if not branch_name:
-        raise ValidationError("branch name is required", field="branch")
-    if not contribution:
-        raise ValidationError("contribution is required", field="contribution")
+    _require(branch=branch_name, contribution=contribution)
 
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
+        repo_root = ctx.session_root
         ensure_repo(repo_root)
 
-        branches = storage.list_branches(root, session)
-        if branch_name not in branches:
+        paths = ctx.branch_paths(branch_name)
+        # A new branch's files are all untracked, not just the ones staged below.
+        changed = []
+        if not storage.branch_exists(root, session, branch_name):
             if not purpose:
                 raise BranchNotFoundError(
                     branch_name,
-                    available=branches,
+                    available=lambda: storage.list_branches(root, session),
                 )
             storage.ensure_branch(root, session, branch_name, purpose)
+            changed = [paths.commit, paths.log, paths.metadata]
 
         checkout_branch(repo_root, branch_name)
         branch_purpose = storage.get_branch_purpose(root, session, branch_name) or (purpose or "")
 
-        if log_entries:
-            storage.append_log(root, session, branch_name, log_entries)
-        if metadata_updates:
-            storage.update_metadata(root, session, branch_name, metadata_updates)
-
-        commit_id = storage.append_commit(root, session, branch_name, branch_purpose, contribution)
+        if not (log_entries or metadata_updates or update_main_text):
+            # Dominant shape: only commit.md changes, so append directly
+            # without a staging area.
+            commit_id = storage.append_commit(root, session, branch_name, branch_purpose, contribution)
+            if paths.commit not in changed:
+                changed.append(paths.commit)
+        else:
+            with storage.StagedWrite() as staged:
+                if log_entries:
+                    storage.append_log(root, session, branch_name, log_entries, staged=staged)
+                if metadata_updates:
+                    storage.update_metadata(root, session, branch_name, metadata_updates, staged=staged)
+
+                commit_id = storage.append_commit(
+                    root, session, branch_name, branch_purpose, contribution, staged=staged
+                )
 
-        if update_main_text:
-            storage.update_main(root, session, update_main_text)
+                if update_main_text:
+                    storage.update_main(root, session, update_main_text, staged=staged)
+                changed.extend(path for path in staged.paths if path not in changed)
 
         add_and_commit(
             repo_root,
-            [
-                storage.commit_path(root, session, branch_name),
-                storage.log_path(root, session, branch_name),
-                storage.metadata_path(root, session, branch_name),
-                storage.main_path(root, session),
-            ],
+            changed,
             f"GCC commit {branch_name}: {contribution[:60]}",
         )
 
@@ -269,57 +320,65 @@ def merge(
         BranchNotFoundError: If source branch doesn't exist
         GCCError: If merge fails
     """
-    if not source_branch:
-        raise ValidationError("source_branch is required", field="source_branch")
+    _require(source_branch=source_branch)
 
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
+        repo_root = ctx.session_root
         ensure_repo(repo_root)
 
-        branches = storage.list_branches(root, session)
-        if source_branch not in branches:
-            raise BranchNotFoundError(source_branch, available=branches)
+        if not storage.branch_exists(root, session, source_branch):
+            raise BranchNotFoundError(source_branch, available=lambda: storage.list_branches(root, session))
 
         target = target_branch or "main"
-        if target not in branches:
+        source_paths = ctx.branch_paths(source_branch)
+        target_paths = ctx.branch_paths(target)
+        changed = []
+        if not storage.branch_exists(root, session, target):
             storage.ensure_branch(root, session, target, f"Main branch (merged from {source_branch})")
+            changed = [target_paths.commit, target_paths.log, target_paths.metadata]
 
         checkout_branch(repo_root, target)
 
-        # Merge commit history
-        source_commit = storage.commit_path(root, session, source_branch).read_text(encoding="utf-8")
-        storage._append_text(storage.commit_path(root, session, target), "\n" + source_commit)
-
-        # Merge log history
-        source_log = storage.log_path(root, session, source_branch).read_text(encoding="utf-8")
-        log_block = f"\n== Merge from {source_branch} ==\n" + source_log + "\n"
-        storage._append_text(storage.log_path(root, session, target), log_block)
-
-        # Merge metadata
-        source_meta = storage.read_metadata(root, session, source_branch)
-        if source_meta:
-            target_meta = storage.read_metadata(root, session, target)
-            merged_from = target_meta.get("merged_from", {})
-            merged_from[source_branch] = source_meta
-            target_meta["merged_from"] = merged_from
-            storage.update_metadata(root, session, target, target_meta)
+        # The target's files must be on disk before git merges into them.
+        with storage.StagedWrite() as staged:
+            # Merge commit history
+            staged.append_text(target_paths.commit, "\n")
+            staged.append_file(target_paths.commit, source_paths.commit)
+
+            # Merge log history
+            staged.append_text(target_paths.log, f"\n== Merge from {source_branch} ==\n")
+            staged.append_file(target_paths.log, source_paths.log)
+            staged.append_text(target_paths.log, "\n")
+
+            # Merge metadata
+            source_meta = storage.read_metadata(root, session, source_branch)
+            if source_meta:
+                target_meta = storage.read_metadata(root, session, target)
+                merged_from = target_meta.get("merged_from", {})
+                merged_from[source_branch] = source_meta
+                storage.update_metadata(
+                    root,
+                    session,
+                    target,
+                    {"merged_from": merged_from},
+                    staged=staged,
+                    current=target_meta,
+                )
+            changed.extend(path for path in staged.paths if path not in changed)
 
         # Create git merge
         merge_note = summary or f"Merged branch {source_branch} into {target}"
         merge_branch(repo_root, source_branch, merge_note)
         storage.update_main(root, session, merge_note)
+        changed.append(ctx.main_path)
 
         add_and_commit(
             repo_root,
-            [
-                storage.commit_path(root, session, target),
-                storage.log_path(root, session, target),
-                storage.metadata_path(root, session, target),
-                storage.main_path(root, session),
-            ],
+            changed,
             f"GCC merge {source_branch} -> {target}",
         )
 
@@ -356,40 +415,53 @@ def context(
         GCCError: If operation fails
     """
     session = storage.normalize_session_id(session_id)
+    if branch_name and not storage.session_context(root, session).session_root.exists():
+        # Nothing to look up yet; don't create the session just to fail.
+        raise BranchNotFoundError(branch_name, available=[])
     storage.ensure_gcc(root, None, None, session)
 
+    branches = storage.list_branches(root, session)
     result: Dict[str, Any] = {
         "main": storage.read_main(root, session),
-        "branches": storage.list_branches(root, session),
+        "branches": branches,
         "session": session,
     }
 
-    if branch_name:
-        branches = storage.list_branches(root, session)
-        if branch_name not in branches:
-            raise BranchNotFoundError(branch_name, available=branches)
+    if not branch_name:
+        return result
+    if branch_name not in branches:
+        raise BranchNotFoundError(branch_name, available=branches)
 
-        commit_text = storage.commit_path(root, session, branch_name).read_text(encoding="utf-8")
-        commits = storage._parse_commits(commit_text)
-        last_commit = commits[-1] if commits else {}
+    def _read_branch() -> None:
+        tail_text = storage.read_commits_tail(root, session, branch_name, 10)
+        summary = storage.summarize_commits_tail(tail_text, commit_id)
         result["branch"] = {
             "name": branch_name,
             "purpose": storage.get_branch_purpose(root, session, branch_name),
-            "latest_commit": last_commit.get("commit_id"),
-            "latest_summary": last_commit.get("This Commit's Contribution"),
-            "recent_commits": [c.get("commit_id") for c in commits[-10:]],
+            "latest_commit": summary["latest_commit"],
+            "latest_summary": summary["latest_summary"],
+            "recent_commits": summary["recent_commits"],
         }
 
-    if commit_id and branch_name:
-        result["commit_entry"] = storage.get_commit_entry(root, session, branch_name, commit_id)
-
-    if log_tail and branch_name:
-        result["log_tail"] = storage.read_log_tail(root, session, branch_name, log_tail)
-
-    if metadata_segment and branch_name:
-        metadata = storage.read_metadata(root, session, branch_name)
-        result["metadata"] = metadata.get(metadata_segment)
-
+        if commit_id:
+            # A recent commit is already in memory. An exact ID match there
+            # is the entry a full scan would find, since older entries
+            # can't mention an ID created after them.
+            entry = summary["commit_entry"]
+            if entry is None:
+                entry = storage.get_commit_entry(root, session, branch_name, commit_id)
+            result["commit_entry"] = entry
+
+        if log_tail:
+            result["log_tail"] = storage.read_log_tail(root, session, branch_name, log_tail)
+
+        if metadata_segment:
+            metadata = storage.read_metadata(root, session, branch_name)
+            result["metadata"] = metadata.get(metadata_segment)
+
+    # Branch files span several reads; a shared lock keeps a concurrent
+    # commit from landing between them without serializing readers.
+    storage.with_read_lock(root, session, _read_branch)
     return result
 
 
@@ -413,13 +485,10 @@ def history(
     """
     session = storage.normalize_session_id(session_id)
 
-    def _run() -> Dict[str, Any]:
-        storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
-        ensure_repo(repo_root)
+    def _run(repo_root: Path) -> Dict[str, Any]:
         return {"session": session, "commits": git_log(repo_root, limit)}
 
-    return storage.with_lock(root, session, _run)
+    return _run_read(root, session, _run)
 
 
 def diff(
@@ -443,18 +512,15 @@ def diff(
         ValidationError: If from_ref is empty
         GCCError: If operation fails
     """
-    if not from_ref:
-        raise ValidationError("from_ref is required", field="from_ref")
+    _require(from_ref=from_ref)
 
     session = storage.normalize_session_id(session_id)
 
-    def _run() -> Dict[str, Any]:
-        storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
-        ensure_repo(repo_root)
-        return {"session": session, "diff": git_diff(repo_root, from_ref, to_ref)}
+    def _run(repo_root: Path) -> Dict[str, Any]:
+        diff = git_diff(repo_root, from_ref, to_ref)
+        return {"session": session, "diff": diff.decode("utf-8", errors="replace")}
 
-    return storage.with_lock(root, session, _run)
+    return _run_read(root, session, _run)
 
 
 def show(
@@ -478,18 +544,15 @@ def show(
         ValidationError: If ref is empty
         GCCError: If operation fails
     """
-    if not ref:
-        raise ValidationError("ref is required", field="ref")
+    _require(ref=ref)
 
     session = storage.normalize_session_id(session_id)
 
-    def _run() -> Dict[str, Any]:
-        storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
-        ensure_repo(repo_root)
-        return {"session": session, "content": git_show(repo_root, ref, path)}
+    def _run(repo_root: Path) -> Dict[str, Any]:
+        content = git_show(repo_root, ref, path)
+        return {"session": session, "content": content.decode("utf-8", errors="replace")}
 
-    return storage.with_lock(root, session, _run)
+    return _run_read(root, session, _run)
 
 
 def reset(
@@ -515,18 +578,21 @@ def reset(
         ValidationError: If ref is empty or hard reset without confirm
         GCCError: If operation fails
     """
-    if not ref:
-        raise ValidationError("ref is required", field="ref")
+    _require(ref=ref)
     if mode == "hard" and not confirm:
         raise ValidationError("hard reset requires confirm=true", field="confirm")
 
     session = storage.normalize_session_id(session_id)
+    ctx = storage.session_context(root, session)
 
     def _run() -> Dict[str, Any]:
         storage.ensure_gcc(root, None, None, session)
-        repo_root = storage.session_root(root, session)
+        repo_root = ctx.session_root
         ensure_repo(repo_root)
         git_reset(repo_root, ref, mode)
+        if mode == "hard":
+            # The working tree was rewritten; re-check it next time.
+            storage.forget_ensured(root, session)
         return {"session": session, "ref": ref, "mode": mode}
 
     return storage.with_lock(root, session, _run)
@@ -5,6 +5,9 @@ providing clear error categorization for proper error handling.
 """
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Callable
+
 
 class GCCError(Exception):
     """Base exception for all GCC-related errors.
@@ -22,7 +25,25 @@ class GCCError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        if details:
+            self.details = details
+        self._dict_cache: dict | None = None
+
+    @cached_property
+    def details(self) -> dict:
+        """Additional error context, built on first access."""
+        return self._build_details()
+
+    def _build_details(self) -> dict:
+        """Build the details dictionary from constructor arguments.
+
+        Subclasses keep their raw arguments and override this, so errors
+        that are caught and discarded never allocate a details dict.
+
+        Returns:
+            Details dictionary
+        """
+        return {}
 
     def __str__(self) -> str:
         """Return the error message."""
@@ -34,11 +55,20 @@ class GCCError(Exception):
         Returns:
             Dictionary with error type and message
         """
-        return {
-            "error_type": self.__class__.__name__,
-            "message": self.message,
-            "details": self.details,
-        }
+        cached = self._dict_cache
+        # The cache holds details by reference, so in-place changes show
+        # through; only reassigning message or details needs a rebuild.
+        if (
+            cached is None
+            or cached["message"] is not self.message
+            or cached["details"] is not self.details
+        ):
+            cached = self._dict_cache = {
+                "error_type": self.__class__.__name__,
+                "message": self.message,
+                "details": self.details,
+            }
+        return cached
 
 
 class ValidationError(GCCError):
@@ -61,12 +91,17 @@ class ValidationError(GCCError):
             field: Name of the field that failed validation
             value: The invalid value (may be omitted for security)
         """
-        details = {}
-        if field:
-            details["field"] = field
-        if value is not None:
-            details["value"] = value
-        super().__init__(message, details)
+        super().__init__(message)
+        self._field = field
+        self._value = value
+
+    def _build_details(self) -> dict:
+        details = super()._build_details()
+        if self._field:
+            details["field"] = self._field
+        if self._value is not None:
+            details["value"] = self._value
+        return details
 
 
 class RepositoryError(GCCError):
@@ -88,12 +123,17 @@ class RepositoryError(GCCError):
             repo_path: Path to the repository
             git_error: Raw error output from git command
         """
-        details = {}
-        if repo_path:
-            details["repo_path"] = repo_path
-        if git_error:
-            details["git_error"] = git_error
-        super().__init__(message, details)
+        super().__init__(message)
+        self._repo_path = repo_path
+        self._git_error = git_error
+
+    def _build_details(self) -> dict:
+        details = super()._build_details()
+        if self._repo_path:
+            details["repo_path"] = self._repo_path
+        if self._git_error:
+            details["git_error"] = self._git_error
+        return details
 
 
 class StorageError(GCCError):
@@ -119,14 +159,21 @@ class StorageError(GCCError):
             details: Optional additional details
             **extra_details: Extra detail keys for callers
         """
-        merged_details = details.copy() if details else {}
-        if path:
-            merged_details["path"] = path
-        if io_error:
-            merged_details["io_error"] = io_error
-        if extra_details:
-            merged_details.update(extra_details)
-        super().__init__(message, merged_details)
+        super().__init__(message)
+        self._path = path
+        self._io_error = io_error
+        self._base_details = details
+        self._extra_details = extra_details
+
+    def _build_details(self) -> dict:
+        details = self._base_details.copy() if self._base_details else super()._build_details()
+        if self._path:
+            details["path"] = self._path
+        if self._io_error:
+            details["io_error"] = self._io_error
+        if self._extra_details:
+            details.update(self._extra_details)
+        return details
 
 
 class BranchNotFoundError(RepositoryError):
@@ -135,17 +182,29 @@ class BranchNotFoundError(RepositoryError):
     Raised when attempting to access a branch that hasn't been created.
     """
 
-    def __init__(self, branch: str, available: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        branch: str,
+        available: list[str] | Callable[[], list[str]] | None = None,
+    ) -> None:
         """Initialize a branch not found error.
 
         Args:
             branch: Name of the branch that was not found
-            available: List of available branch names
+            available: List of available branch names, or a callable
+                returning it that is only invoked if details are read
         """
         super().__init__(f"Branch not found: {branch}")
-        self.details["branch"] = branch
+        self._branch = branch
+        self._available = available
+
+    def _build_details(self) -> dict:
+        details = super()._build_details()
+        details["branch"] = self._branch
+        available = self._available() if callable(self._available) else self._available
         if available:
-            self.details["available_branches"] = available
+            details["available_branches"] = available
+        return details
 
 
 class SessionNotFoundError(GCCError):
@@ -176,10 +235,14 @@ class LockError(GCCError):
             message: Description of the locking error
             lock_path: Path to the lock file
         """
-        details = {}
-        if lock_path:
-            details["lock_path"] = lock_path
-        super().__init__(message, details)
+        super().__init__(message)
+        self._lock_path = lock_path
+
+    def _build_details(self) -> dict:
+        details = super()._build_details()
+        if self._lock_path:
+            details["lock_path"] = self._lock_path
+        return details
 
 
 class ConflictError(GCCError):
@@ -195,10 +258,14 @@ class ConflictError(GCCError):
             message: Description of the conflict
             conflict_type: Type of conflict (merge, lock, etc.)
         """
-        details = {}
-        if conflict_type:
-            details["conflict_type"] = conflict_type
-        super().__init__(message, details)
+        super().__init__(message)
+        self._conflict_type = conflict_type
+
+    def _build_details(self) -> dict:
+        details = super()._build_details()
+        if self._conflict_type:
+            details["conflict_type"] = self._conflict_type
+        return details
 
 
 class RateLimitError(GCCError):
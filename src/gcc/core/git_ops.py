@@ -5,33 +5,69 @@ Improves error handling, logging, and validation over direct git calls.
 """
 from __future__ import annotations
 
+import atexit
+import heapq
+import itertools
 import os
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .exceptions import RepositoryError, ValidationError
 from .validators import Validators
 
 
+# Maximum number of cat-file batch processes kept alive at once
+MAX_CAT_FILE_PROCESSES = 16
+
+# Maximum number of git.log descriptors kept open at once
+MAX_GIT_LOG_HANDLES = 32
+
+# git executable resolved once, so spawns skip the PATH search. A bare
+# "git" is kept when it is not on PATH so the failure surfaces as
+# RepositoryError("Git not found") on first use rather than at import.
+_GIT_BIN = shutil.which("git") or "git"
+
+
+_cached_git_config = None
+
+
 def _get_git_config():
     """Get git configuration from global config.
 
+    The result is resolved once and reused; call reset_git_config_cache
+    after replacing the global config.
+
     Returns:
         GitConfig instance with default name and email
     """
+    global _cached_git_config
+    if _cached_git_config is not None:
+        return _cached_git_config
     try:
         from ..server.config import get_config
         config = get_config()
-        return config.git
+        _cached_git_config = config.git
     except Exception:
         # Fallback if config not initialized
         class GitConfig:
             default_name = "GCC Agent"
             default_email = "gcc@example.com"
             default_branch = "main"
-        return GitConfig()
+            command_timeout = 120.0
+        _cached_git_config = GitConfig()
+    return _cached_git_config
+
+
+def reset_git_config_cache() -> None:
+    """Drop the cached git configuration so the next lookup re-reads it."""
+    global _cached_git_config
+    _cached_git_config = None
 
 
 def _log_path(repo_root: Path) -> Path:
@@ -46,82 +82,265 @@ def _log_path(repo_root: Path) -> Path:
     return repo_root / "git.log"
 
 
-def _append_git_log(repo_root: Path, args: List[str], result: subprocess.CompletedProcess) -> None:
+# (epoch second, formatted UTC timestamp) of the last git.log entry
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _log_timestamp() -> str:
+    """Return the current UTC time formatted for git.log.
+
+    Git calls come in bursts, so the formatted string is reused for every
+    entry written within the same second.
+    """
+    global _last_timestamp
+    now = int(time.time())
+    cached_second, cached = _last_timestamp
+    if now != cached_second:
+        cached = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _last_timestamp = (now, cached)
+    return cached
+
+
+def _append_git_log(
+    repo_root: Path,
+    args: List[str],
+    result: subprocess.CompletedProcess,
+    stdout_size: Optional[int] = None,
+) -> None:
     """Append git operation to log file.
 
     Args:
         repo_root: Git repository root directory
         args: Git command arguments
         result: Completed process result
+        stdout_size: Size of output that was streamed rather than captured
 
     Note:
         Failures in logging are silently ignored to avoid disrupting
         the main operation flow.
     """
     try:
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        lines = [
-            f"[{timestamp}] git {' '.join(args)}",
-            f"exit={result.returncode}",
+        chunks = [
+            f"[{_log_timestamp()}] git {' '.join(args)}\nexit={result.returncode}\n".encode("utf-8")
         ]
-        if result.stdout:
-            lines.append("stdout:")
-            lines.append(result.stdout.rstrip())
-        if result.stderr:
-            lines.append("stderr:")
-            lines.append(result.stderr.rstrip())
-        lines.append("")
-
-        _log_path(repo_root).parent.mkdir(parents=True, exist_ok=True)
-
-        # Add retry mechanism for robustness
-        for attempt in range(3):
-            try:
-                with _log_path(repo_root).open("a", encoding="utf-8") as handle:
-                    handle.write("\n".join(lines) + "\n")
-                break
-            except (IOError, OSError) as e:
-                if attempt == 2:
-                    # Last attempt failed, log to stderr
-                    import sys
-                    print(f"Failed to write git log: {e}", file=sys.stderr)
-                import time
-                time.sleep(0.1 * (attempt + 1))
+        if stdout_size is None and isinstance(result.stdout, bytes):
+            stdout_size = len(result.stdout)
+        if stdout_size is not None:
+            chunks.append(f"stdout: <{stdout_size} bytes>\n".encode("ascii"))
+        elif result.stdout:
+            chunks += [b"stdout:\n", result.stdout.rstrip().encode("utf-8"), b"\n"]
+        stderr = result.stderr
+        if stderr:
+            if isinstance(stderr, str):
+                stderr = stderr.encode("utf-8")
+            chunks += [b"stderr:\n", stderr.rstrip(), b"\n"]
+        chunks.append(b"\n")
+
+        _write_git_log(_log_path(repo_root), chunks)
     except Exception as e:
         # Log but don't raise - logging failure shouldn't break operations
         import sys
         print(f"Error in _append_git_log: {e}", file=sys.stderr)
 
 
-def _run_git(args: List[str], cwd: Path) -> subprocess.CompletedProcess:
+# Scatter-write an entry in one syscall where the platform supports it
+_writev = getattr(os, "writev", None)
+
+_git_log_lock = threading.Lock()
+# Open git.log descriptors keyed by path, with the inode they refer to
+_git_log_fds: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+
+
+def _write_git_log(path: Path, chunks: List[bytes]) -> None:
+    """Append an entry to a git.log through a cached descriptor.
+
+    A command issues several git calls in a row, so the log stays open
+    between them instead of being reopened for every entry. The path is
+    stat'ed on each write: if the file was removed or replaced, the stale
+    descriptor is dropped and the log reopened.
+
+    Args:
+        path: git.log path
+        chunks: Encoded pieces of the entry, written in order
+    """
+    key = str(path)
+    try:
+        ino = os.stat(key).st_ino
+    except FileNotFoundError:
+        ino = None
+    with _git_log_lock:
+        cached = _git_log_fds.get(key)
+        if cached is not None and cached[1] == ino:
+            fd = cached[0]
+            _git_log_fds.move_to_end(key)
+        else:
+            if cached is not None:
+                del _git_log_fds[key]
+                os.close(cached[0])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _git_log_fds[key] = (fd, os.fstat(fd).st_ino)
+            while len(_git_log_fds) > MAX_GIT_LOG_HANDLES:
+                _, (oldest, _) = _git_log_fds.popitem(last=False)
+                os.close(oldest)
+        # Written under the lock so eviction can never close (and the OS
+        # reuse) a descriptor another thread is still writing to.
+        written = _writev(fd, chunks) if _writev is not None else 0
+        if written < sum(map(len, chunks)):
+            # Short (or unsupported) scatter write: finish the remainder.
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+
+
+@atexit.register
+def _close_git_logs() -> None:
+    """Close every cached git.log descriptor at interpreter exit."""
+    with _git_log_lock:
+        for fd, _ in _git_log_fds.values():
+            os.close(fd)
+        _git_log_fds.clear()
+
+
+def _git_command(args: List[str], cwd: Path, read_only: bool = False) -> List[str]:
+    """Build the argv for a git invocation.
+
+    The working directory is passed as ``-C`` rather than through
+    ``subprocess``'s ``cwd``: together with ``close_fds=False`` this keeps
+    the spawn eligible for ``posix_spawn``, which avoids fork's copy of
+    the parent's page tables.
+
+    Args:
+        args: Git command arguments (without 'git' prefix)
+        cwd: Directory git should run in
+        read_only: Whether the command only reads repository state
+
+    Returns:
+        Full command line
+    """
+    if read_only:
+        return [_GIT_BIN, "-C", str(cwd), "--no-optional-locks", *args]
+    return [_GIT_BIN, "-C", str(cwd), *args]
+
+
+def _git_env(read_only: bool = False) -> Optional[dict]:
+    """Build the environment for a git invocation.
+
+    Read-only commands run with GIT_OPTIONAL_LOCKS=0 so they never
+    refresh the index or take index.lock behind a concurrent writer's back.
+
+    Args:
+        read_only: Whether the command only reads repository state
+
+    Returns:
+        Environment mapping, or None to inherit the current environment
+    """
+    if read_only:
+        return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+    return None
+
+
+def _run_git(
+    args: List[str],
+    cwd: Path,
+    read_only: bool = False,
+    input: Optional[str] = None,
+) -> subprocess.CompletedProcess:
     """Run git command and raise on error.
 
     Args:
         args: Git command arguments (without 'git' prefix)
         cwd: Working directory for command
+        read_only: Skip optional locks for commands that only read
+        input: Optional text fed to the command's stdin
+
+    Returns:
+        Completed process result with ``str`` output
+
+    Raises:
+        RepositoryError: If git command fails
+    """
+    return _invoke_git(args, cwd, read_only, input, text=True)
+
+
+def _run_git_bytes(
+    args: List[str],
+    cwd: Path,
+    read_only: bool = False,
+) -> subprocess.CompletedProcess:
+    """Run git command and return its raw output.
+
+    Used for commands whose stdout can be large or binary (``show``,
+    ``diff``): the output is never pushed through a text decoder here,
+    and only its size is written to git.log.
+
+    Args:
+        args: Git command arguments (without 'git' prefix)
+        cwd: Working directory for command
+        read_only: Skip optional locks for commands that only read
 
     Returns:
-        Completed process result
+        Completed process result with ``bytes`` output
 
     Raises:
         RepositoryError: If git command fails
     """
+    return _invoke_git(args, cwd, read_only, None, text=False)
+
+
+def _invoke_git(
+    args: List[str],
+    cwd: Path,
+    read_only: bool,
+    input: Optional[str],
+    text: bool,
+) -> subprocess.CompletedProcess:
+    # subprocess.run drains stdout and stderr together through
+    # communicate(), so a chatty stderr cannot block a large stdout; the
+    # timeout bounds a git process that hangs (credential prompt, stale
+    # lock) instead of tying up the worker forever.
+    timeout = _get_git_config().command_timeout or None
     try:
         result = subprocess.run(
-            ["git", *args],
-            cwd=str(cwd),
+            _git_command(args, cwd, read_only),
+            # Descriptors opened by Python are non-inheritable (PEP 446),
+            # so nothing leaks into git without close_fds.
+            close_fds=False,
+            env=_git_env(read_only),
+            input=input,
             check=True,
             capture_output=True,
-            text=True,
+            text=text,
+            timeout=timeout,
         )
         _append_git_log(cwd, args, result)
         return result
+    except subprocess.TimeoutExpired as exc:
+        _append_git_log(
+            cwd,
+            args,
+            subprocess.CompletedProcess(
+                exc.cmd,
+                "timeout",
+                exc.stdout,
+                exc.stderr or f"timed out after {timeout}s",
+            ),
+        )
+        raise RepositoryError(
+            f"Git command timed out after {timeout}s: git {' '.join(args)}",
+            repo_path=str(cwd),
+            git_error=_as_text(exc.stderr),
+        ) from exc
     except subprocess.CalledProcessError as exc:
         _append_git_log(cwd, args, exc)
+        if not os.path.isdir(os.path.join(cwd, ".git")):
+            # The repository was removed behind our back; let the next
+            # ensure_repo set it up again instead of trusting the cache.
+            _forget_repo(cwd)
         raise RepositoryError(
             f"Git command failed: git {' '.join(args)}",
             repo_path=str(cwd),
-            git_error=exc.stderr or exc.stdout or str(exc),
+            git_error=_as_text(exc.stderr) or _as_text(exc.stdout) or str(exc),
         ) from exc
     except FileNotFoundError as e:
         raise RepositoryError(
@@ -135,6 +354,15 @@ def _run_git(args: List[str], cwd: Path) -> subprocess.CompletedProcess:
         ) from e
 
 
+def _as_text(output: Optional[Union[str, bytes]]) -> str:
+    """Decode captured git output, replacing undecodable bytes."""
+    if not output:
+        return ""
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
 def _try_git(args: List[str], cwd: Path) -> Optional[str]:
     """Run git command and return None on error.
 
@@ -152,6 +380,200 @@ def _try_git(args: List[str], cwd: Path) -> Optional[str]:
         return None
 
 
+class _CatFileBatch:
+    """Long-lived ``git cat-file --batch`` process for one repository.
+
+    Object lookups are written to the process stdin and answered on
+    stdout, so repeated reads cost a pipe round-trip instead of a
+    fork/exec and repository open per call.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        """Start the batch process.
+
+        Args:
+            repo_root: Git repository root directory
+
+        Raises:
+            RepositoryError: If git cannot be started
+        """
+        self.repo_root = repo_root
+        self._lock = threading.Lock()
+        self._closed = False
+        try:
+            self._proc = subprocess.Popen(
+                _git_command(["cat-file", "--batch"], repo_root, read_only=True),
+                close_fds=False,
+                env=_git_env(read_only=True),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise RepositoryError(
+                f"Failed to start git cat-file: {e}",
+                repo_path=str(repo_root),
+            ) from e
+
+    def read_object(self, spec: str) -> Tuple[Optional[str], Optional[str], bytes]:
+        """Look up a single object along with its resolved name.
+
+        Args:
+            spec: Object name understood by git (e.g. ``HEAD``)
+
+        Returns:
+            Tuple of (object id, object type, raw content); id and type are
+            None when the object is missing or ambiguous
+
+        Raises:
+            RepositoryError: If the batch process stopped responding
+        """
+        with self._lock:
+            if self._closed:
+                raise RepositoryError(
+                    "git cat-file --batch failed: process was closed",
+                    repo_path=str(self.repo_root),
+                )
+            try:
+                self._proc.stdin.write(spec.encode("utf-8") + b"\n")
+                self._proc.stdin.flush()
+                header = self._proc.stdout.readline()
+                if not header:
+                    raise OSError("unexpected end of output")
+                if header.endswith((b" missing\n", b" ambiguous\n")):
+                    return None, None, b""
+                fields = header.split()
+                if len(fields) != 3:
+                    raise OSError(f"malformed header: {header!r}")
+                size = int(fields[2])
+                data = self._proc.stdout.read(size + 1)
+                if len(data) != size + 1:
+                    raise OSError("truncated object content")
+            except (OSError, ValueError) as e:
+                raise RepositoryError(
+                    f"git cat-file --batch failed: {e}",
+                    repo_path=str(self.repo_root),
+                ) from e
+        return fields[0].decode("ascii"), fields[1].decode("ascii"), data[:size]
+
+    def alive(self) -> bool:
+        """Check whether the batch process is still running."""
+        return self._proc.poll() is None
+
+    def close(self) -> None:
+        """Terminate the batch process.
+
+        Waits for a lookup in progress on another thread to finish, so an
+        evicted process is never stopped mid-read. Later lookups raise
+        RepositoryError.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            finally:
+                if self._proc.stdout:
+                    self._proc.stdout.close()
+
+
+# Parsed `git config --list` output per repository.
+_config_cache: Dict[str, Dict[str, str]] = {}
+
+# Repositories this process has already initialized and configured.
+_ensured_repos: set = set()
+# Re-entrant: a git failure inside ensure_repo may call _forget_repo.
+_ensured_lock = threading.RLock()
+
+_cat_file_lock = threading.Lock()
+_cat_file_procs: "OrderedDict[str, _CatFileBatch]" = OrderedDict()
+
+
+def _cat_file(repo_root: Path) -> _CatFileBatch:
+    """Get the cached cat-file batch process for a repository.
+
+    Args:
+        repo_root: Git repository root directory
+
+    Returns:
+        Running _CatFileBatch instance
+    """
+    key = os.path.abspath(repo_root)
+    stale = []
+    with _cat_file_lock:
+        batch = _cat_file_procs.get(key)
+        if batch is not None and batch.alive():
+            _cat_file_procs.move_to_end(key)
+            return batch
+        if batch is not None:
+            del _cat_file_procs[key]
+            stale.append(batch)
+        batch = _CatFileBatch(repo_root)
+        _cat_file_procs[key] = batch
+        while len(_cat_file_procs) > MAX_CAT_FILE_PROCESSES:
+            stale.append(_cat_file_procs.popitem(last=False)[1])
+    # Closed outside the cache lock: close() waits for a read another
+    # thread may still be doing on an evicted process.
+    for old in stale:
+        old.close()
+    return batch
+
+
+def _read_object(repo_root: Path, spec: str) -> Tuple[Optional[str], Optional[str], bytes]:
+    """Look up an object through the cached cat-file process.
+
+    The process may have died between calls (killed, repository
+    replaced) or been evicted and closed by another thread; the lookup
+    is retried once on a fresh one before giving up.
+
+    Args:
+        repo_root: Git repository path
+        spec: Object name understood by git
+
+    Returns:
+        Tuple of (object id, object type, raw content), as
+        _CatFileBatch.read_object
+
+    Raises:
+        RepositoryError: If the batch process fails twice
+    """
+    try:
+        return _cat_file(repo_root).read_object(spec)
+    except RepositoryError:
+        _close_cat_file(repo_root)
+    try:
+        return _cat_file(repo_root).read_object(spec)
+    except RepositoryError:
+        _close_cat_file(repo_root)
+        raise
+
+
+def _close_cat_file(repo_root: Path) -> None:
+    """Stop and forget the cat-file process for a repository, if any.
+
+    Args:
+        repo_root: Git repository root directory
+    """
+    with _cat_file_lock:
+        batch = _cat_file_procs.pop(os.path.abspath(repo_root), None)
+    if batch is not None:
+        batch.close()
+
+
+@atexit.register
+def _close_all_cat_files() -> None:
+    """Stop every cached cat-file process at interpreter exit."""
+    with _cat_file_lock:
+        batches = list(_cat_file_procs.values())
+        _cat_file_procs.clear()
+    for batch in batches:
+        batch.close()
+
+
 def ensure_repo(repo_root: Path) -> None:
     """Ensure git repository exists and is configured.
 
@@ -164,18 +586,38 @@ def ensure_repo(repo_root: Path) -> None:
     Raises:
         RepositoryError: If initialization fails
     """
-    try:
-        repo_root.mkdir(parents=True, exist_ok=True)
-        if not (repo_root / ".git").exists():
-            git_config = _get_git_config()
-            _run_git(["init", "-b", git_config.default_branch], repo_root)
-        _ensure_identity(repo_root)
-        _ensure_initial_commit(repo_root)
-    except OSError as e:
-        raise RepositoryError(
-            f"Failed to create repository directory: {e}",
-            repo_path=str(repo_root),
-        ) from e
+    key = str(repo_root)
+    if key in _ensured_repos:
+        return
+    with _ensured_lock:
+        if key in _ensured_repos:
+            return
+        try:
+            repo_root.mkdir(parents=True, exist_ok=True)
+            if not (repo_root / ".git").exists():
+                git_config = _get_git_config()
+                _close_cat_file(repo_root)
+                _config_cache.pop(key, None)
+                _run_git(["init", "-b", git_config.default_branch], repo_root)
+            _ensure_identity(repo_root)
+            _ensure_initial_commit(repo_root)
+        except OSError as e:
+            raise RepositoryError(
+                f"Failed to create repository directory: {e}",
+                repo_path=str(repo_root),
+            ) from e
+        _ensured_repos.add(key)
+
+
+def _forget_repo(repo_root: Path) -> None:
+    """Make the next ensure_repo call re-check a repository.
+
+    Args:
+        repo_root: Git repository path
+    """
+    with _ensured_lock:
+        _ensured_repos.discard(str(repo_root))
+        _config_cache.pop(str(repo_root), None)
 
 
 def _ensure_identity(repo_root: Path) -> None:
@@ -188,13 +630,41 @@ def _ensure_identity(repo_root: Path) -> None:
         RepositoryError: If configuration fails
     """
     git_config = _get_git_config()
-    name = _try_git(["config", "--get", "user.name"], repo_root)
-    email = _try_git(["config", "--get", "user.email"], repo_root)
+    values = _read_all_config(repo_root)
 
-    if not name:
+    if not values.get("user.name"):
         _run_git(["config", "user.name", git_config.default_name], repo_root)
-    if not email:
+        values["user.name"] = git_config.default_name
+    if not values.get("user.email"):
         _run_git(["config", "user.email", git_config.default_email], repo_root)
+        values["user.email"] = git_config.default_email
+
+
+def _read_all_config(repo_root: Path) -> Dict[str, str]:
+    """Read every effective git config value in one git call.
+
+    The parsed result is cached per repository; writers made through
+    _ensure_identity keep it up to date.
+
+    Args:
+        repo_root: Git repository path
+
+    Returns:
+        Mapping of lowercased config keys to their last (effective) value
+    """
+    key = str(repo_root)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
+    values: Dict[str, str] = {}
+    output = _try_git(["config", "--list", "-z"], repo_root)
+    for entry in (output or "").split("\0"):
+        if not entry:
+            continue
+        name, _, value = entry.partition("\n")
+        values[name] = value
+    _config_cache[key] = values
+    return values
 
 
 def _ensure_initial_commit(repo_root: Path) -> None:
@@ -206,8 +676,7 @@ def _ensure_initial_commit(repo_root: Path) -> None:
     Raises:
         RepositoryError: If commit creation fails
     """
-    head = _try_git(["rev-parse", "--verify", "HEAD"], repo_root)
-    if head:
+    if _has_head_commit(repo_root):
         return
     _run_git(["add", "-A"], repo_root)
     _run_git(["commit", "--allow-empty", "-m", "GCC init"], repo_root)
@@ -225,6 +694,9 @@ def current_branch(repo_root: Path) -> str:
     Raises:
         RepositoryError: If git command fails
     """
+    head = _read_head(repo_root)
+    if head and head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):] or _get_git_config().default_branch
     try:
         name = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], repo_root).stdout.strip()
         return name or _get_git_config().default_branch
@@ -232,6 +704,56 @@ def current_branch(repo_root: Path) -> str:
         return _get_git_config().default_branch
 
 
+def _read_head(repo_root: Path) -> Optional[str]:
+    """Read the repository's HEAD file without running git.
+
+    Args:
+        repo_root: Git repository path
+
+    Returns:
+        Stripped HEAD content (e.g. "ref: refs/heads/main"), or None if it
+        can't be read
+    """
+    try:
+        return (repo_root / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _has_head_commit(repo_root: Path) -> bool:
+    """Check whether HEAD points at a commit.
+
+    Answers from the ref files when possible and only asks git when the
+    layout is unusual (e.g. a reftable or symref chain).
+
+    Args:
+        repo_root: Git repository path
+
+    Returns:
+        True if HEAD resolves to a commit
+    """
+    head = _read_head(repo_root)
+    if head is not None and not head.startswith("ref: "):
+        # Detached HEAD holds the commit hash itself.
+        return bool(head)
+    if head is not None:
+        ref = head[len("ref: "):]
+        if (repo_root / ".git" / ref).is_file():
+            return True
+        try:
+            packed = (repo_root / ".git" / "packed-refs").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            packed = ""
+        except (OSError, UnicodeDecodeError):
+            packed = None
+        if packed is not None:
+            if f" {ref}\n" in packed or packed.endswith(f" {ref}"):
+                return True
+            if not (repo_root / ".git" / "reftable").exists():
+                return False
+    return bool(_try_git(["rev-parse", "--verify", "HEAD"], repo_root))
+
+
 def checkout_branch(repo_root: Path, branch: str) -> None:
     """Checkout or create a branch.
 
@@ -244,6 +766,9 @@ def checkout_branch(repo_root: Path, branch: str) -> None:
         ValidationError: If branch name is invalid
     """
     validated_branch = Validators.validate_branch_name(branch)
+    if _read_head(repo_root) == f"ref: refs/heads/{validated_branch}":
+        # Already on it; git checkout would be a no-op.
+        return
     existing_branches = _run_git(["branch", "--list", validated_branch], repo_root).stdout.strip()
     if existing_branches:
         _run_git(["checkout", validated_branch], repo_root)
@@ -263,22 +788,41 @@ def add_and_commit(repo_root: Path, paths: Iterable[Path], message: str) -> None
         RepositoryError: If add or commit fails
     """
     try:
+        # os.path.relpath avoids building PurePath objects for every path;
+        # the pardir check keeps relative_to's refusal of escaping paths.
+        root_str = os.fspath(repo_root)
+        escape = os.pardir + os.sep
         rel_paths = []
         for p in paths:
             try:
-                rel_paths.append(str(p.relative_to(repo_root)))
-            except ValueError as e:
+                rel = os.path.relpath(os.fspath(p), root_str)
+            except ValueError:  # different drive on Windows
+                rel = os.pardir
+            if rel == os.pardir or rel.startswith(escape):
                 raise RepositoryError(
                     f"Path {p} is not under repository root {repo_root}",
                     repo_path=str(repo_root),
-                ) from e
+                )
+            rel_paths.append(rel)
 
         if not rel_paths:
             return
 
-        _run_git(["add", *rel_paths], repo_root)
-        if _try_git(["diff", "--cached", "--quiet"], repo_root) is None:
+        # Pathspecs go through stdin so a large change set stays one
+        # short command line; NUL separators need no quoting for any name.
+        _run_git(
+            ["add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+            repo_root,
+            input="\0".join(rel_paths) + "\0",
+        )
+        try:
             _run_git(["commit", "-m", message], repo_root)
+        except RepositoryError:
+            # Usually something was staged, so commit first and only probe
+            # the index when that fails. Checking the exit status instead
+            # of "nothing to commit" keeps this independent of git's locale.
+            if _try_git(["diff", "--cached", "--quiet"], repo_root) is None:
+                raise
     except RepositoryError:
         raise
     except Exception as e:
@@ -312,33 +856,204 @@ def git_log(repo_root: Path, limit: int = 20) -> List[dict]:
     Returns:
         List of commit dictionaries with hash, timestamp, subject
 
+    Raises:
+        RepositoryError: If log command fails
+        ValidationError: If limit is invalid
+    """
+    return list(git_log_iter(repo_root, limit))
+
+
+def git_log_iter(repo_root: Path, limit: int = 20) -> Iterator[dict]:
+    """Stream commit history one entry at a time.
+
+    History is walked in-process through the repository's cat-file batch
+    process, so no git process is spawned per call; ``git log`` is only
+    run when HEAD cannot be read that way (e.g. no commits yet), which
+    also lets git report the error.
+
+    Args:
+        repo_root: Git repository path
+        limit: Maximum number of commits to yield
+
+    Yields:
+        Commit dictionaries with hash, timestamp, subject
+
     Raises:
         RepositoryError: If log command fails
         ValidationError: If limit is invalid
     """
     validated_limit = Validators.validate_limit(limit)
     try:
-        result = _run_git(
-            ["log", f"-n{validated_limit}", "--pretty=format:%H|%ct|%s"],
+        head = _read_commit(repo_root, "HEAD")
+    except RepositoryError:
+        head = None
+    if head is None:
+        yield from _stream_git_log(repo_root, validated_limit)
+        return
+    emitted = 0
+    try:
+        for entry in _walk_commits(repo_root, head, validated_limit):
+            yield entry
+            emitted += 1
+    except RepositoryError:
+        # cat-file failed partway through; git log yields the same
+        # order, so continue from it past what was already returned.
+        for entry in itertools.islice(_stream_git_log(repo_root, validated_limit), emitted, None):
+            yield entry
+
+
+# (object id, committer timestamp, parent ids, subject) of a parsed commit
+_Commit = Tuple[str, int, List[str], str]
+
+
+def _read_commit(repo_root: Path, spec: str) -> Optional[_Commit]:
+    """Read and parse one commit object through cat-file.
+
+    Args:
+        repo_root: Git repository path
+        spec: Commit name (ref or object id)
+
+    Returns:
+        Parsed commit, or None if ``spec`` does not name a commit
+
+    Raises:
+        RepositoryError: If the batch process fails
+    """
+    oid, obj_type, data = _read_object(repo_root, spec)
+    if obj_type != "commit":
+        return None
+    header, _, message = data.partition(b"\n\n")
+    parents = []
+    timestamp = 0
+    for line in header.split(b"\n"):
+        if line.startswith(b"parent "):
+            parents.append(line[7:].decode("ascii"))
+        elif line.startswith(b"committer "):
+            timestamp = int(line.rsplit(b" ", 2)[1])
+    # Same as %s: the first paragraph, its lines joined by spaces.
+    subject = []
+    for line in message.lstrip(b"\n").split(b"\n"):
+        line = line.rstrip()
+        if not line:
+            break
+        subject.append(line)
+    return oid, timestamp, parents, b" ".join(subject).decode("utf-8", errors="replace")
+
+
+def _walk_commits(repo_root: Path, head: _Commit, limit: int) -> Iterator[dict]:
+    """Yield commits reachable from ``head`` in ``git log`` order.
+
+    Like git's default walk, commits come out newest committer date first,
+    with ties kept in the order they were queued.
+
+    Args:
+        repo_root: Git repository path
+        head: Parsed starting commit
+        limit: Maximum number of commits to yield
+
+    Yields:
+        Commit dictionaries with hash, timestamp, subject
+    """
+    counter = itertools.count()
+    queue = [(-head[1], next(counter), head)]
+    seen = {head[0]}
+    emitted = 0
+    returncode = 0
+    try:
+        while queue and emitted < limit:
+            _, _, (oid, timestamp, parents, subject) = heapq.heappop(queue)
+            emitted += 1
+            yield {"hash": oid, "timestamp": timestamp, "subject": subject}
+            if emitted == limit:
+                break
+            for parent_id in parents:
+                if parent_id in seen:
+                    continue
+                seen.add(parent_id)
+                parent = _read_commit(repo_root, parent_id)
+                if parent is not None:  # absent in shallow clones
+                    heapq.heappush(queue, (-parent[1], next(counter), parent))
+    except Exception:
+        returncode = 1
+        raise
+    finally:
+        # Logged even when the caller stops early or the walk fails.
+        _append_git_log(
             repo_root,
+            ["cat-file", "--batch"],
+            subprocess.CompletedProcess(
+                ["git", "cat-file", "--batch"], returncode, f"<{emitted} commits walked>", ""
+            ),
         )
-        entries = []
-        for line in result.stdout.splitlines():
-            parts = line.split("|", 2)
-            if len(parts) != 3:
-                continue
+
+
+def _stream_git_log(repo_root: Path, validated_limit: int) -> Iterator[dict]:
+    """Run ``git log`` and parse its records straight off stdout.
+
+    The full log is never held in memory and closing the iterator early
+    stops git.
+
+    Args:
+        repo_root: Git repository path
+        validated_limit: Maximum number of commits to yield
+
+    Yields:
+        Commit dictionaries with hash, timestamp, subject
+
+    Raises:
+        RepositoryError: If log command fails
+    """
+    args = ["log", f"-n{validated_limit}", "--pretty=format:%H%x00%ct%x00%s"]
+    try:
+        # stderr goes to a file rather than a second pipe so a noisy git
+        # can never block while stdout is being consumed.
+        with tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(
+                _git_command(args, repo_root, read_only=True),
+                close_fds=False,
+                env=_git_env(read_only=True),
+                stdout=subprocess.PIPE,
+                stderr=err,
+            )
+            size = 0
             try:
-                entries.append({
-                    "hash": parts[0],
-                    "timestamp": int(parts[1]),
-                    "subject": parts[2]
-                })
-            except ValueError:
-                # Skip entries with invalid timestamp
-                continue
-        return entries
-    except RepositoryError:
+                for raw in proc.stdout:
+                    size += len(raw)
+                    parts = raw.rstrip(b"\n").split(b"\0", 2)
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        timestamp = int(parts[1])
+                    except ValueError:
+                        # Skip entries with invalid timestamp
+                        continue
+                    yield {
+                        "hash": parts[0].decode("ascii"),
+                        "timestamp": timestamp,
+                        "subject": parts[2].decode("utf-8", errors="replace"),
+                    }
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stdout.close()
+                returncode = proc.wait()
+            err.seek(0)
+            stderr = err.read()
+        result = subprocess.CompletedProcess(args, returncode, b"", stderr)
+        _append_git_log(repo_root, args, result, stdout_size=size)
+        if returncode != 0:
+            raise RepositoryError(
+                f"Git command failed: git {' '.join(args)}",
+                repo_path=str(repo_root),
+                git_error=_as_text(stderr),
+            )
+    except (RepositoryError, GeneratorExit):
         raise
+    except FileNotFoundError as e:
+        raise RepositoryError(
+            f"Git not found: {e}",
+            repo_path=str(repo_root),
+        ) from e
     except Exception as e:
         raise RepositoryError(
             f"Failed to parse git log: {e}",
@@ -346,7 +1061,7 @@ def git_log(repo_root: Path, limit: int = 20) -> List[dict]:
         ) from e
 
 
-def git_diff(repo_root: Path, from_ref: str, to_ref: Optional[str]) -> str:
+def git_diff(repo_root: Path, from_ref: str, to_ref: Optional[str]) -> bytes:
     """Get diff between two refs.
 
     Args:
@@ -355,7 +1070,7 @@ def git_diff(repo_root: Path, from_ref: str, to_ref: Optional[str]) -> str:
         to_ref: Target ref (None for working tree diff)
 
     Returns:
-        Diff output
+        Raw diff output; decode with ``errors="replace"`` where text is needed
 
     Raises:
         RepositoryError: If diff command fails
@@ -367,10 +1082,10 @@ def git_diff(repo_root: Path, from_ref: str, to_ref: Optional[str]) -> str:
         args = ["diff", f"{validated_from}..{validated_to}"]
     else:
         args = ["diff", validated_from]
-    return _run_git(args, repo_root).stdout
+    return _run_git_bytes(args, repo_root, read_only=True).stdout
 
 
-def git_show(repo_root: Path, ref: str, path: Optional[str]) -> str:
+def git_show(repo_root: Path, ref: str, path: Optional[str]) -> bytes:
     """Show file content at ref.
 
     Args:
@@ -379,7 +1094,7 @@ def git_show(repo_root: Path, ref: str, path: Optional[str]) -> str:
         path: Optional path to specific file
 
     Returns:
-        File content
+        Raw file content; decode with ``errors="replace"`` where text is needed
 
     Raises:
         RepositoryError: If show command fails
@@ -387,8 +1102,38 @@ def git_show(repo_root: Path, ref: str, path: Optional[str]) -> str:
     """
     validated_ref = Validators.validate_git_ref(ref)
     if path:
-        return _run_git(["show", f"{validated_ref}:{path}"], repo_root).stdout
-    return _run_git(["show", validated_ref], repo_root).stdout
+        spec = f"{validated_ref}:{path}"
+        if "\n" not in spec:
+            content = _show_blob(repo_root, spec)
+            if content is not None:
+                return content
+        return _run_git_bytes(["show", spec], repo_root, read_only=True).stdout
+    return _run_git_bytes(["show", validated_ref], repo_root, read_only=True).stdout
+
+
+def _show_blob(repo_root: Path, spec: str) -> Optional[bytes]:
+    """Read a blob through the repository's cat-file batch process.
+
+    Args:
+        repo_root: Git repository path
+        spec: Object name in ``<ref>:<path>`` form
+
+    Returns:
+        Raw blob content, or None if the object is not a blob (missing,
+        ambiguous, or a tree) and should go through ``git show`` instead
+
+    Raises:
+        RepositoryError: If the batch process fails
+    """
+    _, obj_type, data = _read_object(repo_root, spec)
+    if obj_type != "blob":
+        return None
+    _append_git_log(
+        repo_root,
+        ["cat-file", "--batch", spec],
+        subprocess.CompletedProcess(["git", "cat-file", "--batch"], 0, data, b""),
+    )
+    return data
 
 
 def git_reset(repo_root: Path, ref: str, mode: str) -> None:
@@ -405,4 +1150,6 @@ def git_reset(repo_root: Path, ref: str, mode: str) -> None:
     """
     validated_mode = Validators.validate_reset_mode(mode)
     validated_ref = Validators.validate_git_ref(ref)
+    if validated_mode == "hard":
+        _forget_repo(repo_root)
     _run_git(["reset", f"--{validated_mode}", validated_ref], repo_root)
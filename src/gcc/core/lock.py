@@ -1,28 +1,54 @@
 """File-based locking mechanism for GCC system.
 
-Provides cross-process locking using POSIX file locking semantics.
+Provides cross-process locking using kernel-managed file locks: POSIX
+``flock`` where available, ``msvcrt.locking`` on Windows.
 """
 from __future__ import annotations
 
 import os
+import random
 import time
 from contextlib import contextmanager
 from pathlib import Path
 
 from .exceptions import LockError
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - non-Windows platforms
+    msvcrt = None
+
+# Upper bound for the backoff between lock attempts
+MAX_POLL_S = 0.5
+
 
 @contextmanager
-def file_lock(lock_path: Path, timeout_s: float = 10.0, poll_s: float = 0.1):
+def file_lock(
+    lock_path: Path,
+    timeout_s: float = 10.0,
+    poll_s: float = 0.01,
+    shared: bool = False,
+):
     """Acquire a file-based lock.
 
-    Uses O_EXCL flag to create an exclusive lock file. This provides
-    cross-process locking on POSIX systems and basic locking on Windows.
+    On POSIX systems this is an advisory ``flock`` on the lock file, which
+    supports shared (reader) and exclusive (writer) modes and is released
+    by the kernel if the holder dies. On Windows a ``msvcrt`` byte-range
+    lock is used instead; it has no shared mode, so readers lock
+    exclusively there. Platforms with neither fall back to an exclusive
+    O_EXCL lock file.
 
     Args:
         lock_path: Path to the lock file
         timeout_s: Maximum time to wait for lock (default 10s)
-        poll_s: Time between lock attempts (default 0.1s)
+        poll_s: Initial time between lock attempts (default 0.01s); the
+            wait doubles after each miss up to MAX_POLL_S
+        shared: Take a shared lock that only excludes exclusive holders
 
     Yields:
         None when lock is acquired
@@ -31,24 +57,127 @@ def file_lock(lock_path: Path, timeout_s: float = 10.0, poll_s: float = 0.1):
         LockError: If lock cannot be acquired within timeout
         OSError: If lock file creation fails for other reasons
     """
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    start = time.time()
+    path = os.fspath(lock_path)
+    if fcntl is None and msvcrt is None:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with _exclusive_file_lock(path, timeout_s, poll_s):
+            yield
+        return
+
+    start = time.monotonic()
+    delay = poll_s
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+    except FileNotFoundError:
+        # Only the first lock in a fresh directory pays for the mkdir.
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        # Try to acquire lock
+        while not _try_lock(fd, shared):
+            if time.monotonic() - start > timeout_s:
+                raise LockError(
+                    f"Timed out waiting for lock after {timeout_s}s",
+                    lock_path=path,
+                )
+            delay = _backoff(delay)
+
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        # The lock file is kept: unlinking it would let a waiter lock a
+        # different inode than the next opener.
+        os.close(fd)
+
+
+def _backoff(delay: float) -> float:
+    """Sleep before the next lock attempt and return the following delay.
+
+    Short holds are picked up within a few milliseconds, long waits back
+    off to MAX_POLL_S, and the jitter keeps waiters from all retrying at
+    the same instant when the holder releases.
+
+    Args:
+        delay: Current delay in seconds
+
+    Returns:
+        Delay to use for the next attempt
+    """
+    time.sleep(delay + random.uniform(0, delay * 0.1))
+    return min(delay * 2, MAX_POLL_S)
+
+
+def _try_lock(fd: int, shared: bool) -> bool:
+    """Make one non-blocking attempt to lock ``fd``.
+
+    Args:
+        fd: Open descriptor of the lock file
+        shared: Request a shared lock (POSIX only)
+
+    Returns:
+        True if the lock was acquired, False if another holder has it
+    """
+    if fcntl is not None:
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    # msvcrt locks a byte range starting at the file position; always
+    # lock the first byte so every opener contends on the same range.
+    os.lseek(fd, 0, os.SEEK_SET)
+    try:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken by ``_try_lock``."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def _exclusive_file_lock(lock_path: str, timeout_s: float, poll_s: float):
+    """Acquire an exclusive lock by creating the lock file with O_EXCL.
+
+    Args:
+        lock_path: Path to the lock file
+        timeout_s: Maximum time to wait for lock
+        poll_s: Initial time between lock attempts
+
+    Yields:
+        None when lock is acquired
+
+    Raises:
+        LockError: If lock cannot be acquired within timeout
+    """
+    start = time.monotonic()
+    delay = poll_s
     fd = None
 
     # Try to acquire lock
     while True:
         try:
-            fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
             os.write(fd, str(os.getpid()).encode("utf-8"))
             break
         except FileExistsError:
             # Lock file exists, check if it's stale
-            if time.time() - start > timeout_s:
+            if time.monotonic() - start > timeout_s:
                 raise LockError(
                     f"Timed out waiting for lock after {timeout_s}s",
-                    lock_path=str(lock_path),
+                    lock_path=lock_path,
                 )
-            time.sleep(poll_s)
+            delay = _backoff(delay)
 
     try:
         yield
@@ -57,8 +186,7 @@ def file_lock(lock_path: Path, timeout_s: float = 10.0, poll_s: float = 0.1):
         try:
             if fd is not None:
                 os.close(fd)
-            if lock_path.exists():
-                lock_path.unlink()
+            os.unlink(lock_path)
         except OSError:
             # Best effort cleanup - don't raise if cleanup fails
             pass
@@ -5,21 +5,61 @@ including sessions, branches, commits, logs, and metadata.
 """
 from __future__ import annotations
 
+import copy
+import errno
+import functools
+import mmap
+import os
 import re
-import uuid
-from datetime import datetime, timezone
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
 from .exceptions import StorageError
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+# metadata.yaml keeps insertion order
+_dump_metadata = functools.partial(yaml.dump, Dumper=_YamlDumper, sort_keys=False)
+
 
 # Constants
 COMMIT_SEPARATOR = "=== Commit ==="
+_COMMIT_ID_RE = re.compile(r"^Commit ID:(.*)$", re.MULTILINE)
+_SESSION_ID_RE = re.compile(r"[A-Za-z0-9_-]+\Z")
 DEFAULT_SESSION = "default"
 
+# Parsed metadata.yaml files, keyed by path and validated by stat.
+MAX_METADATA_CACHE = 256
+
+# metadata.yaml of a new branch (keys sorted, as it has always been written)
+_INITIAL_METADATA = yaml.dump({"file_structure": {}, "env_config": {}}, Dumper=_YamlDumper)
+
+# Block size used when reading log.md backwards from the end
+LOG_TAIL_BLOCK = 8192
+_metadata_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+_metadata_cache_lock = threading.Lock()
+
+# Sessions whose directory structure this process has already ensured.
+_ensured: set = set()
+_ensured_lock = threading.Lock()
+
+# Bumped whenever this process creates a branch or finishes a locked
+# mutation, so cached branch listings are refreshed even if the directory
+# mtime didn't visibly change.
+_branches_version = 0
+
 
 def normalize_session_id(session_id: Optional[str]) -> str:
     """Normalize and validate session ID.
@@ -35,7 +75,7 @@ def normalize_session_id(session_id: Optional[str]) -> str:
     """
     if not session_id:
         return DEFAULT_SESSION
-    if not re.match(r"^[A-Za-z0-9_-]+$", session_id):
+    if not (session_id.isascii() and _SESSION_ID_RE.match(session_id)):
         raise StorageError(
             "session_id must be alphanumeric with optional '-' or '_' only",
             field="session_id",
@@ -50,11 +90,87 @@ def _now_iso() -> str:
     Returns:
         ISO 8601 formatted timestamp
     """
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 # Path helper functions
 
+@dataclass(frozen=True)
+class BranchPaths:
+    """Filesystem layout of one branch."""
+
+    root: Path
+    commit: Path
+    log: Path
+    metadata: Path
+
+
+@dataclass(frozen=True)
+class SessionContext:
+    """Filesystem layout of one session, computed once per (root, session)."""
+
+    root: Path
+    session: str
+    gcc_root: Path
+    session_root: Path
+    branches_root: Path
+    main_path: Path
+
+    def branch_paths(self, branch: str) -> BranchPaths:
+        """Get the file paths of a branch in this session.
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            Cached BranchPaths for the branch
+        """
+        return _branch_paths(self.branches_root, branch)
+
+
+@functools.lru_cache(maxsize=128)
+def session_context(root: Path, session_id: str) -> SessionContext:
+    """Get the cached path layout for a session.
+
+    Args:
+        root: Project root directory
+        session_id: Session identifier
+
+    Returns:
+        SessionContext for the session
+    """
+    g_root = root / ".GCC"
+    s_root = g_root / "sessions" / session_id
+    return SessionContext(
+        root=root,
+        session=session_id,
+        gcc_root=g_root,
+        session_root=s_root,
+        branches_root=s_root / "branches",
+        main_path=s_root / "main.md",
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _branch_paths(b_root: Path, branch: str) -> BranchPaths:
+    """Build the path layout of a branch.
+
+    Args:
+        b_root: Session branches directory
+        branch: Branch name
+
+    Returns:
+        BranchPaths for the branch
+    """
+    root = b_root / branch
+    return BranchPaths(
+        root=root,
+        commit=root / "commit.md",
+        log=root / "log.md",
+        metadata=root / "metadata.yaml",
+    )
+
+
 def gcc_root(root: Path) -> Path:
     """Get GCC root directory path.
 
@@ -77,7 +193,7 @@ def session_root(root: Path, session_id: str) -> Path:
     Returns:
         Path to session directory
     """
-    return gcc_root(root) / "sessions" / session_id
+    return session_context(root, session_id).session_root
 
 
 def branches_root(root: Path, session_id: str) -> Path:
@@ -90,7 +206,7 @@ def branches_root(root: Path, session_id: str) -> Path:
     Returns:
         Path to branches directory
     """
-    return session_root(root, session_id) / "branches"
+    return session_context(root, session_id).branches_root
 
 
 def branch_root(root: Path, session_id: str, branch: str) -> Path:
@@ -104,7 +220,7 @@ def branch_root(root: Path, session_id: str, branch: str) -> Path:
     Returns:
         Path to branch directory
     """
-    return branches_root(root, session_id) / branch
+    return session_context(root, session_id).branch_paths(branch).root
 
 
 def main_path(root: Path, session_id: str) -> Path:
@@ -117,7 +233,7 @@ def main_path(root: Path, session_id: str) -> Path:
     Returns:
         Path to main.md file
     """
-    return session_root(root, session_id) / "main.md"
+    return session_context(root, session_id).main_path
 
 
 def commit_path(root: Path, session_id: str, branch: str) -> Path:
@@ -131,7 +247,7 @@ def commit_path(root: Path, session_id: str, branch: str) -> Path:
     Returns:
         Path to commit.md file
     """
-    return branch_root(root, session_id, branch) / "commit.md"
+    return session_context(root, session_id).branch_paths(branch).commit
 
 
 def log_path(root: Path, session_id: str, branch: str) -> Path:
@@ -145,7 +261,7 @@ def log_path(root: Path, session_id: str, branch: str) -> Path:
     Returns:
         Path to log.md file
     """
-    return branch_root(root, session_id, branch) / "log.md"
+    return session_context(root, session_id).branch_paths(branch).log
 
 
 def metadata_path(root: Path, session_id: str, branch: str) -> Path:
@@ -159,15 +275,19 @@ def metadata_path(root: Path, session_id: str, branch: str) -> Path:
     Returns:
         Path to metadata.yaml file
     """
-    return branch_root(root, session_id, branch) / "metadata.yaml"
+    return session_context(root, session_id).branch_paths(branch).metadata
 
 
 # File I/O helper functions
 
 def _write_text(path: Path, content: str) -> None:
-    """Atomically write text to a file.
+    """Atomically and durably write text to a file.
 
-    Uses temp file + rename pattern to ensure atomic writes.
+    The content goes to a uniquely named temp file that is fsynced before
+    being renamed over the target, so a crash leaves either the old or
+    the new content and never a truncated file. The parent directory is
+    fsynced too when the file is new; an overwrite is already safe
+    without it, because the rename can only expose complete content.
 
     Args:
         path: Target file path
@@ -176,18 +296,102 @@ def _write_text(path: Path, content: str) -> None:
     Raises:
         StorageError: If write operation fails
     """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(content, encoding="utf-8")
-        tmp.replace(path)
+        target = str(path)
+        tmp = f"{target}.{os.urandom(8).hex()}.tmp"
+        existed = os.path.exists(target)
+        try:
+            try:
+                fd = os.open(tmp, flags, 0o644)
+            except FileNotFoundError:
+                # Only the first write into a new directory pays for mkdir.
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(tmp, flags, 0o644)
+            try:
+                data = memoryview(content.encode("utf-8"))
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        if not existed:
+            _fsync_dir(str(path.parent))
     except (IOError, OSError) as e:
         raise StorageError(f"Failed to write file: {e}", path=str(path), io_error=str(e))
+    finally:
+        # Inode numbers get reused, so a same-size rewrite within one
+        # mtime tick could otherwise match a stale parse.
+        _forget_parsed(path)
+
+
+def _fsync_dir(directory: str) -> None:
+    """Flush a directory entry change (create/rename) to disk.
+
+    Args:
+        directory: Directory path
+
+    Note:
+        A no-op where directories cannot be opened (Windows).
+    """
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:
+        return
+    dfd = os.open(directory, os.O_RDONLY | flags)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a UTF-8 text file in one read and one decode.
+
+    Equivalent to ``path.read_text(encoding="utf-8")``, including its
+    universal-newline translation, which only runs when the content
+    actually contains a carriage return.
+
+    Args:
+        path: File path
+
+    Returns:
+        File content
+
+    Raises:
+        OSError: If the file can't be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    with open(path, "rb") as handle:
+        text = handle.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _forget_parsed(path: Path) -> None:
+    """Drop any cached parse of a file.
+
+    Args:
+        path: File path
+    """
+    with _metadata_cache_lock:
+        _metadata_cache.pop(str(path), None)
 
 
 def _append_text(path: Path, content: str) -> None:
     """Append text to a file.
 
+    The encoded content goes out through an O_APPEND descriptor,
+    normally in a single write, so the cost is independent of the
+    file's current size.
+
     Args:
         path: Target file path
         content: Content to append
@@ -195,12 +399,370 @@ def _append_text(path: Path, content: str) -> None:
     Raises:
         StorageError: If append operation fails
     """
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        data = memoryview(content.encode("utf-8"))
+        try:
+            fd = os.open(str(path), flags, 0o644)
+        except FileNotFoundError:
+            # Branch directories normally exist; create them only on demand.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(str(path), flags, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+    except (IOError, OSError) as e:
+        raise StorageError(f"Failed to append to file: {e}", path=str(path), io_error=str(e))
+
+
+_write_pool_lock = threading.Lock()
+_write_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _write_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool used to flush staged writes.
+
+    Returns:
+        Lazily created executor
+    """
+    global _write_executor
+    if _write_executor is None:
+        with _write_pool_lock:
+            if _write_executor is None:
+                _write_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gcc-write")
+    return _write_executor
+
+
+class StagedWrite:
+    """Collect file mutations in memory and write each file once.
+
+    Used as a context manager around a multi-file update: reads made
+    through read_text see earlier staged changes, and on a clean exit
+    every touched file is written exactly once. Files that were only
+    appended to are flushed as a single append; anything else is
+    rewritten atomically with _write_text, unless the new content is
+    identical to what was read from disk, in which case the write is
+    skipped entirely.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty staging area."""
+        self._disk: Dict[Path, Optional[str]] = {}
+        self._contents: Dict[Path, str] = {}
+        # Each pending append is either text or a source file to copy.
+        self._appends: Dict[Path, List[Union[str, Path]]] = {}
+        self._order: Dict[Path, None] = {}
+        # Parsed form of a staged replacement, primed into the metadata
+        # cache once the file is written.
+        self._parsed: Dict[Path, Any] = {}
+
+    def __enter__(self) -> "StagedWrite":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def pending(self, path: Path) -> bool:
+        """Check whether a path has staged changes.
+
+        Args:
+            path: File path
+
+        Returns:
+            True if the path was written or appended to
+        """
+        return path in self._order
+
+    @property
+    def paths(self) -> List[Path]:
+        """Paths touched so far, in first-touch order."""
+        return list(self._order)
+
+    def read_text(self, path: Path) -> Optional[str]:
+        """Read a file as it will look once staged changes are written.
+
+        Args:
+            path: File path
+
+        Returns:
+            File content, or None if the file doesn't exist and nothing
+            has been staged for it
+
+        Raises:
+            StorageError: If read operation fails
+        """
+        if path in self._contents:
+            content = self._contents[path]
+        else:
+            content = self._read_disk(path)
+            if content is None:
+                if path not in self._appends:
+                    return None
+                content = ""
+        return content + self._appended_text(path)
+
+    def _appended_text(self, path: Path) -> str:
+        """Render the pending appends of a path as text.
+
+        Args:
+            path: File path
+
+        Returns:
+            Concatenated pending appends, with source files read in
+
+        Raises:
+            StorageError: If a source file can't be read
+        """
+        chunks = []
+        for part in self._appends.get(path, ()):
+            if isinstance(part, Path):
+                try:
+                    part = _read_utf8(part)
+                except (IOError, OSError, ValueError) as e:
+                    raise StorageError(f"Failed to read file: {e}", path=str(part), io_error=str(e))
+            chunks.append(part)
+        return "".join(chunks)
+
+    def _read_disk(self, path: Path) -> Optional[str]:
+        """Read a file from disk once per staging area.
+
+        Args:
+            path: File path
+
+        Returns:
+            File content, or None if the file doesn't exist
+
+        Raises:
+            StorageError: If read operation fails
+        """
+        if path not in self._disk:
+            try:
+                self._disk[path] = _read_utf8(path)
+            except FileNotFoundError:
+                self._disk[path] = None
+            except (IOError, OSError) as e:
+                raise StorageError(f"Failed to read file: {e}", path=str(path), io_error=str(e))
+        return self._disk[path]
+
+    def write_text(self, path: Path, content: str, parsed: Any = None) -> None:
+        """Stage a full replacement of a file.
+
+        Args:
+            path: Target file path
+            content: New file content
+            parsed: Data that ``content`` parses to, if it is a metadata
+                file; lets the next read skip parsing it again
+        """
+        self._contents[path] = content
+        self._appends.pop(path, None)
+        if parsed is not None:
+            self._parsed[path] = parsed
+        else:
+            self._parsed.pop(path, None)
+        self._order[path] = None
+
+    def append_text(self, path: Path, content: str) -> None:
+        """Stage text to append to a file.
+
+        Args:
+            path: Target file path
+            content: Content to append
+        """
+        self._appends.setdefault(path, []).append(content)
+        self._parsed.pop(path, None)
+        self._order[path] = None
+
+    def append_file(self, path: Path, source: Path) -> None:
+        """Stage the contents of another file to append to a file.
+
+        The bytes are copied at flush time without passing through Python
+        where the platform allows it.
+
+        Args:
+            path: Target file path
+            source: File whose contents are appended
+        """
+        self._appends.setdefault(path, []).append(source)
+        self._parsed.pop(path, None)
+        self._order[path] = None
+
+    def _flush_path(self, path: Path) -> None:
+        """Write the staged changes of one path.
+
+        Args:
+            path: File path
+
+        Raises:
+            StorageError: If the write fails
+        """
+        parts = self._appends.get(path, ())
+        if path in self._contents:
+            content = self._contents[path] + self._appended_text(path)
+            if path not in self._disk or self._disk[path] != content:
+                _write_text(path, content)
+            if path in self._parsed:
+                _prime_metadata(path, self._parsed[path])
+        elif any(isinstance(part, Path) for part in parts):
+            _append_parts(path, parts)
+        elif parts:
+            _append_text(path, "".join(parts))
+
+    def flush(self) -> None:
+        """Write all staged changes to disk.
+
+        Two or more files are written concurrently on a shared thread
+        pool; the first failure, in staging order, is re-raised once
+        every write has finished.
+
+        Raises:
+            StorageError: If a write fails
+        """
+        paths = list(self._order)
+        if len(paths) >= 2:
+            # Files are disjoint, and the writes release the GIL.
+            futures = [_write_pool().submit(self._flush_path, path) for path in paths]
+            # Let every write finish before raising, so none is still
+            # running once the caller drops the session lock.
+            wait(futures)
+            for future in futures:
+                future.result()
+        else:
+            for path in paths:
+                self._flush_path(path)
+        self._disk.clear()
+        self._contents.clear()
+        self._appends.clear()
+        self._parsed.clear()
+        self._order.clear()
+
+
+def _append_parts(path: Path, parts: List[Union[str, Path]]) -> None:
+    """Append text and whole-file copies to a file in order.
+
+    File parts are copied with os.copy_file_range where available, so
+    their bytes stay in the kernel (and may be reflinked on filesystems
+    that support it). Otherwise they fall back to a read/write loop.
+
+    Args:
+        path: Target file path
+        parts: Text chunks and source file paths
+
+    Raises:
+        StorageError: If a source can't be read or the target written
+    """
+    sources: Dict[Path, int] = {}
+    sizes: Dict[Path, int] = {}
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(content)
+        # Open every source first so a missing one fails before the
+        # target is touched. Sizes are taken now, before anything is
+        # written: a source may be the target itself (merging a branch
+        # into itself), and only its original bytes are copied.
+        for part in parts:
+            if isinstance(part, Path) and part not in sources:
+                sources[part] = os.open(str(part), os.O_RDONLY)
+                sizes[part] = os.fstat(sources[part]).st_size
+        # copy_file_range rejects O_APPEND targets, so seek to the end of
+        # a plain descriptor instead; callers hold the session lock.
+        try:
+            fd = os.open(str(path), os.O_WRONLY | os.O_CREAT, 0o644)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(str(path), os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.lseek(fd, 0, os.SEEK_END)
+            for part in parts:
+                if isinstance(part, Path):
+                    src = sources[part]
+                    os.lseek(src, 0, os.SEEK_SET)
+                    _copy_fd(src, fd, sizes[part])
+                else:
+                    data = memoryview(part.encode("utf-8"))
+                    while data:
+                        data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     except (IOError, OSError) as e:
         raise StorageError(f"Failed to append to file: {e}", path=str(path), io_error=str(e))
+    finally:
+        for src in sources.values():
+            os.close(src)
+
+
+def _copy_fd(src: int, dst: int, count: int) -> None:
+    """Copy bytes from one descriptor to another.
+
+    Args:
+        src: Source descriptor, read from its current offset
+        dst: Destination descriptor, written at its current offset
+        count: Number of bytes to copy; fewer are copied only if the
+            source ends first
+
+    Raises:
+        OSError: If the copy fails
+    """
+    remaining = count
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while remaining > 0:
+                copied = copy_file_range(src, dst, remaining)
+                if copied == 0:
+                    return
+                remaining -= copied
+            return
+        except OSError as e:
+            # Cross-device copies on old kernels and filesystems without
+            # support fail outright; finish with plain reads and writes.
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    while remaining > 0:
+        chunk = os.read(src, min(remaining, 1 << 20))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        data = memoryview(chunk)
+        while data:
+            data = data[os.write(dst, data):]
+
+
+def _stage_write(
+    path: Path,
+    content: str,
+    staged: Optional[StagedWrite],
+    parsed: Any = None,
+) -> None:
+    """Replace a file now, or stage the replacement.
+
+    Args:
+        path: Target file path
+        content: New file content
+        staged: Staging area, or None to write immediately
+        parsed: Data that ``content`` parses to, primed into the metadata
+            cache after the write
+    """
+    if staged is not None:
+        staged.write_text(path, content, parsed)
+        return
+    _write_text(path, content)
+    if parsed is not None:
+        _prime_metadata(path, parsed)
+
+
+def _stage_append(path: Path, content: str, staged: Optional[StagedWrite]) -> None:
+    """Append to a file now, or stage the append.
+
+    Args:
+        path: Target file path
+        content: Content to append
+        staged: Staging area, or None to write immediately
+    """
+    if staged is not None:
+        staged.append_text(path, content)
+    else:
+        _append_text(path, content)
 
 
 # Directory structure management
@@ -219,19 +781,37 @@ def ensure_gcc(root: Path, goal: Optional[str], todo: Optional[List[str]], sessi
     Raises:
         StorageError: If directory creation fails
     """
-    try:
-        gcc_root(root).mkdir(parents=True, exist_ok=True)
-        session_root(root, session_id).mkdir(parents=True, exist_ok=True)
-        branches_root(root, session_id).mkdir(parents=True, exist_ok=True)
-        if not main_path(root, session_id).exists():
-            lines = ["# GCC Roadmap", "", "## Goal", goal or "(unset)", "", "## Todo"]
-            if todo:
-                lines.extend([f"- {item}" for item in todo])
-            else:
-                lines.append("- (none)")
-            _write_text(main_path(root, session_id), "\n".join(lines) + "\n")
-    except OSError as e:
-        raise StorageError(f"Failed to create GCC directories: {e}", io_error=str(e))
+    key = (str(root), session_id)
+    if key in _ensured:
+        return
+    with _ensured_lock:
+        if key in _ensured:
+            return
+        try:
+            gcc_root(root).mkdir(parents=True, exist_ok=True)
+            session_root(root, session_id).mkdir(parents=True, exist_ok=True)
+            branches_root(root, session_id).mkdir(parents=True, exist_ok=True)
+            if not main_path(root, session_id).exists():
+                lines = ["# GCC Roadmap", "", "## Goal", goal or "(unset)", "", "## Todo"]
+                if todo:
+                    lines.extend([f"- {item}" for item in todo])
+                else:
+                    lines.append("- (none)")
+                _write_text(main_path(root, session_id), "\n".join(lines) + "\n")
+        except OSError as e:
+            raise StorageError(f"Failed to create GCC directories: {e}", io_error=str(e))
+        _ensured.add(key)
+
+
+def forget_ensured(root: Path, session_id: str) -> None:
+    """Make the next ensure_gcc call re-check a session's structure.
+
+    Args:
+        root: Project root directory
+        session_id: Session identifier
+    """
+    with _ensured_lock:
+        _ensured.discard((str(root), session_id))
 
 
 def ensure_branch(root: Path, session_id: str, branch: str, purpose: str) -> None:
@@ -248,22 +828,45 @@ def ensure_branch(root: Path, session_id: str, branch: str, purpose: str) -> Non
     Raises:
         StorageError: If directory creation fails
     """
+    paths = session_context(root, session_id).branch_paths(branch)
     try:
-        b_root = branch_root(root, session_id, branch)
-        b_root.mkdir(parents=True, exist_ok=True)
-        if not commit_path(root, session_id, branch).exists():
+        paths.root.mkdir(parents=True, exist_ok=True)
+        invalidate_branch_cache()
+        if not paths.commit.exists():
             header = [f"# Branch: {branch}", f"# Purpose: {purpose}", ""]
-            _write_text(commit_path(root, session_id, branch), "\n".join(header) + "\n")
-        log_path(root, session_id, branch).touch(exist_ok=True)
-        if not metadata_path(root, session_id, branch).exists():
+            _write_text(paths.commit, "\n".join(header) + "\n")
+        paths.log.touch(exist_ok=True)
+        if not paths.metadata.exists():
             _write_text(
-                metadata_path(root, session_id, branch),
-                yaml.safe_dump({"file_structure": {}, "env_config": {}}),
+                paths.metadata,
+                _INITIAL_METADATA,
             )
     except OSError as e:
         raise StorageError(f"Failed to create branch directories: {e}", branch=branch, io_error=str(e))
 
 
+def branch_exists(root: Path, session_id: str, branch: str) -> bool:
+    """Check whether a branch exists without listing all branches.
+
+    Args:
+        root: Project root directory
+        session_id: Session identifier
+        branch: Branch name
+
+    Returns:
+        True if the branch directory exists
+    """
+    if not branch or branch in (".", "..") or "/" in branch or os.sep in branch:
+        return False
+    return os.path.isdir(branch_root(root, session_id, branch))
+
+
+def invalidate_branch_cache() -> None:
+    """Force the next list_branches call to rescan the directory."""
+    global _branches_version
+    _branches_version += 1
+
+
 def list_branches(root: Path, session_id: str) -> List[str]:
     """List all branches for a session.
 
@@ -274,19 +877,45 @@ def list_branches(root: Path, session_id: str) -> List[str]:
     Returns:
         Sorted list of branch names
     """
-    if not branches_root(root, session_id).exists():
+    b_root = branches_root(root, session_id)
+    try:
+        mtime_ns = b_root.stat().st_mtime_ns
+        return list(_scan_branches(str(b_root), mtime_ns, _branches_version))
+    except FileNotFoundError:
         return []
-    return sorted([p.name for p in branches_root(root, session_id).iterdir() if p.is_dir()])
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_branches(b_root: str, mtime_ns: int, version: int) -> Tuple[str, ...]:
+    """Scan a branches directory.
+
+    Cached on the directory mtime and the in-process branch version, so
+    repeated listings cost a single stat until a branch is added or
+    removed.
+
+    Args:
+        b_root: Branches directory path
+        mtime_ns: Directory modification time in nanoseconds
+        version: Value of _branches_version at call time
+
+    Returns:
+        Sorted tuple of branch names
+    """
+    # DirEntry.is_dir() answers from the directory read itself on most
+    # filesystems, so there is no stat or Path object per branch.
+    with os.scandir(b_root) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
 
 
 # Main file operations
 
-def read_main(root: Path, session_id: str) -> str:
+def read_main(root: Path, session_id: str, staged: Optional[StagedWrite] = None) -> str:
     """Read main.md content.
 
     Args:
         root: Project root directory
         session_id: Session identifier
+        staged: Optional staging area whose pending changes are included
 
     Returns:
         Content of main.md, or empty string if not exists
@@ -294,36 +923,81 @@ def read_main(root: Path, session_id: str) -> str:
     Raises:
         StorageError: If read operation fails
     """
-    if not main_path(root, session_id).exists():
-        return ""
+    path = main_path(root, session_id)
+    if staged is not None:
+        return staged.read_text(path) or ""
     try:
-        return main_path(root, session_id).read_text(encoding="utf-8")
+        return _read_utf8(path)
+    except FileNotFoundError:
+        return ""
     except (IOError, OSError) as e:
-        raise StorageError(f"Failed to read main.md: {e}", path=str(main_path(root, session_id)), io_error=str(e))
+        raise StorageError(f"Failed to read main.md: {e}", path=str(path), io_error=str(e))
 
 
-def update_main(root: Path, session_id: str, update_text: str) -> None:
+def update_main(
+    root: Path,
+    session_id: str,
+    update_text: str,
+    staged: Optional[StagedWrite] = None,
+) -> None:
     """Update main.md with new content.
 
     Args:
         root: Project root directory
         session_id: Session identifier
         update_text: Text to append
+        staged: Optional staging area to defer the write to
 
     Raises:
         StorageError: If write operation fails
     """
-    content = read_main(root, session_id)
+    path = main_path(root, session_id)
+    if (staged is None or not staged.pending(path)) and _ends_with_single_newline(path):
+        # rstrip() + "\n\n" would only re-add the final newline, so the
+        # update is a plain append and the rest of the file is untouched.
+        _stage_append(path, "\n" + update_text.strip() + "\n", staged)
+        return
+    content = read_main(root, session_id, staged)
     if content:
         content = content.rstrip() + "\n\n" + update_text.strip() + "\n"
     else:
         content = update_text.strip() + "\n"
-    _write_text(main_path(root, session_id), content)
+    _stage_write(path, content, staged)
+
+
+def _ends_with_single_newline(path: Path) -> bool:
+    """Check whether a file ends in one newline after visible text.
+
+    Only the last two bytes are read. Anything else (empty, missing,
+    trailing blank lines or spaces, non-ASCII before the newline) returns
+    False so callers take the exact rstrip() path.
+
+    Args:
+        path: File path
+
+    Returns:
+        True if the file ends with a printable ASCII character and a newline
+    """
+    try:
+        with open(path, "rb") as handle:
+            if handle.seek(0, os.SEEK_END) < 2:
+                return False
+            handle.seek(-2, os.SEEK_END)
+            last = handle.read(2)
+    except OSError:
+        return False
+    return last[1:] == b"\n" and 0x21 <= last[0] <= 0x7E
 
 
 # Log operations
 
-def append_log(root: Path, session_id: str, branch: str, entries: List[str]) -> None:
+def append_log(
+    root: Path,
+    session_id: str,
+    branch: str,
+    entries: List[str],
+    staged: Optional[StagedWrite] = None,
+) -> None:
     """Append log entries to branch log.
 
     Args:
@@ -331,15 +1005,15 @@ def append_log(root: Path, session_id: str, branch: str, entries: List[str]) ->
         session_id: Session identifier
         branch: Branch name
         entries: List of log entry strings
+        staged: Optional staging area to defer the write to
 
     Raises:
         StorageError: If append operation fails
     """
     if not entries:
         return
-    timestamp = _now_iso()
-    block = [f"[{timestamp}]"] + [f"- {item}" for item in entries] + [""]
-    _append_text(log_path(root, session_id, branch), "\n".join(block))
+    block = f"[{_now_iso()}]\n" + "".join([f"- {item}\n" for item in entries])
+    _stage_append(log_path(root, session_id, branch), block, staged)
 
 
 def read_log_tail(root: Path, session_id: str, branch: str, tail: int) -> List[str]:
@@ -357,15 +1031,28 @@ def read_log_tail(root: Path, session_id: str, branch: str, tail: int) -> List[s
     Raises:
         StorageError: If read operation fails
     """
-    if not log_path(root, session_id, branch).exists():
+    path = log_path(root, session_id, branch)
+    if tail <= 0:
         return []
     try:
-        lines = log_path(root, session_id, branch).read_text(encoding="utf-8").splitlines()
-        if tail <= 0:
-            return []
-        return lines[-tail:]
+        with path.open("rb") as handle:
+            # Read backwards in blocks until the buffer holds more than
+            # `tail` newlines, so only the end of a long log is touched.
+            pos = handle.seek(0, os.SEEK_END)
+            buffer = b""
+            while pos > 0 and buffer.count(b"\n") <= tail:
+                step = min(LOG_TAIL_BLOCK, pos)
+                pos -= step
+                handle.seek(pos)
+                buffer = handle.read(step) + buffer
+        if pos > 0:
+            # Drop the partial line in front of the first newline.
+            buffer = buffer[buffer.index(b"\n") + 1:]
+        return buffer.decode("utf-8").splitlines()[-tail:]
+    except FileNotFoundError:
+        return []
     except (IOError, OSError) as e:
-        raise StorageError(f"Failed to read log.md: {e}", path=str(log_path(root, session_id, branch)), io_error=str(e))
+        raise StorageError(f"Failed to read log.md: {e}", path=str(path), io_error=str(e))
 
 
 # Commit operations
@@ -406,6 +1093,117 @@ def _parse_commits(text: str) -> List[Dict[str, str]]:
     return commits
 
 
+def _commit_ids(text: str) -> List[Optional[str]]:
+    """Extract commit IDs from commit.md text without parsing bodies.
+
+    Gives the same IDs, in order, as the commit_id fields of
+    _parse_commits (None for an entry without one).
+
+    Args:
+        text: Content of commit.md, or a tail of it
+
+    Returns:
+        List of commit IDs
+    """
+    ids: List[Optional[str]] = []
+    for part in text.split(COMMIT_SEPARATOR)[1:]:
+        found = None
+        for match in _COMMIT_ID_RE.finditer(part):
+            found = match.group(1).strip()
+        ids.append(found)
+    return ids
+
+
+def _parse_last_commit(text: str) -> Dict[str, str]:
+    """Parse only the final commit entry of commit.md text.
+
+    Args:
+        text: Content of commit.md, or a tail of it
+
+    Returns:
+        Last commit entry dictionary, or empty dict if there is none
+    """
+    start = text.rfind(COMMIT_SEPARATOR)
+    if start < 0:
+        return {}
+    commits = _parse_commits(text[start:])
+    return commits[-1] if commits else {}
+
+
+def read_commits_tail(root: Path, session_id: str, branch: str, count: int) -> str:
+    """Read the text of the last N commit entries of a branch.
+
+    Maps commit.md and scans backwards for separators, so only the tail
+    of a long history is decoded. Parsing the result with _parse_commits
+    gives the same entries as the last N of the full file.
+
+    Args:
+        root: Project root directory
+        session_id: Session identifier
+        branch: Branch name
+        count: Number of trailing commits to include
+
+    Returns:
+        Text from the Nth-last separator to end of file, or empty string
+        if the branch has no commits
+
+    Raises:
+        StorageError: If read operation fails
+    """
+    path = commit_path(root, session_id, branch)
+    if count <= 0:
+        return ""
+    separator = COMMIT_SEPARATOR.encode("utf-8")
+    try:
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                start = -1
+                end = len(mapped)
+                for _ in range(count):
+                    found = mapped.rfind(separator, 0, end)
+                    if found < 0:
+                        break
+                    start = end = found
+                if start < 0:
+                    return ""
+                return mapped[start:].decode("utf-8")
+    except FileNotFoundError:
+        return ""
+    except (IOError, OSError, ValueError) as e:
+        raise StorageError(f"Failed to read commit.md: {e}", path=str(path), io_error=str(e))
+
+
+
+def summarize_commits_tail(tail_text: str, commit_id: Optional[str] = None) -> Dict[str, Any]:
+    """Summarize the commit entries returned by read_commits_tail.
+
+    Only the newest entry has its body parsed; the others contribute
+    their IDs.
+
+    Args:
+        tail_text: Text from read_commits_tail
+        commit_id: Optional commit ID to look up among the entries
+
+    Returns:
+        Dictionary with latest_commit, latest_summary and recent_commits,
+        plus commit_entry: the entry whose only ID is ``commit_id``, or
+        None if commit_id is not given or the tail has no such entry
+    """
+    last_commit = _parse_last_commit(tail_text)
+    entry = None
+    if commit_id:
+        entry = _find_commit_entry(tail_text, commit_id)
+        if entry is not None and _commit_ids(entry) != [commit_id]:
+            entry = None
+    return {
+        "latest_commit": last_commit.get("commit_id"),
+        "latest_summary": last_commit.get("This Commit's Contribution"),
+        "recent_commits": _commit_ids(tail_text),
+        "commit_entry": entry,
+    }
+
 def get_branch_purpose(root: Path, session_id: str, branch: str) -> str:
     """Extract branch purpose from commit.md header.
 
@@ -420,16 +1218,46 @@ def get_branch_purpose(root: Path, session_id: str, branch: str) -> str:
     Raises:
         StorageError: If read operation fails
     """
-    if not commit_path(root, session_id, branch).exists():
-        return ""
+    path = commit_path(root, session_id, branch)
     try:
-        text = commit_path(root, session_id, branch).read_text(encoding="utf-8")
-        for line in text.splitlines():
-            if line.startswith("# Purpose:"):
-                return line.split(":", 1)[1].strip()
+        # The header is at the top; stop reading as soon as it's found.
+        with path.open(encoding="utf-8", newline="") as handle:
+            for line in handle:
+                if line.startswith("# Purpose:"):
+                    return line.split(":", 1)[1].strip()
+        return ""
+    except FileNotFoundError:
         return ""
     except (IOError, OSError) as e:
-        raise StorageError(f"Failed to read commit.md: {e}", path=str(commit_path(root, session_id, branch)), io_error=str(e))
+        raise StorageError(f"Failed to read commit.md: {e}", path=str(path), io_error=str(e))
+
+
+def _find_commit_entry(text: str, commit_id: str) -> Optional[str]:
+    """Find the first commit entry in text that mentions a commit ID.
+
+    Args:
+        text: Content of commit.md, or a tail of it
+        commit_id: Commit ID to find
+
+    Returns:
+        Commit entry text including its separator, or None if not found
+    """
+    needle = f"Commit ID: {commit_id}"
+    pos = 0
+    while True:
+        idx = text.find(needle, pos)
+        if idx < 0:
+            return None
+        # Slice out only the entry around the match instead of splitting
+        # the whole file; text before the first separator is not an entry.
+        start = text.rfind(COMMIT_SEPARATOR, 0, idx)
+        if start >= 0:
+            end = text.find(COMMIT_SEPARATOR, start + len(COMMIT_SEPARATOR))
+            if end < 0:
+                return text[start:]
+            if end >= idx + len(needle):
+                return text[start:end]
+        pos = idx + 1
 
 
 def get_commit_entry(root: Path, session_id: str, branch: str, commit_id: str) -> Optional[str]:
@@ -447,19 +1275,14 @@ def get_commit_entry(root: Path, session_id: str, branch: str, commit_id: str) -
     Raises:
         StorageError: If read operation fails
     """
-    if not commit_path(root, session_id, branch).exists():
-        return None
+    path = commit_path(root, session_id, branch)
     try:
-        text = commit_path(root, session_id, branch).read_text(encoding="utf-8")
-        if COMMIT_SEPARATOR not in text:
-            return None
-        parts = text.split(COMMIT_SEPARATOR)
-        for part in parts[1:]:
-            if f"Commit ID: {commit_id}" in part:
-                return COMMIT_SEPARATOR + part
+        text = _read_utf8(path)
+    except FileNotFoundError:
         return None
     except (IOError, OSError) as e:
-        raise StorageError(f"Failed to read commit.md: {e}", path=str(commit_path(root, session_id, branch)), io_error=str(e))
+        raise StorageError(f"Failed to read commit.md: {e}", path=str(path), io_error=str(e))
+    return _find_commit_entry(text, commit_id)
 
 
 def append_commit(
@@ -468,6 +1291,7 @@ def append_commit(
     branch: str,
     purpose: str,
     contribution: str,
+    staged: Optional[StagedWrite] = None,
 ) -> str:
     """Append a new commit entry to branch.
 
@@ -477,6 +1301,7 @@ def append_commit(
         branch: Branch name
         purpose: Branch purpose
         contribution: Commit contribution text
+        staged: Optional staging area to defer the write to
 
     Returns:
         New commit ID
@@ -484,16 +1309,25 @@ def append_commit(
     Raises:
         StorageError: If read/write operations fail
     """
-    commit_id = uuid.uuid4().hex[:8]
+    commit_id = os.urandom(4).hex()
+    path = commit_path(root, session_id, branch)
     try:
-        existing = commit_path(root, session_id, branch).read_text(encoding="utf-8")
+        if staged is not None:
+            existing = staged.read_text(path)
+            if existing is None:
+                raise FileNotFoundError(f"No such file: {path}")
+        elif not path.exists():
+            raise FileNotFoundError(f"No such file: {path}")
+        else:
+            # Only the previous entry feeds the summary.
+            existing = read_commits_tail(root, session_id, branch, 1)
     except (IOError, OSError) as e:
-        raise StorageError(f"Failed to read commit.md: {e}", path=str(commit_path(root, session_id, branch)), io_error=str(e))
+        raise StorageError(f"Failed to read commit.md: {e}", path=str(path), io_error=str(e))
 
-    commits = _parse_commits(existing)
-    if commits:
-        prev_summary = commits[-1].get("Previous Progress Summary", "")
-        last_contrib = commits[-1].get("This Commit's Contribution", "")
+    last_commit = _parse_last_commit(existing)
+    if last_commit:
+        prev_summary = last_commit.get("Previous Progress Summary", "")
+        last_contrib = last_commit.get("This Commit's Contribution", "")
         combined = "\n".join([line for line in [prev_summary, last_contrib] if line]).strip()
     else:
         combined = ""
@@ -511,19 +1345,85 @@ def append_commit(
         contribution,
         "",
     ]
-    _append_text(commit_path(root, session_id, branch), "\n".join(entry_lines))
+    _stage_append(path, "\n".join(entry_lines), staged)
     return commit_id
 
 
 # Metadata operations
 
-def read_metadata(root: Path, session_id: str, branch: str) -> Dict[str, Any]:
+def _load_metadata(path: Path) -> Any:
+    """Parse a metadata file, reusing the last parse if it is unchanged.
+
+    Entries are keyed on inode, mtime and size, so edits from other
+    processes are picked up; writes from this process drop the entry in
+    _write_text, and update_metadata then primes it with what it wrote.
+
+    Args:
+        path: metadata.yaml path
+
+    Returns:
+        Parsed YAML data (shared; copy before mutating), or None if the
+        file doesn't exist
+
+    Raises:
+        yaml.YAMLError: If the file can't be parsed
+        OSError: If the file can't be read
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = str(path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    # The loader decodes UTF-8 bytes itself and treats CRLF as a break.
+    with open(path, "rb") as handle:
+        data = yaml.load(handle.read(), Loader=_YamlLoader)
+    with _metadata_cache_lock:
+        _metadata_cache.pop(key, None)
+        _metadata_cache[key] = (stamp, data)
+        while len(_metadata_cache) > MAX_METADATA_CACHE:
+            _metadata_cache.pop(next(iter(_metadata_cache)))
+    return data
+
+
+def _prime_metadata(path: Path, data: Any) -> None:
+    """Seed the metadata cache with data this process just wrote.
+
+    Args:
+        path: metadata.yaml path, already written
+        data: Data the file was dumped from
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    data = copy.deepcopy(data)
+    key = str(path)
+    with _metadata_cache_lock:
+        _metadata_cache.pop(key, None)
+        _metadata_cache[key] = (stamp, data)
+        while len(_metadata_cache) > MAX_METADATA_CACHE:
+            _metadata_cache.pop(next(iter(_metadata_cache)))
+
+
+def read_metadata(
+    root: Path,
+    session_id: str,
+    branch: str,
+    staged: Optional[StagedWrite] = None,
+) -> Dict[str, Any]:
     """Read branch metadata.
 
     Args:
         root: Project root directory
         session_id: Session identifier
         branch: Branch name
+        staged: Optional staging area whose pending changes are included
 
     Returns:
         Metadata dictionary
@@ -531,16 +1431,32 @@ def read_metadata(root: Path, session_id: str, branch: str) -> Dict[str, Any]:
     Raises:
         StorageError: If read/parse operations fail
     """
-    if not metadata_path(root, session_id, branch).exists():
-        return {}
+    path = metadata_path(root, session_id, branch)
     try:
-        data = yaml.safe_load(metadata_path(root, session_id, branch).read_text(encoding="utf-8"))
+        if staged is not None:
+            text = staged.read_text(path)
+            if text is None:
+                return {}
+            data = yaml.load(text, Loader=_YamlLoader)
+        else:
+            data = _load_metadata(path)
+            if data is None:
+                return {}
+            # Callers mutate the result; never hand out the cached object.
+            data = copy.deepcopy(data)
         return data or {}
     except (yaml.YAMLError, IOError, OSError) as e:
-        raise StorageError(f"Failed to read metadata.yaml: {e}", path=str(metadata_path(root, session_id, branch)), io_error=str(e))
+        raise StorageError(f"Failed to read metadata.yaml: {e}", path=str(path), io_error=str(e))
 
 
-def update_metadata(root: Path, session_id: str, branch: str, updates: Dict[str, Any]) -> None:
+def update_metadata(
+    root: Path,
+    session_id: str,
+    branch: str,
+    updates: Dict[str, Any],
+    staged: Optional[StagedWrite] = None,
+    current: Optional[Dict[str, Any]] = None,
+) -> None:
     """Update branch metadata.
 
     Args:
@@ -548,17 +1464,30 @@ def update_metadata(root: Path, session_id: str, branch: str, updates: Dict[str,
         session_id: Session identifier
         branch: Branch name
         updates: Dictionary of metadata updates
+        staged: Optional staging area to defer the write to
+        current: Already-read metadata to update instead of re-reading it
 
     Raises:
         StorageError: If read/write/parse operations fail
     """
-    data = read_metadata(root, session_id, branch)
+    data = current if current is not None else read_metadata(root, session_id, branch, staged)
     for key, value in updates.items():
         if value is None:
             data.pop(key, None)
         else:
             data[key] = value
-    _write_text(metadata_path(root, session_id, branch), yaml.safe_dump(data, sort_keys=False))
+    path = metadata_path(root, session_id, branch)
+    content = _dump_metadata(data)
+    if staged is None or not staged.pending(path):
+        # Idempotent updates (re-setting the same values) skip the whole
+        # tmp/fsync/rename cycle when the file already holds this output.
+        try:
+            with open(path, "rb") as handle:
+                if handle.read() == content.encode("utf-8"):
+                    return
+        except OSError:
+            pass
+    _stage_write(path, content, staged, parsed=data)
 
 
 # Locking
@@ -584,4 +1513,37 @@ def with_lock(root: Path, session_id: str, func, *args, **kwargs):
 
     lock_path = session_root(root, session_id) / ".lock"
     with file_lock(lock_path):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Checkouts, merges and resets can add or remove branch
+            # directories behind storage's back.
+            invalidate_branch_cache()
+
+
+def with_read_lock(root: Path, session_id: str, func, *args, **kwargs):
+    """Execute function with a shared session lock held.
+
+    Readers holding the shared lock run concurrently with each other and
+    only wait for (and block) holders of the exclusive lock taken by
+    with_lock.
+
+    Args:
+        root: Project root directory
+        session_id: Session identifier
+        func: Function to execute
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+
+    Raises:
+        LockError: If lock acquisition fails
+        StorageError: If file operations fail
+    """
+    from .lock import file_lock
+
+    lock_path = session_root(root, session_id) / ".lock"
+    with file_lock(lock_path, shared=True):
         return func(*args, **kwargs)
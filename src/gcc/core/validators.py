@@ -5,6 +5,7 @@ security issues like injection attacks and path traversal.
 """
 from __future__ import annotations
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -13,9 +14,13 @@ from typing import Optional
 from .exceptions import ValidationError
 
 
+@functools.lru_cache(maxsize=1)
 def _get_security_config():
     """Get security configuration.
 
+    The result is resolved once and reused; set_config clears it with
+    _get_security_config.cache_clear() when the global config changes.
+
     Returns:
         SecurityConfig instance
     """
@@ -35,12 +40,17 @@ def _get_security_config():
         return SecurityConfig()
 
 
-# Regex patterns for validation
-BRANCH_NAME_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_-]*$')
-SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
-GIT_REF_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_./~-]*$')
+# Regex patterns for validation. \Z rather than $ so a trailing newline
+# cannot slip through; used with .match, which anchors the start.
+BRANCH_NAME_PATTERN = re.compile(r'[A-Za-z0-9][A-Za-z0-9_-]*\Z')
+SESSION_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]+\Z')
+GIT_REF_PATTERN = re.compile(r'[A-Za-z0-9][A-Za-z0-9_./~-]*\Z')
 SAFE_STRING_PATTERN = re.compile(r'^[A-Za-z0-9\s\-_.,!?@#$%&*()+=:\'"\\/]*$')
 
+# Control characters stripped from log entries (everything below 0x20
+# except tab, newline and carriage return, plus DEL), as a translate table
+_LOG_CONTROL_CHARS = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
 
 class Validators:
     """Input validation utilities.
@@ -76,7 +86,8 @@ class Validators:
                 value=name[:50] + "..." if len(name) > 50 else name,
             )
 
-        if not BRANCH_NAME_PATTERN.match(name):
+        # isascii() is a flag check on str, and the patterns are ASCII-only.
+        if not (name.isascii() and BRANCH_NAME_PATTERN.match(name)):
             raise ValidationError(
                 "branch name must start with alphanumeric character and contain only alphanumeric, underscore, or hyphen",
                 field="branch",
@@ -118,7 +129,7 @@ class Validators:
                 value=session_id[:50] + "..." if len(session_id) > 50 else session_id,
             )
 
-        if not SESSION_ID_PATTERN.match(session_id):
+        if not (session_id.isascii() and SESSION_ID_PATTERN.match(session_id)):
             raise ValidationError(
                 "session_id must contain only alphanumeric characters, hyphens, and underscores",
                 field="session_id",
@@ -153,7 +164,7 @@ class Validators:
                 value=ref[:100] + "...",
             )
 
-        if not GIT_REF_PATTERN.match(ref):
+        if not (ref.isascii() and GIT_REF_PATTERN.match(ref)):
             raise ValidationError(
                 "git ref contains invalid characters",
                 field="ref",
@@ -355,7 +366,7 @@ class Validators:
         """
         # Remove potential control characters
         # Keep newlines and tabs but remove other control chars
-        sanitized = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', entry)
+        sanitized = entry.translate(_LOG_CONTROL_CHARS)
 
         # Limit length
         config = _get_security_config()
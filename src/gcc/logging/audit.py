@@ -4,12 +4,75 @@ Records all operations for security, compliance, and debugging purposes.
 """
 from __future__ import annotations
 
-import json
+import atexit
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
+# Aware datetimes are rendered as "...Z"; non-string param keys are
+# stringified like the stdlib encoder does.
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+# Queue marker telling the background worker to exit
+_STOP = object()
+
+# Parameter names containing any of these (case-insensitively) are redacted
+_SENSITIVE_KEY_RE = re.compile(
+    "password|token|secret|key|api_key|private_key|credential|auth"
+)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor.
+
+    Args:
+        fd: Descriptor opened for appending
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# Exact value types that are never truncated or recursed into
+_PLAIN_TYPES = frozenset((int, float, bool, type(None), list, tuple))
+
+
+def _needs_sanitize(params: Dict[str, Any]) -> bool:
+    """Check whether _sanitize would change anything in params.
+
+    Values are classified by exact type first; isinstance is only
+    consulted for other types, so subclasses of str and dict are still
+    caught.
+
+    Args:
+        params: Operation parameters
+
+    Returns:
+        True if a key is sensitive, a string is over the truncation limit,
+        or a value is a nested dict
+    """
+    search = _SENSITIVE_KEY_RE.search
+    for key, value in params.items():
+        kind = type(value)
+        if kind is str:
+            if len(value) > 1000:
+                return True
+        elif kind not in _PLAIN_TYPES:
+            if isinstance(value, dict) or (isinstance(value, str) and len(value) > 1000):
+                return True
+        if search(key.lower()):
+            return True
+    return False
+
 
 class AuditLogger:
     """Audit logger for tracking all operations.
@@ -18,15 +81,32 @@ class AuditLogger:
     for security auditing and compliance.
     """
 
-    def __init__(self, log_dir: Path):
+    def __init__(self, log_dir: Path, flush_interval_ms: int = 0, buffer_size: int = 512):
         """Initialize audit logger.
 
         Args:
             log_dir: Directory for audit logs
+            flush_interval_ms: If positive, entries are queued and written
+                in batches by a background thread at most this many
+                milliseconds after they were logged; 0 writes each entry
+                synchronously
+            buffer_size: Maximum entries written per batch
         """
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(self.log_dir):
+            self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_path = self.log_dir / "audit.log"
+        self.flush_interval = max(0, flush_interval_ms) / 1000
+        self.buffer_size = max(1, buffer_size)
+        self._queue: Optional[queue.SimpleQueue] = None
+        # Descriptor kept open by the background worker between batches
+        self._fd: Optional[int] = None
+        self._worker: Optional[threading.Thread] = None
+        if self.flush_interval:
+            self._queue = queue.SimpleQueue()
+            self._worker = threading.Thread(target=self._drain_loop, name="gcc-audit", daemon=True)
+            self._worker.start()
+            atexit.register(self.close)
 
     def log(
         self,
@@ -48,7 +128,7 @@ class AuditLogger:
             error: Error message if operation failed
         """
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": datetime.now(timezone.utc),
             "action": action,
             "session_id": session_id,
             "user": user,
@@ -58,12 +138,132 @@ class AuditLogger:
         }
 
         try:
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            line = orjson.dumps(entry, option=_JSON_OPTIONS) + b"\n"
         except Exception as e:
-            # Fallback to stderr if audit log fails
-            import sys
-            print(f"Failed to write audit log: {e}", file=sys.stderr)
+            self._report_failure(e)
+            return
+        if self._queue is not None:
+            self._queue.put_nowait(line)
+        else:
+            self._write(line)
+
+    def flush(self) -> None:
+        """Block until every entry logged so far has been written.
+
+        A no-op for synchronous loggers.
+        """
+        pending = self._queue
+        if pending is None:
+            return
+        # The marker queues behind pending entries, so the worker has
+        # written all of them by the time it signals.
+        done = threading.Event()
+        pending.put_nowait(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Write pending entries and stop the background worker.
+
+        The logger keeps working afterwards, writing synchronously. A
+        no-op for synchronous loggers.
+        """
+        pending, self._queue = self._queue, None
+        if pending is None:
+            return
+        atexit.unregister(self.close)
+        # Queued behind pending entries; the worker writes them, closes its
+        # descriptor and exits.
+        pending.put_nowait(_STOP)
+        self._worker.join()
+        self._worker = None
+
+    def _drain_loop(self) -> None:
+        """Background worker: collect queued entries and write them in batches."""
+        source = self._queue
+        while True:
+            item = source.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    # Take anything that raced in behind the marker too.
+                    while True:
+                        try:
+                            item = source.get_nowait()
+                        except queue.Empty:
+                            break
+                        if isinstance(item, threading.Event):
+                            item.set()
+                        elif item is not _STOP:
+                            batch.append(item)
+                    if batch:
+                        self._write_batch(b"".join(batch))
+                    if self._fd is not None:
+                        os.close(self._fd)
+                        self._fd = None
+                    return
+                if isinstance(item, threading.Event):
+                    if batch:
+                        self._write_batch(b"".join(batch))
+                        batch = []
+                    item.set()
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.buffer_size or remaining <= 0:
+                    break
+                try:
+                    item = source.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(b"".join(batch))
+
+    def _write(self, data: bytes) -> None:
+        """Append serialized entries to the audit log.
+
+        Args:
+            data: One or more newline-terminated JSON lines
+        """
+        try:
+            fd = os.open(self.log_path, _APPEND_FLAGS, 0o644)
+            try:
+                _write_all(fd, data)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self._report_failure(e)
+
+    def _write_batch(self, data: bytes) -> None:
+        """Append a batch through the worker's long-lived descriptor.
+
+        The descriptor is reopened when audit.log was removed or replaced
+        (e.g. rotated) since the last batch. O_APPEND keeps concurrent
+        writers from other processes from overwriting each other.
+
+        Args:
+            data: One or more newline-terminated JSON lines
+        """
+        try:
+            if self._fd is not None:
+                try:
+                    current = os.stat(self.log_path).st_ino == os.fstat(self._fd).st_ino
+                except FileNotFoundError:
+                    current = False
+                if not current:
+                    os.close(self._fd)
+                    self._fd = None
+            if self._fd is None:
+                self._fd = os.open(self.log_path, _APPEND_FLAGS, 0o644)
+            _write_all(self._fd, data)
+        except Exception as e:
+            self._report_failure(e)
+
+    @staticmethod
+    def _report_failure(error: Exception) -> None:
+        """Fallback to stderr if audit log fails."""
+        import sys
+        print(f"Failed to write audit log: {error}", file=sys.stderr)
 
     def _sanitize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize sensitive information from parameters.
@@ -72,64 +272,98 @@ class AuditLogger:
             params: Original parameters
 
         Returns:
-            Sanitized parameters with sensitive values redacted
+            Sanitized parameters with sensitive values redacted; params
+            itself when nothing needs redacting or truncating
         """
         if not params:
             return {}
+        if not _needs_sanitize(params):
+            # The common case: the entry is serialized right away, so the
+            # caller's dict can be used as is.
+            return params
 
-        sensitive_keys = {
-            "password", "token", "secret", "key", "api_key",
-            "private_key", "credential", "auth"
-        }
-
-        sanitized = {}
-        for key, value in params.items():
-            key_lower = key.lower()
-            if any(s in key_lower for s in sensitive_keys):
-                # Check if value is a string/bytes type
-                if isinstance(value, (str, bytes)):
-                    sanitized[key] = "***REDACTED***"
-                elif isinstance(value, dict):
-                    # Recursively sanitize dict values
-                    sanitized[key] = self._sanitize(value)
-                else:
-                    sanitized[key] = type(value).__name__
-            else:
-                # Truncate long values
-                if isinstance(value, str) and len(value) > 1000:
-                    sanitized[key] = value[:1000] + "... (truncated)"
-                elif isinstance(value, dict):
-                    sanitized[key] = self._sanitize(value)
+        sanitized: Dict[str, Any] = {}
+        # Nested dicts are walked with an explicit stack instead of
+        # recursion; copies maps each source dict to its sanitized copy so
+        # a dict reached twice is only walked once.
+        copies = {id(params): sanitized}
+        stack = [(params, sanitized)]
+        while stack:
+            source, out = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    child = copies.get(id(value))
+                    if child is None:
+                        child = copies[id(value)] = {}
+                        stack.append((value, child))
+                    out[key] = child
+                elif _SENSITIVE_KEY_RE.search(key.lower()):
+                    if isinstance(value, (str, bytes)):
+                        out[key] = "***REDACTED***"
+                    else:
+                        out[key] = type(value).__name__
+                elif isinstance(value, str) and len(value) > 1000:
+                    # Truncate long values
+                    out[key] = value[:1000] + "... (truncated)"
                 else:
-                    sanitized[key] = value
+                    out[key] = value
 
         return sanitized
 
 
-# Global audit logger instance
-_global_audit_logger: Optional[AuditLogger] = None
+# Global audit logger instance; _UNSET until the environment is first read,
+# then the logger or None when audit logging is disabled
+_UNSET: Any = object()
+_global_audit_logger: Any = _UNSET
+# Serializes the first resolution so only one logger (and worker) is made
+_audit_lock = threading.Lock()
 
 
 def get_audit_logger() -> Optional[AuditLogger]:
     """Get the global audit logger.
 
+    The environment is read on the first call only; use
+    reset_audit_logger to pick up changes.
+
     Returns:
         AuditLogger instance if enabled, None otherwise
     """
     global _global_audit_logger
 
-    # Check if audit logging is enabled
-    if os.environ.get("GCC_ENABLE_AUDIT_LOG", "true").lower() != "true":
-        return None
+    if _global_audit_logger is not _UNSET:
+        return _global_audit_logger
+
+    with _audit_lock:
+        if _global_audit_logger is not _UNSET:
+            return _global_audit_logger
+
+        # Check if audit logging is enabled
+        if os.environ.get("GCC_ENABLE_AUDIT_LOG", "true").lower() != "true":
+            _global_audit_logger = None
+            return None
+
+        # Get log directory from environment or use default
+        log_dir = os.environ.get("GCC_LOG_DIR", "/var/log/gcc")
+        _global_audit_logger = AuditLogger(
+            Path(log_dir),
+            flush_interval_ms=int(os.environ.get("GCC_AUDIT_FLUSH_MS", "0")),
+            buffer_size=int(os.environ.get("GCC_AUDIT_BUFFER_SIZE", "512")),
+        )
 
-    if _global_audit_logger is not None:
         return _global_audit_logger
 
-    # Get log directory from environment or use default
-    log_dir = os.environ.get("GCC_LOG_DIR", "/var/log/gcc")
-    _global_audit_logger = AuditLogger(Path(log_dir))
 
-    return _global_audit_logger
+def reset_audit_logger() -> None:
+    """Drop the global audit logger so the next lookup re-reads the environment.
+
+    A batching logger is closed first, writing its queued entries and
+    stopping its worker thread.
+    """
+    global _global_audit_logger
+    with _audit_lock:
+        previous, _global_audit_logger = _global_audit_logger, _UNSET
+    if isinstance(previous, AuditLogger):
+        previous.close()
 
 
 def log_operation(
@@ -5,10 +5,13 @@ and proper formatting for both development and production environments.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
@@ -25,6 +28,11 @@ class GCCLogger:
     """
 
     _instances: dict[str, logging.Logger] = {}
+    # Serializes first-time setup so concurrent callers cannot attach
+    # a second set of handlers to the same logger.
+    _lock = threading.Lock()
+    # Background listeners that own each logger's file handler
+    _listeners: dict[str, QueueListener] = {}
 
     @classmethod
     def get_logger(
@@ -43,9 +51,32 @@ class GCCLogger:
         Returns:
             Configured logger instance
         """
-        if name in cls._instances:
-            return cls._instances[name]
+        logger = cls._instances.get(name)
+        if logger is not None:
+            return logger
+        with cls._lock:
+            logger = cls._instances.get(name)
+            if logger is not None:
+                return logger
+            return cls._create_logger(name, log_dir, level)
 
+    @classmethod
+    def _create_logger(
+        cls,
+        name: str,
+        log_dir: Optional[Path],
+        level: Optional[str],
+    ) -> logging.Logger:
+        """Configure and cache a logger; callers hold cls._lock.
+
+        Args:
+            name: Logger name
+            log_dir: Directory for log files, or None for console only
+            level: Log level name
+
+        Returns:
+            Configured logger instance
+        """
         # Create logger
         logger = logging.getLogger(name)
 
@@ -80,7 +111,16 @@ class GCCLogger:
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+
+            # Callers only enqueue; a listener thread writes and rotates.
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            cls._listeners[name] = listener
+            # Registered after logging's own shutdown hook, so it runs
+            # first and drains the queue before handlers are closed.
+            atexit.register(cls._stop_listener, name)
+            logger.addHandler(QueueHandler(log_queue))
 
         # Prevent propagation to root logger
         logger.propagate = False
@@ -89,6 +129,17 @@ class GCCLogger:
         cls._instances[name] = logger
         return logger
 
+    @classmethod
+    def _stop_listener(cls, name: str) -> None:
+        """Write out queued records for a logger and stop its listener.
+
+        Args:
+            name: Logger name
+        """
+        listener = cls._listeners.pop(name, None)
+        if listener is not None:
+            listener.stop()
+
     @staticmethod
     def _get_log_level(level: Optional[str]) -> int:
         """Convert string level to logging constant.
@@ -4,23 +4,34 @@ Translates MCP JSON-RPC requests to HTTP API calls.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import re
 import sys
 import hashlib
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 
-import httpx
+import orjson
 
+if TYPE_CHECKING:
+    # Imported on the first tool call; sessions that never call a tool
+    # don't pay for loading the HTTP stack.
+    import httpx
 
-# Windows encoding fix - important for non-ASCII characters
+
+def _reconfigure_utf8(stream: Any) -> None:
+    """Switch a text stream to UTF-8 unless it already is."""
+    encoding = (getattr(stream, "encoding", None) or "").lower().replace("-", "")
+    if encoding != "utf8" and hasattr(stream, "reconfigure"):
+        stream.reconfigure(encoding="utf-8", errors="replace")
+
+
+# Windows encoding fix - important for non-ASCII characters. Only stdout
+# can still be written as text; requests are read from stdin's byte buffer.
 if sys.platform == "win32":
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    if hasattr(sys.stdin, "reconfigure"):
-        sys.stdin.reconfigure(encoding="utf-8", errors="replace")
+    _reconfigure_utf8(sys.stdout)
 
 
 # Configuration
@@ -183,6 +194,27 @@ TOOLS = [
     },
 ]
 
+# HTTP API endpoint for each tool
+_TOOL_PATH_MAP = {
+    "gcc_init": "/init",
+    "gcc_branch": "/branch",
+    "gcc_commit": "/commit",
+    "gcc_merge": "/merge",
+    "gcc_context": "/context",
+    "gcc_log": "/log",
+    "gcc_history": "/history",
+    "gcc_diff": "/diff",
+    "gcc_show": "/show",
+    "gcc_reset": "/reset",
+}
+
+# Responses whose only varying part is the request id, encoded once at
+# import; %b takes the orjson-encoded id
+_TOOLS_LIST_TMPL = b'{"jsonrpc":"2.0","id":%b,"result":' + orjson.dumps({"tools": TOOLS}).replace(b"%", b"%%") + b"}\n"
+_EMPTY_RESULT_TMPL = b'{"jsonrpc":"2.0","id":%b,"result":{}}\n'
+_RESOURCES_LIST_TMPL = b'{"jsonrpc":"2.0","id":%b,"result":{"resources":[]}}\n'
+_PROMPTS_LIST_TMPL = b'{"jsonrpc":"2.0","id":%b,"result":{"prompts":[]}}\n'
+
 
 def _server_url() -> str:
     """Get server URL from environment.
@@ -368,13 +400,12 @@ def _ensure_session_id(arguments: Dict[str, Any]) -> Dict[str, Any]:
     Otherwise, keeps AI-provided value and only fills missing session_id.
 
     Args:
-        arguments: Tool arguments dictionary
+        arguments: Tool arguments dictionary; updated in place, as callers
+            pass the dict they just parsed from the request
 
     Returns:
-        Arguments with session_id guaranteed to be set
+        The same arguments dict, with session_id guaranteed to be set
     """
-    arguments = dict(arguments)
-
     # If locked, always use configured/default value (ignore tool input)
     if _is_session_locked():
         arguments["session_id"] = _default_session_id()
@@ -385,6 +416,28 @@ def _ensure_session_id(arguments: Dict[str, Any]) -> Dict[str, Any]:
     return arguments
 
 
+_client: Optional[httpx.Client] = None
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps the connection to the server alive between
+    tool calls instead of reconnecting for each one.
+
+    Returns:
+        httpx.Client instance
+    """
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.Client(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=8))
+        atexit.register(_client.close)
+    return _client
+
+
 def _post(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Make HTTP POST request to GCC server.
 
@@ -399,10 +452,9 @@ def _post(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         httpx.HTTPError: If request fails
     """
     url = f"{_server_url()}{path}"
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
+    response = _get_client().post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
 def _handle_tools_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -419,26 +471,17 @@ def _handle_tools_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, A
         ValueError: If tool name is unknown
         ConnectionError: If unable to connect to GCC server
     """
-    mapping = {
-        "gcc_init": "/init",
-        "gcc_branch": "/branch",
-        "gcc_commit": "/commit",
-        "gcc_merge": "/merge",
-        "gcc_context": "/context",
-        "gcc_log": "/log",
-        "gcc_history": "/history",
-        "gcc_diff": "/diff",
-        "gcc_show": "/show",
-        "gcc_reset": "/reset",
-    }
-    if tool_name not in mapping:
+    path = _TOOL_PATH_MAP.get(tool_name)
+    if path is None:
         raise ValueError(f"Unknown tool: {tool_name}")
 
     # Server handles path management - just forward arguments
     payload = _ensure_session_id(arguments)
 
+    import httpx
+
     try:
-        return _post(mapping[tool_name], payload)
+        return _post(path, payload)
     except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
         server_url = _server_url()
         session_env = os.environ.get(SESSION_ID_ENV, "not set")
@@ -464,16 +507,31 @@ def _write_response(payload: Dict[str, Any]) -> None:
         payload: Response dictionary
 
     Note:
-        Uses ensure_ascii=False for proper Unicode handling.
-        Falls back to ASCII with escapes if UTF-8 fails.
+        Writes UTF-8 bytes straight to the binary stdout buffer. Falls
+        back to ASCII with escapes for text orjson rejects (lone
+        surrogates).
     """
     try:
-        output = json.dumps(payload, ensure_ascii=False)
-    except (UnicodeEncodeError, UnicodeDecodeError):
+        output = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    except orjson.JSONEncodeError:
         # Fallback to ASCII with escapes if UTF-8 fails
-        output = json.dumps(payload, ensure_ascii=True)
-    sys.stdout.write(output + "\n")
-    sys.stdout.flush()
+        output = (json.dumps(payload, ensure_ascii=True) + "\n").encode("ascii")
+    _write_bytes(output)
+
+
+def _write_bytes(output: bytes) -> None:
+    """Write an encoded, newline-terminated JSON-RPC message to stdout.
+
+    Args:
+        output: UTF-8 encoded message
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(output.decode("utf-8"))
+        sys.stdout.flush()
+        return
+    buffer.write(output)
+    buffer.flush()
 
 
 def _error_response(request_id: Any, message: str) -> Dict[str, Any]:
@@ -493,90 +551,107 @@ def _error_response(request_id: Any, message: str) -> Dict[str, Any]:
     }
 
 
+def _handle_initialize(request_id: Any, params: Any) -> Dict[str, Any]:
+    """Answer the MCP initialize handshake."""
+    protocol = params.get("protocolVersion") if isinstance(params, dict) else None
+    protocol = protocol or "2024-11-05"
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "protocolVersion": protocol,
+            "serverInfo": {"name": "gcc-mcp", "version": "1.0.0"},
+            "capabilities": {"tools": {}},
+        },
+    }
+
+
+def _handle_tools_list(request_id: Any, params: Any) -> bytes:
+    """List the available tools."""
+    return _TOOLS_LIST_TMPL % orjson.dumps(request_id)
+
+
+def _handle_tools_call_request(request_id: Any, params: Any) -> Dict[str, Any]:
+    """Run a tool through the HTTP API and wrap its result as text content."""
+    tool_name = params.get("name")
+    arguments = params.get("arguments") or {}
+    result = _handle_tools_call(tool_name, arguments)
+    # Serialize result once
+    result_text = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {"content": [{"type": "text", "text": result_text}]},
+    }
+
+
+def _empty_result(request_id: Any, params: Any) -> bytes:
+    """Acknowledge a request with an empty result."""
+    return _EMPTY_RESULT_TMPL % orjson.dumps(request_id)
+
+
+def _handle_resources_list(request_id: Any, params: Any) -> bytes:
+    """Report that no resources are offered."""
+    return _RESOURCES_LIST_TMPL % orjson.dumps(request_id)
+
+
+def _handle_prompts_list(request_id: Any, params: Any) -> bytes:
+    """Report that no prompts are offered."""
+    return _PROMPTS_LIST_TMPL % orjson.dumps(request_id)
+
+
+# JSON-RPC method -> handler(request_id, params) returning the response,
+# either as a payload dict or already encoded
+_METHOD_HANDLERS: Dict[str, Callable[[Any, Any], Union[Dict[str, Any], bytes]]] = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call_request,
+    "ping": _empty_result,
+    "resources/list": _handle_resources_list,
+    "prompts/list": _handle_prompts_list,
+    "shutdown": _empty_result,
+    "exit": _empty_result,
+}
+
+# Methods after which the proxy stops reading requests
+_STOP_METHODS = frozenset(("shutdown", "exit"))
+
+
 def main() -> None:
     """Main MCP proxy loop.
 
     Reads JSON-RPC requests from stdin, processes them,
     and writes responses to stdout.
     """
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
+    # Parse raw bytes: orjson decodes UTF-8 itself, skipping the text layer.
+    for line in getattr(sys.stdin, "buffer", sys.stdin):
+        if not line.strip():
             continue
 
         request_id = None
         try:
-            request = json.loads(line)
+            request = orjson.loads(line)
             request_id = request.get("id")
             method = request.get("method")
             params = request.get("params") or {}
 
-            if method == "initialize":
-                protocol = params.get("protocolVersion") if isinstance(params, dict) else None
-                protocol = protocol or "2024-11-05"
-                _write_response(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "protocolVersion": protocol,
-                            "serverInfo": {"name": "gcc-mcp", "version": "1.0.0"},
-                            "capabilities": {"tools": {}},
-                        },
-                    }
-                )
+            handler = _METHOD_HANDLERS.get(method) if isinstance(method, str) else None
+            if handler is None:
+                if method == "initialized" or (isinstance(method, str) and method.startswith("notifications/")):
+                    # Notifications do not expect a response
+                    continue
+                if request_id is not None:
+                    _write_response(_error_response(request_id, f"Unsupported method: {method}"))
                 continue
 
-            if method in ("initialized", "notifications/initialized") or (
-                    isinstance(method, str) and method.startswith("notifications/")
-            ):
-                # Notifications do not expect a response
-                continue
-
-            if method == "tools/list":
-                _write_response(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"tools": TOOLS},
-                    }
-                )
-                continue
-
-            if method == "ping":
-                _write_response({"jsonrpc": "2.0", "id": request_id, "result": {}})
-                continue
-
-            if method == "resources/list":
-                _write_response({"jsonrpc": "2.0", "id": request_id, "result": {"resources": []}})
-                continue
-
-            if method == "prompts/list":
-                _write_response({"jsonrpc": "2.0", "id": request_id, "result": {"prompts": []}})
-                continue
-
-            if method == "tools/call":
-                tool_name = params.get("name")
-                arguments = params.get("arguments") or {}
-                result = _handle_tools_call(tool_name, arguments)
-                # Serialize result once
-                result_text = json.dumps(result, ensure_ascii=False, indent=None)
-                _write_response(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"content": [{"type": "text", "text": result_text}]},
-                    }
-                )
-                continue
-
-            if method in ("shutdown", "exit"):
-                _write_response({"jsonrpc": "2.0", "id": request_id, "result": {}})
+            response = handler(request_id, params)
+            if isinstance(response, bytes):
+                _write_bytes(response)
+            else:
+                _write_response(response)
+            if method in _STOP_METHODS:
                 break
 
-            if request_id is not None:
-                _write_response(_error_response(request_id, f"Unsupported method: {method}"))
-
         except Exception as exc:
             if request_id is not None:
                 _write_response(_error_response(request_id, str(exc)))
@@ -5,9 +5,14 @@ Creates and configures the FastAPI app with all endpoints and middleware.
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
+import anyio.to_thread
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from .config import GCCConfig, get_config
 from .endpoints import router
@@ -15,9 +20,24 @@ from .middleware import setup_middleware
 from ..logging.logger import GCCLogger
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Defined here rather than imported from fastapi.responses, whose
+    version is deprecated in newer FastAPI releases.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def create_app(config: GCCConfig | None = None) -> FastAPI:
     """Create and configure FastAPI application.
 
+    Logging is set up when the server starts (the app's lifespan), not
+    when the app is built, so importing this module creates no log
+    directory or handlers.
+
     Args:
         config: Optional configuration (uses env vars if not provided)
 
@@ -27,13 +47,17 @@ def create_app(config: GCCConfig | None = None) -> FastAPI:
     if config is None:
         config = get_config()
 
-    # Initialize logging system
-    log_dir = Path(os.environ.get("GCC_LOG_DIR", config.logging.log_dir))
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Get logger for app initialization
-    logger = GCCLogger.get_logger("gcc.app", log_dir, config.server.log_level)
-    logger.info(f"Initializing GCC server (log directory: {log_dir})")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Initialize logging system; get_logger creates the directory
+        log_dir = Path(os.environ.get("GCC_LOG_DIR", config.logging.log_dir))
+        logger = GCCLogger.get_logger("gcc.app", log_dir, config.server.log_level)
+        logger.info("GCC server starting (log directory: %s)", log_dir)
+        # Endpoints run their git/storage work in anyio's worker threads
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            config.server.thread_limit
+        )
+        yield
 
     # Create FastAPI app
     app = FastAPI(
@@ -42,6 +66,8 @@ def create_app(config: GCCConfig | None = None) -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Setup middleware
@@ -60,12 +86,33 @@ def create_app(config: GCCConfig | None = None) -> FastAPI:
         """
         return {"status": "ok", "version": "1.0.0"}
 
-    logger.info("GCC server initialized successfully")
     return app
 
 
-# Create default app instance
-app = create_app()
+# Default app instance, built on first use
+_app: Optional[FastAPI] = None
+
+
+def get_app() -> FastAPI:
+    """Get the default application, creating it on first call.
+
+    Also usable as an app factory: ``uvicorn gcc.server.app:get_app --factory``.
+
+    Returns:
+        The shared FastAPI application
+    """
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
+
+
+def __getattr__(name: str):
+    # Keep ``from gcc.server.app import app`` and ``uvicorn gcc.server.app:app``
+    # working without building the app when the module is merely imported.
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -75,12 +122,16 @@ def main() -> None:
     - gcc-server command
     - python -m gcc.server.app
     - uvicorn gcc.server.app:app
+    - uvicorn gcc.server.app:get_app --factory
+
+    uvicorn's default ``auto`` loop and HTTP settings pick up uvloop and
+    httptools, which the ``uvicorn[standard]`` dependency installs.
     """
     import uvicorn
 
     config = get_config()
     uvicorn.run(
-        app,
+        get_app(),
         host=config.server.host,
         port=config.server.port,
         workers=config.server.workers,
@@ -5,12 +5,49 @@ allowing different modes (MCP, skill, standalone) to customize behavior.
 """
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+# Environment lookups are memoised: the environment is treated as fixed for the
+# life of the process, so each variable is read and parsed at most once.
+
+@functools.lru_cache(maxsize=None)
+def _env_str(name: str, default: str) -> str:
+    """Return an environment variable, or ``default`` if unset."""
+    return os.getenv(name, default)
+
+
+@functools.lru_cache(maxsize=None)
+def _env_int(name: str, default: int) -> int:
+    """Return an environment variable parsed as an int."""
+    value = os.getenv(name)
+    return default if value is None else int(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _env_float(name: str, default: float) -> float:
+    """Return an environment variable parsed as a float."""
+    value = os.getenv(name)
+    return default if value is None else float(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _env_bool(name: str, default: bool) -> bool:
+    """Return an environment variable parsed as a boolean (``"true"`` is True)."""
+    value = os.getenv(name)
+    return default if value is None else value.lower() == "true"
+
+
+def reset_env_cache() -> None:
+    """Forget memoised environment values so the next read sees changes."""
+    for helper in (_env_str, _env_int, _env_float, _env_bool):
+        helper.cache_clear()
+
+
+@dataclass(frozen=True)
 class GitConfig:
     """Git operation configuration.
 
@@ -18,23 +55,27 @@ class GitConfig:
         default_name: Default git user name
         default_email: Default git user email
         default_branch: Default branch name
+        command_timeout: Seconds a git command may run before it is killed
+            (0 disables the limit)
     """
 
     default_name: str = "GCC Agent"
     default_email: str = "gcc@example.com"
     default_branch: str = "main"
+    command_timeout: float = 120.0
 
     @classmethod
     def from_env(cls) -> GitConfig:
         """Create config from environment variables."""
         return cls(
-            default_name=os.getenv("GCC_GIT_NAME", cls.default_name),
-            default_email=os.getenv("GCC_GIT_EMAIL", cls.default_email),
-            default_branch=os.getenv("GCC_GIT_DEFAULT_BRANCH", cls.default_branch),
+            default_name=_env_str("GCC_GIT_NAME", cls.default_name),
+            default_email=_env_str("GCC_GIT_EMAIL", cls.default_email),
+            default_branch=_env_str("GCC_GIT_DEFAULT_BRANCH", cls.default_branch),
+            command_timeout=_env_float("GCC_GIT_TIMEOUT", cls.command_timeout),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class SecurityConfig:
     """Security and validation configuration.
 
@@ -62,18 +103,18 @@ class SecurityConfig:
     def from_env(cls) -> SecurityConfig:
         """Create config from environment variables."""
         return cls(
-            max_branch_name_length=int(os.getenv("GCC_MAX_BRANCH_LENGTH", str(cls.max_branch_name_length))),
-            max_session_id_length=int(os.getenv("GCC_MAX_SESSION_LENGTH", str(cls.max_session_id_length))),
-            max_limit=int(os.getenv("GCC_MAX_LIMIT", str(cls.max_limit))),
-            min_limit=int(os.getenv("GCC_MIN_LIMIT", str(cls.min_limit))),
-            max_string_length=int(os.getenv("GCC_MAX_STRING_LENGTH", str(cls.max_string_length))),
-            allow_path_traversal=os.getenv("GCC_ALLOW_PATH_TRAVERSAL", "false").lower() == "true",
-            enable_rate_limiting=os.getenv("GCC_ENABLE_RATE_LIMIT", "true").lower() == "true",
-            rate_limit_requests=int(os.getenv("GCC_RATE_LIMIT_REQUESTS", str(cls.rate_limit_requests))),
+            max_branch_name_length=_env_int("GCC_MAX_BRANCH_LENGTH", cls.max_branch_name_length),
+            max_session_id_length=_env_int("GCC_MAX_SESSION_LENGTH", cls.max_session_id_length),
+            max_limit=_env_int("GCC_MAX_LIMIT", cls.max_limit),
+            min_limit=_env_int("GCC_MIN_LIMIT", cls.min_limit),
+            max_string_length=_env_int("GCC_MAX_STRING_LENGTH", cls.max_string_length),
+            allow_path_traversal=_env_bool("GCC_ALLOW_PATH_TRAVERSAL", False),
+            enable_rate_limiting=_env_bool("GCC_ENABLE_RATE_LIMIT", True),
+            rate_limit_requests=_env_int("GCC_RATE_LIMIT_REQUESTS", cls.rate_limit_requests),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class ServerConfig:
     """FastAPI server configuration.
 
@@ -84,6 +125,7 @@ class ServerConfig:
         log_level: Logging level
         reload: Enable auto-reload for development
         access_log: Enable access logging
+        thread_limit: Maximum concurrent blocking command calls per worker
     """
 
     host: str = "0.0.0.0"
@@ -92,21 +134,23 @@ class ServerConfig:
     log_level: str = "info"
     reload: bool = False
     access_log: bool = True
+    thread_limit: int = 40
 
     @classmethod
     def from_env(cls) -> ServerConfig:
         """Create config from environment variables."""
         return cls(
-            host=os.getenv("GCC_HOST", cls.host),
-            port=int(os.getenv("GCC_PORT", str(cls.port))),
-            workers=int(os.getenv("GCC_WORKERS", str(cls.workers))),
-            log_level=os.getenv("GCC_LOG_LEVEL", cls.log_level),
-            reload=os.getenv("GCC_RELOAD", "false").lower() == "true",
-            access_log=os.getenv("GCC_ACCESS_LOG", "true").lower() == "true",
+            host=_env_str("GCC_HOST", cls.host),
+            port=_env_int("GCC_PORT", cls.port),
+            workers=_env_int("GCC_WORKERS", cls.workers),
+            log_level=_env_str("GCC_LOG_LEVEL", cls.log_level),
+            reload=_env_bool("GCC_RELOAD", False),
+            access_log=_env_bool("GCC_ACCESS_LOG", True),
+            thread_limit=_env_int("GCC_THREAD_LIMIT", cls.thread_limit),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration.
 
@@ -130,26 +174,28 @@ class LoggingConfig:
     def from_env(cls) -> LoggingConfig:
         """Create config from environment variables."""
         return cls(
-            log_dir=os.getenv("GCC_LOG_DIR", cls.log_dir),
-            log_max_bytes=int(os.getenv("GCC_LOG_MAX_BYTES", str(cls.log_max_bytes))),
-            log_backup_count=int(os.getenv("GCC_LOG_BACKUP_COUNT", str(cls.log_backup_count))),
-            enable_audit_log=os.getenv("GCC_ENABLE_AUDIT_LOG", "true").lower() == "true",
-            enable_git_log=os.getenv("GCC_ENABLE_GIT_LOG", "true").lower() == "true",
+            log_dir=_env_str("GCC_LOG_DIR", cls.log_dir),
+            log_max_bytes=_env_int("GCC_LOG_MAX_BYTES", cls.log_max_bytes),
+            log_backup_count=_env_int("GCC_LOG_BACKUP_COUNT", cls.log_backup_count),
+            enable_audit_log=_env_bool("GCC_ENABLE_AUDIT_LOG", True),
+            enable_git_log=_env_bool("GCC_ENABLE_GIT_LOG", True),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class GCCConfig:
     """Main configuration container.
 
     This class aggregates all sub-configurations and provides
-    a single entry point for configuration access.
+    a single entry point for configuration access. All config classes are
+    frozen, so defaults can be shared and overrides go through
+    ``dataclasses.replace``.
     """
 
-    git: GitConfig = field(default_factory=GitConfig)
-    security: SecurityConfig = field(default_factory=SecurityConfig)
-    server: ServerConfig = field(default_factory=ServerConfig)
-    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    git: GitConfig = GitConfig()
+    security: SecurityConfig = SecurityConfig()
+    server: ServerConfig = ServerConfig()
+    logging: LoggingConfig = LoggingConfig()
 
     @classmethod
     def from_env(cls) -> GCCConfig:
@@ -189,3 +235,8 @@ def set_config(config: GCCConfig) -> None:
     """
     global _global_config
     _global_config = config
+
+    from ..core.git_ops import reset_git_config_cache
+    from ..core.validators import _get_security_config
+    reset_git_config_cache()
+    _get_security_config.cache_clear()
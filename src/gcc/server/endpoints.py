@@ -1,22 +1,31 @@
 """API endpoints for GCC FastAPI server.
 
 Provides all HTTP endpoints for GCC memory operations.
+
+The command layer (git, storage) is imported inside each handler so that
+consumers that only need the request models do not pay for it at import time.
+Handlers are async and hand the blocking command call to the worker thread
+pool, so request validation and response serialization stay on the event loop.
 """
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, ConfigDict, Field
 
-from ..core import commands
-
 
 # Request/Response Models
 DEFAULT_DATA_ROOT = "/data"
 
+# Field types shared by several request models
+SessionId = Annotated[Optional[str], Field(description="Session identifier", max_length=100)]
+BranchName = Annotated[str, Field(description="Branch name", max_length=100)]
+
 class StrictRequestModel(BaseModel):
     """Base request model that rejects unknown fields."""
 
@@ -27,32 +36,32 @@ class InitRequest(StrictRequestModel):
     """Request model for session initialization."""
     goal: Optional[str] = Field(None, description="Session goal", max_length=10000)
     todo: Optional[List[str]] = Field(None, description="Todo items")
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class BranchRequest(StrictRequestModel):
     """Request model for branch creation."""
-    branch: str = Field(..., description="Branch name", max_length=100)
+    branch: BranchName
     purpose: str = Field(..., description="Branch purpose", max_length=10000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class LogRequest(StrictRequestModel):
     """Request model for log appending."""
-    branch: str = Field(..., description="Branch name", max_length=100)
+    branch: BranchName
     entries: List[str] = Field(..., description="Log entries to append")
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class CommitRequest(StrictRequestModel):
     """Request model for commit creation."""
-    branch: str = Field(..., description="Branch name", max_length=100)
+    branch: BranchName
     contribution: str = Field(..., description="Commit contribution", min_length=1, max_length=10000)
     purpose: Optional[str] = Field(None, description="Branch purpose", max_length=10000)
     log_entries: Optional[List[str]] = Field(None, description="Log entries")
     metadata_updates: Optional[Dict[str, Any]] = Field(None, description="Metadata updates")
     update_main: Optional[str] = Field(None, description="Text to append to main.md", max_length=10000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class MergeRequest(StrictRequestModel):
@@ -60,7 +69,7 @@ class MergeRequest(StrictRequestModel):
     source_branch: str = Field(..., description="Source branch name", max_length=100)
     target_branch: Optional[str] = Field(None, description="Target branch name", max_length=100)
     summary: Optional[str] = Field(None, description="Merge summary", max_length=10000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class ContextRequest(StrictRequestModel):
@@ -69,27 +78,27 @@ class ContextRequest(StrictRequestModel):
     commit_id: Optional[str] = Field(None, description="Commit ID", max_length=100)
     log_tail: Optional[int] = Field(None, description="Number of log lines", ge=1, le=10000)
     metadata_segment: Optional[str] = Field(None, description="Metadata key", max_length=100)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class HistoryRequest(StrictRequestModel):
     """Request model for history retrieval."""
     limit: int = Field(20, description="Maximum commits to return", ge=1, le=1000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class DiffRequest(StrictRequestModel):
     """Request model for diff retrieval."""
     from_ref: str = Field(..., description="Source ref", max_length=1000)
     to_ref: Optional[str] = Field(None, description="Target ref", max_length=1000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class ShowRequest(StrictRequestModel):
     """Request model for file content retrieval."""
     ref: str = Field(..., description="Git ref", max_length=1000)
     path: Optional[str] = Field(None, description="File path", max_length=1000)
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 class ResetRequest(StrictRequestModel):
@@ -97,11 +106,31 @@ class ResetRequest(StrictRequestModel):
     ref: str = Field(..., description="Git ref to reset to", max_length=1000)
     mode: str = Field("soft", description="Reset mode (soft/hard)")
     confirm: bool = Field(False, description="Confirm hard reset")
-    session_id: Optional[str] = Field(None, description="Session identifier", max_length=100)
+    session_id: SessionId = None
 
 
 # Path resolution helper
 
+@functools.lru_cache(maxsize=8)
+def _get_base_path(base: str) -> Path:
+    """Resolve and validate a data root, memoised per raw setting.
+
+    Args:
+        base: Raw data root value (GCC_DATA_ROOT or the default)
+
+    Returns:
+        Resolved data root path
+
+    Raises:
+        ValidationError: If resolved path is unsafe
+    """
+    from ..core.validators import Validators
+
+    base_path = Path(base).resolve()
+    Validators.validate_path_safe(str(base_path), base_path)
+    return base_path
+
+
 def _resolve_path(session_id: Optional[str]) -> Path:
     """Resolve and validate project root path.
 
@@ -117,13 +146,10 @@ def _resolve_path(session_id: Optional[str]) -> Path:
     Note:
         - Container mode data root defaults to /data
         - Session-specific layout is handled by storage layer
+        - Resolution is cached on the raw setting, so a changed GCC_DATA_ROOT
+          is still picked up without re-resolving on every request
     """
-    from ..core.validators import Validators
-
-    base = os.environ.get("GCC_DATA_ROOT", DEFAULT_DATA_ROOT)
-    base_path = Path(base).resolve()
-    Validators.validate_path_safe(str(base_path), base_path)
-    return base_path
+    return _get_base_path(os.environ.get("GCC_DATA_ROOT", DEFAULT_DATA_ROOT))
 
 
 # API Router
@@ -132,7 +158,7 @@ router = APIRouter()
 
 
 @router.post("/init", tags=["sessions"])
-def init(req: InitRequest) -> Dict[str, Any]:
+async def init(req: InitRequest) -> Dict[str, Any]:
     """Initialize a new GCC session.
 
     Creates directory structure, initializes git repository,
@@ -145,7 +171,10 @@ def init(req: InitRequest) -> Dict[str, Any]:
 
     Returns initialization status and paths.
     """
-    return commands.init(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.init,
         _resolve_path(req.session_id),
         req.goal,
         req.todo,
@@ -154,7 +183,7 @@ def init(req: InitRequest) -> Dict[str, Any]:
 
 
 @router.post("/branch", tags=["branches"])
-def create_branch(req: BranchRequest) -> Dict[str, Any]:
+async def create_branch(req: BranchRequest) -> Dict[str, Any]:
     """Create a new memory branch.
 
     Creates a git branch with tracking files for
@@ -167,7 +196,10 @@ def create_branch(req: BranchRequest) -> Dict[str, Any]:
 
     Returns branch creation status.
     """
-    return commands.branch(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.branch,
         _resolve_path(req.session_id),
         req.branch,
         req.purpose,
@@ -176,7 +208,7 @@ def create_branch(req: BranchRequest) -> Dict[str, Any]:
 
 
 @router.post("/log", tags=["logs"])
-def append_log(req: LogRequest) -> Dict[str, Any]:
+async def append_log(req: LogRequest) -> Dict[str, Any]:
     """Append log entries to a branch.
 
     Adds timestamped log entries and creates a git commit.
@@ -188,7 +220,10 @@ def append_log(req: LogRequest) -> Dict[str, Any]:
 
     Returns log operation status.
     """
-    return commands.log(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.log,
         _resolve_path(req.session_id),
         req.branch,
         req.entries,
@@ -197,7 +232,7 @@ def append_log(req: LogRequest) -> Dict[str, Any]:
 
 
 @router.post("/commit", tags=["commits"])
-def commit(req: CommitRequest) -> Dict[str, Any]:
+async def commit(req: CommitRequest) -> Dict[str, Any]:
     """Create a memory checkpoint.
 
     Records contribution with optional updates to logs,
@@ -214,7 +249,10 @@ def commit(req: CommitRequest) -> Dict[str, Any]:
 
     Returns commit creation status with commit ID.
     """
-    return commands.commit(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.commit,
         _resolve_path(req.session_id),
         req.branch,
         req.contribution,
@@ -227,7 +265,7 @@ def commit(req: CommitRequest) -> Dict[str, Any]:
 
 
 @router.post("/merge", tags=["branches"])
-def merge(req: MergeRequest) -> Dict[str, Any]:
+async def merge(req: MergeRequest) -> Dict[str, Any]:
     """Merge a source branch into target branch.
 
     Combines commits, logs, and metadata from both branches.
@@ -240,7 +278,10 @@ def merge(req: MergeRequest) -> Dict[str, Any]:
 
     Returns merge operation status.
     """
-    return commands.merge(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.merge,
         _resolve_path(req.session_id),
         req.source_branch,
         req.target_branch,
@@ -250,7 +291,7 @@ def merge(req: MergeRequest) -> Dict[str, Any]:
 
 
 @router.post("/context", tags=["context"])
-def context(req: ContextRequest) -> Dict[str, Any]:
+async def context(req: ContextRequest) -> Dict[str, Any]:
     """Retrieve structured context information.
 
     Returns main.md, branches list, and optional branch-specific info.
@@ -264,7 +305,10 @@ def context(req: ContextRequest) -> Dict[str, Any]:
 
     Returns context dictionary with requested information.
     """
-    return commands.context(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.context,
         _resolve_path(req.session_id),
         req.branch,
         req.commit_id,
@@ -275,7 +319,7 @@ def context(req: ContextRequest) -> Dict[str, Any]:
 
 
 @router.post("/history", tags=["history"])
-def history(req: HistoryRequest) -> Dict[str, Any]:
+async def history(req: HistoryRequest) -> Dict[str, Any]:
     """Get git commit history.
 
     Returns list of git commits with metadata.
@@ -286,7 +330,10 @@ def history(req: HistoryRequest) -> Dict[str, Any]:
 
     Returns list of commits.
     """
-    return commands.history(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.history,
         _resolve_path(req.session_id),
         req.limit,
         req.session_id,
@@ -294,7 +341,7 @@ def history(req: HistoryRequest) -> Dict[str, Any]:
 
 
 @router.post("/diff", tags=["history"])
-def diff(req: DiffRequest) -> Dict[str, Any]:
+async def diff(req: DiffRequest) -> Dict[str, Any]:
     """Get git diff between two refs.
 
     Returns unified diff output.
@@ -306,7 +353,10 @@ def diff(req: DiffRequest) -> Dict[str, Any]:
 
     Returns diff output string.
     """
-    return commands.diff(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.diff,
         _resolve_path(req.session_id),
         req.from_ref,
         req.to_ref,
@@ -315,7 +365,7 @@ def diff(req: DiffRequest) -> Dict[str, Any]:
 
 
 @router.post("/show", tags=["history"])
-def show(req: ShowRequest) -> Dict[str, Any]:
+async def show(req: ShowRequest) -> Dict[str, Any]:
     """Show file content at a git ref.
 
     Returns file content from git history.
@@ -327,7 +377,10 @@ def show(req: ShowRequest) -> Dict[str, Any]:
 
     Returns file content string.
     """
-    return commands.show(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.show,
         _resolve_path(req.session_id),
         req.ref,
         req.path,
@@ -336,7 +389,7 @@ def show(req: ShowRequest) -> Dict[str, Any]:
 
 
 @router.post("/reset", tags=["history"])
-def reset(req: ResetRequest) -> Dict[str, Any]:
+async def reset(req: ResetRequest) -> Dict[str, Any]:
     """Reset repository to a git ref.
 
     Resets git HEAD to specified ref.
@@ -349,7 +402,10 @@ def reset(req: ResetRequest) -> Dict[str, Any]:
 
     Returns reset operation status.
     """
-    return commands.reset(
+    from ..core import commands
+
+    return await run_in_threadpool(
+        commands.reset,
         _resolve_path(req.session_id),
         req.ref,
         req.mode,
@@ -189,3 +189,25 @@ def test_sanitize_log_entry():
     long = "X" * 20000
     sanitized = Validators.sanitize_log_entry(long)
     assert len(sanitized) == 10000
+
+
+def test_identifiers_reject_trailing_newline_and_non_ascii():
+    """Test that a trailing newline or non-ASCII letter never validates."""
+    from gcc.core.exceptions import StorageError
+    from gcc.core.storage import normalize_session_id
+
+    for bad in ["main\n", "mäin"]:
+        with pytest.raises(ValidationError):
+            Validators.validate_branch_name(bad)
+        with pytest.raises(ValidationError):
+            Validators.validate_session_id(bad)
+        with pytest.raises(ValidationError):
+            Validators.validate_git_ref(bad)
+        with pytest.raises(StorageError):
+            normalize_session_id(bad)
+
+
+def test_sanitize_log_entry_keeps_whitespace_controls():
+    """Test that tab, newline and carriage return survive sanitization."""
+    entry = "a\tb\nc\r\nd\x0be\x0cf\x1bg\x7fh"
+    assert Validators.sanitize_log_entry(entry) == "a\tb\nc\r\ndefgh"
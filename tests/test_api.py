@@ -168,3 +168,34 @@ def test_branch_not_found_maps_to_404(monkeypatch, tmp_path: Path) -> None:
     body = res.json()
     assert body.get("error") == "branch_not_found"
     assert "does-not-exist" in body.get("detail", "")
+
+
+def test_logging_is_set_up_on_startup_not_on_create(monkeypatch, tmp_path: Path) -> None:
+    from gcc.server.app import create_app
+
+    log_dir = tmp_path / "logs"
+    monkeypatch.setenv("GCC_LOG_DIR", str(log_dir))
+    app_instance = create_app()
+    assert not log_dir.exists()
+
+    with TestClient(app_instance) as started:
+        assert started.get("/health").json()["status"] == "ok"
+    assert log_dir.is_dir()
+
+
+def test_default_app_is_built_once_on_first_access() -> None:
+    import gcc.server.app as app_module
+
+    assert app_module.app is app_module.get_app()
+    assert app_module.app is app
+
+
+def test_endpoints_render_json_with_orjson(monkeypatch, tmp_path: Path) -> None:
+    _set_data_root(monkeypatch, tmp_path)
+    res = client.post("/init", json={"goal": "ünï", "session_id": "orjson-render"})
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    import orjson
+
+    # Compact orjson output rather than the stdlib encoder's ", " separators.
+    assert res.content == orjson.dumps(res.json())
@@ -3,7 +3,11 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
-from gcc.core import commands
+import pytest
+
+from gcc.core import commands, git_ops
+from gcc.core.exceptions import BranchNotFoundError
+from gcc.core.git_ops import checkout_branch
 from gcc.core.storage import session_root
 
 
@@ -41,3 +45,42 @@ def test_existing_branch_checkout_does_not_reset_pointer(tmp_path: Path) -> None
     # beta pointer should stay unchanged while switching back to alpha.
     assert _git(repo_root, "rev-parse", "beta") == beta_after_first_commit
     assert _git(repo_root, "rev-parse", "alpha") != alpha_after_first_commit
+
+
+def test_checkout_of_current_branch_skips_git(tmp_path: Path) -> None:
+    session_id = "checkout-noop"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "alpha", "alpha purpose", session_id)
+
+    repo_root = session_root(tmp_path, session_id)
+    git_log = repo_root / "git.log"
+    before = git_log.read_text(encoding="utf-8")
+
+    checkout_branch(repo_root, "alpha")
+    assert git_log.read_text(encoding="utf-8") == before
+    assert _git(repo_root, "rev-parse", "--abbrev-ref", "HEAD") == "alpha"
+
+
+def test_log_on_missing_branch_lists_available(tmp_path: Path) -> None:
+    session_id = "missing-branch"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "alpha", "alpha purpose", session_id)
+
+    with pytest.raises(BranchNotFoundError) as info:
+        commands.log(tmp_path, "ghost", ["entry"], session_id)
+    assert info.value.details == {"branch": "ghost", "available_branches": ["alpha"]}
+
+
+def test_head_probes_read_ref_files(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    _git(repo_root, "init", "-b", "main")
+    assert not git_ops._has_head_commit(repo_root)
+
+    git_ops.ensure_repo(repo_root)
+    assert git_ops._has_head_commit(repo_root)
+    assert git_ops.current_branch(repo_root) == "main"
+
+    _git(repo_root, "pack-refs", "--all")
+    assert not (repo_root / ".git" / "refs" / "heads" / "main").exists()
+    assert git_ops._has_head_commit(repo_root)
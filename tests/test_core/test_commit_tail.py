@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from gcc.core import commands, storage
+
+
+def test_commits_tail_matches_full_parse(tmp_path: Path) -> None:
+    session_id = "commit-tail"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    for i in range(12):
+        commands.commit(tmp_path, "main", f"work {i}", None, None, None, None, session_id)
+
+    full = storage._parse_commits(
+        storage.commit_path(tmp_path, session_id, "main").read_text(encoding="utf-8")
+    )
+    tail = storage._parse_commits(storage.read_commits_tail(tmp_path, session_id, "main", 10))
+    assert tail == full[-10:]
+
+    ctx = commands.context(tmp_path, "main", None, None, None, session_id)
+    assert ctx["branch"]["recent_commits"] == [c["commit_id"] for c in full[-10:]]
+    assert ctx["branch"]["latest_summary"] == "work 11"
+
+
+def test_commits_tail_without_commits(tmp_path: Path) -> None:
+    session_id = "commit-tail-empty"
+    commands.init(tmp_path, "goal", [], session_id)
+    storage.ensure_branch(tmp_path, session_id, "empty", "purpose")
+    assert storage.read_commits_tail(tmp_path, session_id, "empty", 10) == ""
+
+
+def test_commit_ids_match_full_parse() -> None:
+    text = "\n".join(
+        [
+            "# Branch: main",
+            storage.COMMIT_SEPARATOR,
+            "Commit ID: aaaa1111",
+            "This Commit's Contribution:",
+            "first",
+            storage.COMMIT_SEPARATOR,
+            "Timestamp: 2024-01-01T00:00:00Z",
+            storage.COMMIT_SEPARATOR,
+            "Commit ID:   bbbb2222  ",
+            "This Commit's Contribution:",
+            "last",
+            "",
+        ]
+    )
+    parsed = storage._parse_commits(text)
+    assert storage._commit_ids(text) == [c.get("commit_id") for c in parsed]
+    assert storage._parse_last_commit(text) == parsed[-1]
+    assert storage._parse_last_commit("# Branch: main\n") == {}
+
+
+def test_context_commit_entry_for_recent_and_old_commits(tmp_path: Path) -> None:
+    session_id = "commit-tail-entry"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    ids = [
+        commands.commit(tmp_path, "main", f"work {i}", None, None, None, None, session_id)["commit_id"]
+        for i in range(12)
+    ]
+
+    for commit_id in (ids[0], ids[-1]):
+        ctx = commands.context(tmp_path, "main", commit_id, None, None, session_id)
+        assert ctx["commit_entry"] == storage.get_commit_entry(tmp_path, session_id, "main", commit_id)
+        assert f"Commit ID: {commit_id}" in ctx["commit_entry"]
+
+
+def test_log_tail_matches_full_read(tmp_path: Path, monkeypatch) -> None:
+    session_id = "log-tail"
+    storage.ensure_branch(tmp_path, session_id, "main", "purpose")
+    path = storage.log_path(tmp_path, session_id, "main")
+    monkeypatch.setattr(storage, "LOG_TAIL_BLOCK", 7)
+
+    samples = [
+        "",
+        "single",
+        "a\nb\nc\n",
+        "a\r\nb\r\nc",
+        "\n\n\nü line\nlast line without newline",
+        "".join(f"line {i} é\n" for i in range(40)),
+    ]
+    for text in samples:
+        path.write_bytes(text.encode("utf-8"))
+        for tail in (0, 1, 2, 3, 10, 100):
+            expected = path.read_text(encoding="utf-8").splitlines()[-tail:] if tail > 0 else []
+            assert storage.read_log_tail(tmp_path, session_id, "main", tail) == expected
+
+    path.unlink()
+    assert storage.read_log_tail(tmp_path, session_id, "main", 5) == []
+
+
+def test_find_commit_entry_matches_split_semantics() -> None:
+    sep = storage.COMMIT_SEPARATOR
+
+    def _reference(text: str, commit_id: str):
+        if sep not in text:
+            return None
+        for part in text.split(sep)[1:]:
+            if f"Commit ID: {commit_id}" in part:
+                return sep + part
+        return None
+
+    text = (
+        "# Branch: main\n# Purpose: mentions Commit ID: aaaa1111\n\n"
+        f"{sep}\nCommit ID: aaaa1111\nbody one\n"
+        f"{sep}\nCommit ID: bbbb2222\nbody two\n"
+        f"{sep}\nCommit ID: cccc3333\nbody three\n"
+    )
+    for commit_id in ["aaaa1111", "bbbb2222", "cccc3333", "bbbb", "cccc3333\nbody", "missing", ""]:
+        assert storage._find_commit_entry(text, commit_id) == _reference(text, commit_id)
+    assert storage._find_commit_entry("Commit ID: aaaa1111\n", "aaaa1111") is None
+
+
+def test_summarize_commits_tail(tmp_path: Path) -> None:
+    session_id = "commit-summary"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    for i in range(3):
+        commands.commit(tmp_path, "main", f"work {i}", None, None, None, None, session_id)
+
+    tail_text = storage.read_commits_tail(tmp_path, session_id, "main", 10)
+    ids = storage._commit_ids(tail_text)
+    summary = storage.summarize_commits_tail(tail_text, ids[1])
+    assert summary["latest_commit"] == ids[-1]
+    assert summary["latest_summary"] == "work 2"
+    assert summary["recent_commits"] == ids
+    assert storage._commit_ids(summary["commit_entry"]) == [ids[1]]
+
+    assert storage.summarize_commits_tail(tail_text, "missing")["commit_entry"] is None
+    assert storage.summarize_commits_tail("")["latest_commit"] is None
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gcc.core import git_ops, storage
+from gcc.core.exceptions import RepositoryError
+
+
+def test_ensure_gcc_skips_work_once_session_is_ensured(tmp_path: Path) -> None:
+    session_id = "ensure-cache"
+    storage.ensure_gcc(tmp_path, "goal", None, session_id)
+    main = storage.main_path(tmp_path, session_id)
+    main.unlink()
+
+    storage.ensure_gcc(tmp_path, "goal", None, session_id)
+    assert not main.exists()
+
+    storage.forget_ensured(tmp_path, session_id)
+    storage.ensure_gcc(tmp_path, "goal", None, session_id)
+    assert main.exists()
+
+
+def test_hard_reset_forgets_ensured_repo(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    assert str(repo_root) in git_ops._ensured_repos
+
+    git_ops.git_reset(repo_root, "HEAD", "hard")
+    assert str(repo_root) not in git_ops._ensured_repos
+
+
+def test_failure_in_removed_repo_forgets_it(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    shutil.rmtree(repo_root / ".git")
+
+    with pytest.raises(RepositoryError):
+        git_ops._run_git(["rev-parse", "HEAD"], repo_root)
+    assert str(repo_root) not in git_ops._ensured_repos
+
+    git_ops.ensure_repo(repo_root)
+    assert (repo_root / ".git").is_dir()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from gcc.core.exceptions import BranchNotFoundError, StorageError, ValidationError
+
+
+def test_details_are_built_lazily_with_original_keys() -> None:
+    exc = BranchNotFoundError("feature", available=["main"])
+    assert "details" not in vars(exc)
+    assert exc.details == {"branch": "feature", "available_branches": ["main"]}
+    assert exc.to_dict() is exc.to_dict()
+
+    storage_exc = StorageError("boom", path="p", details={"a": 1}, extra="x")
+    assert storage_exc.details == {"a": 1, "path": "p", "extra": "x"}
+
+    assert ValidationError("bad", field="name").details == {"field": "name"}
+
+
+def test_to_dict_reflects_reassigned_details() -> None:
+    exc = ValidationError("bad", field="name")
+    first = exc.to_dict()
+    exc.details = {"field": "other"}
+    assert exc.to_dict()["details"] == {"field": "other"}
+    assert first["details"] == {"field": "name"}
+
+
+def test_branch_not_found_resolves_available_lazily() -> None:
+    calls = []
+
+    def _available() -> list:
+        calls.append(1)
+        return ["main"]
+
+    exc = BranchNotFoundError("feature", available=_available)
+    assert calls == []
+    assert exc.details["available_branches"] == ["main"]
+    assert exc.details["available_branches"] == ["main"]
+    assert calls == [1]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import subprocess
+from dataclasses import replace
+
+import pytest
+
+from gcc.core import git_ops
+from gcc.core.exceptions import RepositoryError, ValidationError
+from gcc.core.validators import Validators
+from gcc.server import config as server_config
+
+
+def test_set_config_refreshes_cached_git_config() -> None:
+    original = server_config.get_config()
+    try:
+        assert git_ops._get_git_config() is git_ops._get_git_config()
+
+        updated = replace(original, git=replace(original.git, default_name="Someone Else"))
+        server_config.set_config(updated)
+        assert git_ops._get_git_config().default_name == "Someone Else"
+    finally:
+        server_config.set_config(original)
+    assert git_ops._get_git_config() is original.git
+
+
+def test_set_config_refreshes_cached_security_config() -> None:
+    original = server_config.get_config()
+    try:
+        assert Validators.validate_limit(500) == 500
+
+        updated = replace(original, security=replace(original.security, max_limit=100))
+        server_config.set_config(updated)
+        with pytest.raises(ValidationError):
+            Validators.validate_limit(500)
+    finally:
+        server_config.set_config(original)
+    assert Validators.validate_limit(500) == 500
+
+
+def test_ensure_repo_reads_config_once(tmp_path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+
+    log_text = (repo_root / "git.log").read_text(encoding="utf-8")
+    assert log_text.count("config --list -z") == 1
+    assert "config --get" not in log_text
+
+    values = git_ops._read_all_config(repo_root)
+    assert values["user.name"]
+    assert values["user.email"]
+
+
+def test_git_timeout_surfaces_as_repository_error(tmp_path, monkeypatch) -> None:
+    seen = {}
+
+    def _hang(cmd, **kwargs):
+        seen["timeout"] = kwargs["timeout"]
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(git_ops.subprocess, "run", _hang)
+    with pytest.raises(RepositoryError, match="timed out"):
+        git_ops._run_git(["status"], tmp_path)
+    assert seen["timeout"] == git_ops._get_git_config().command_timeout
+    entry = (tmp_path / "git.log").read_text(encoding="utf-8")
+    assert "git status\nexit=timeout\n" in entry
+    assert "timed out after" in entry
+
+
+def test_from_env_caches_parsed_values(monkeypatch) -> None:
+    server_config.reset_env_cache()
+    monkeypatch.setenv("GCC_MAX_LIMIT", "250")
+    try:
+        assert server_config.SecurityConfig.from_env().max_limit == 250
+
+        monkeypatch.setenv("GCC_MAX_LIMIT", "300")
+        assert server_config.SecurityConfig.from_env().max_limit == 250
+
+        server_config.reset_env_cache()
+        assert server_config.SecurityConfig.from_env().max_limit == 300
+    finally:
+        monkeypatch.delenv("GCC_MAX_LIMIT")
+        server_config.reset_env_cache()
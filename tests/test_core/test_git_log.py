@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gcc.core import git_ops
+from gcc.core.exceptions import RepositoryError
+
+
+def test_git_log_reuses_descriptor_and_follows_replacement(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    log_path = repo_root / "git.log"
+
+    git_ops._run_git(["status"], repo_root)
+    fd = git_ops._git_log_fds[str(log_path)][0]
+    git_ops._run_git(["status"], repo_root)
+    assert git_ops._git_log_fds[str(log_path)][0] == fd
+
+    log_path.unlink()
+    git_ops._run_git(["rev-parse", "HEAD"], repo_root)
+    text = log_path.read_text(encoding="utf-8")
+    assert text.startswith("[")
+    assert "git rev-parse HEAD" in text
+    assert "git status" not in text
+
+
+def test_git_log_entry_layout(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    log_path = repo_root / "git.log"
+    before = log_path.read_text(encoding="utf-8")
+
+    head = git_ops._run_git(["rev-parse", "HEAD"], repo_root).stdout.strip()
+    with_err = git_ops._try_git(["rev-parse", "--verify", "missing-ref"], repo_root)
+    assert with_err is None
+
+    entries = log_path.read_text(encoding="utf-8")[len(before):].split("\n\n")
+    assert entries[0].split("\n")[1:] == ["exit=0", "stdout:", head]
+    assert entries[1].split("\n")[1:3] == ["exit=128", "stderr:"]
+
+
+def test_git_command_uses_resolved_binary(tmp_path: Path) -> None:
+    argv = git_ops._git_command(["status"], tmp_path, read_only=True)
+    assert argv[0] == git_ops._GIT_BIN
+    assert Path(argv[0]).is_absolute()
+    assert argv[1:] == ["-C", str(tmp_path), "--no-optional-locks", "status"]
+
+
+def test_in_process_log_walk_matches_git_log(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+
+    def _commit(message: str, date: str) -> None:
+        env = {**os.environ, "GIT_COMMITTER_DATE": date, "GIT_AUTHOR_DATE": date}
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-q", "-m", message],
+            cwd=str(repo_root), env=env, check=True,
+        )
+
+    def _git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=str(repo_root), check=True, capture_output=True)
+
+    base = git_ops.current_branch(repo_root)
+    _commit("base", "1700000000 +0000")
+    _git("checkout", "-q", "-b", "side")
+    _commit("side one", "1700000100 +0000")
+    _commit("side two\n\nbody text", "1700000100 +0000")
+    _git("checkout", "-q", base)
+    _commit("main one\nwrapped subject", "1700000100 +0000")
+    env = {**os.environ, "GIT_COMMITTER_DATE": "1700000200 +0000"}
+    subprocess.run(
+        ["git", "merge", "-q", "--no-ff", "side", "-m", "merge side"],
+        cwd=str(repo_root), env=env, check=True,
+    )
+
+    expected = list(git_ops._stream_git_log(repo_root, 50))
+    assert git_ops.git_log(repo_root, 50) == expected
+    assert git_ops.git_log(repo_root, 3) == expected[:3]
+    assert any(entry["subject"] == "main one wrapped subject" for entry in expected)
+
+
+def test_log_of_empty_repository_reports_git_error(tmp_path: Path) -> None:
+    repo_root = tmp_path / "empty"
+    subprocess.run(["git", "init", "-q", str(repo_root)], check=True)
+    with pytest.raises(RepositoryError):
+        git_ops.git_log(repo_root, 5)
+
+
+def test_log_walk_falls_back_to_git_log_when_cat_file_fails(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    for i in range(5):
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-q", "-m", f"c{i}"],
+            cwd=str(repo_root), check=True,
+        )
+    expected = list(git_ops._stream_git_log(repo_root, 10))
+
+    original = git_ops._read_commit
+    calls = []
+
+    def _flaky(root: Path, spec: str):
+        calls.append(spec)
+        if len(calls) == 3:
+            raise RepositoryError("git cat-file --batch failed: process was closed")
+        return original(root, spec)
+
+    monkeypatch.setattr(git_ops, "_read_commit", _flaky)
+    assert git_ops.git_log(repo_root, 10) == expected
+
+
+def test_evicted_cat_file_process_is_replaced_on_next_read(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    batch = git_ops._cat_file(repo_root)
+    # As LRU eviction on another thread would do after this one got it.
+    batch.close()
+    batch.close()
+    with pytest.raises(RepositoryError, match="closed"):
+        batch.read_object("HEAD")
+
+    assert git_ops._read_object(repo_root, "HEAD")[1] == "commit"
+    assert git_ops._cat_file(repo_root) is not batch
+
+
+def test_log_walk_records_cat_file_even_when_stopped_early(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    git_ops.ensure_repo(repo_root)
+    for i in range(3):
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-q", "-m", f"c{i}"],
+            cwd=str(repo_root), check=True,
+        )
+    log_path = repo_root / "git.log"
+    before = log_path.read_text(encoding="utf-8")
+
+    walk = git_ops.git_log_iter(repo_root, 10)
+    next(walk)
+    walk.close()
+
+    new_log = log_path.read_text(encoding="utf-8")[len(before):]
+    assert "git cat-file --batch\nexit=0\nstdout:\n<1 commits walked>\n" in new_log
+    assert "log -n" not in new_log
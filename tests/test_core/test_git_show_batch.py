@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from gcc.core import commands, git_ops
+from gcc.core.storage import session_root
+
+
+def test_show_reads_blobs_through_persistent_cat_file(tmp_path: Path) -> None:
+    session_id = "show-batch"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+
+    first = commands.show(tmp_path, "HEAD", "main.md", session_id)["content"]
+    assert "GCC Roadmap" in first
+
+    repo_root = session_root(tmp_path, session_id)
+    batch = git_ops._cat_file(repo_root)
+
+    commands.commit(tmp_path, "main", "work", None, None, None, "milestone reached", session_id)
+    second = commands.show(tmp_path, "HEAD", "main.md", session_id)["content"]
+
+    # Same process answers both lookups and sees the new commit.
+    assert git_ops._cat_file(repo_root) is batch
+    assert "milestone reached" in second
+    assert "milestone reached" not in first
+
+
+def test_show_falls_back_to_git_show_for_trees(tmp_path: Path) -> None:
+    session_id = "show-tree"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+
+    content = commands.show(tmp_path, "HEAD", "branches", session_id)["content"]
+    assert content.startswith("tree HEAD:branches")
+    assert "main/" in content
+
+
+def test_show_respawns_dead_cat_file_process(tmp_path: Path) -> None:
+    session_id = "show-respawn"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    commands.show(tmp_path, "HEAD", "main.md", session_id)
+
+    repo_root = session_root(tmp_path, session_id)
+    batch = git_ops._cat_file(repo_root)
+    batch._proc.kill()
+    batch._proc.wait()
+
+    content = commands.show(tmp_path, "HEAD", "main.md", session_id)["content"]
+    assert "GCC Roadmap" in content
+    assert git_ops._cat_file(repo_root) is not batch
+
+
+def test_show_and_diff_return_raw_bytes(tmp_path: Path) -> None:
+    session_id = "show-bytes"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    repo_root = session_root(tmp_path, session_id)
+
+    (repo_root / "blob.bin").write_bytes(b"\xff\x00raw")
+    git_ops.add_and_commit(repo_root, [repo_root / "blob.bin"], "binary")
+
+    assert git_ops.git_show(repo_root, "HEAD", "blob.bin") == b"\xff\x00raw"
+    assert isinstance(git_ops.git_diff(repo_root, "HEAD~1", "HEAD"), bytes)
+    assert commands.show(tmp_path, "HEAD", "blob.bin", session_id)["content"] == "�\x00raw"
+
+    log_text = (repo_root / "git.log").read_text(encoding="utf-8")
+    assert "stdout: <" in log_text
+
+
+def test_git_log_iter_streams_and_stops_early(tmp_path: Path) -> None:
+    session_id = "log-stream"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    commands.commit(tmp_path, "main", "a | pipe in subject", None, None, None, None, session_id)
+    repo_root = session_root(tmp_path, session_id)
+
+    entries = git_ops.git_log(repo_root, 10)
+    assert len(entries) >= 3
+    assert all(len(entry["hash"]) == 40 for entry in entries)
+    assert "a | pipe in subject" in entries[0]["subject"]
+
+    stream = git_ops.git_log_iter(repo_root, 10)
+    assert next(stream) == entries[0]
+    stream.close()
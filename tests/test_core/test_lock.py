@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gcc.core import lock
+from gcc.core.exceptions import LockError
+from gcc.core.lock import file_lock
+
+posix_only = pytest.mark.skipif(lock.fcntl is None, reason="requires fcntl")
+
+
+@posix_only
+def test_shared_locks_do_not_block_each_other(tmp_path: Path) -> None:
+    lock_path = tmp_path / ".lock"
+    with file_lock(lock_path, shared=True):
+        with file_lock(lock_path, timeout_s=0.2, shared=True):
+            pass
+
+
+@posix_only
+def test_exclusive_lock_waits_for_shared_holder(tmp_path: Path) -> None:
+    lock_path = tmp_path / ".lock"
+    with file_lock(lock_path, shared=True):
+        with pytest.raises(LockError):
+            with file_lock(lock_path, timeout_s=0.2, poll_s=0.05):
+                pass
+
+    # Released shared lock lets the writer in.
+    with file_lock(lock_path, timeout_s=0.2):
+        pass
+
+
+@posix_only
+def test_waiter_picks_up_released_lock_quickly(tmp_path: Path) -> None:
+    lock_path = tmp_path / ".lock"
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def _hold() -> None:
+        with file_lock(lock_path):
+            acquired.set()
+            release.wait()
+
+    holder = threading.Thread(target=_hold)
+    holder.start()
+    acquired.wait()
+    threading.Timer(0.05, release.set).start()
+
+    start = time.monotonic()
+    with file_lock(lock_path, timeout_s=2.0):
+        waited = time.monotonic() - start
+    holder.join()
+    # The first retries are a few milliseconds apart, so the waiter does
+    # not sit out a whole fixed poll interval after the release.
+    assert waited < 0.5
+
+
+def test_lock_creates_missing_parent_directory(tmp_path: Path) -> None:
+    lock_path = tmp_path / "nested" / "dir" / ".lock"
+    with file_lock(lock_path):
+        assert lock_path.exists()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from gcc.core import storage
+
+
+def test_read_metadata_returns_independent_copies(tmp_path: Path) -> None:
+    session_id = "metadata-cache"
+    storage.ensure_gcc(tmp_path, None, None, session_id)
+    storage.ensure_branch(tmp_path, session_id, "main", "purpose")
+
+    first = storage.read_metadata(tmp_path, session_id, "main")
+    first["file_structure"]["added"] = "x"
+    assert storage.read_metadata(tmp_path, session_id, "main") == {"file_structure": {}, "env_config": {}}
+
+
+def test_read_metadata_sees_rewrites(tmp_path: Path) -> None:
+    session_id = "metadata-rewrite"
+    storage.ensure_gcc(tmp_path, None, None, session_id)
+    storage.ensure_branch(tmp_path, session_id, "main", "purpose")
+
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "active"})
+    assert storage.read_metadata(tmp_path, session_id, "main")["status"] == "active"
+    # Same size and likely the same mtime tick as the previous write.
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "paused"})
+    assert storage.read_metadata(tmp_path, session_id, "main")["status"] == "paused"
+
+
+def test_update_metadata_primes_cache(tmp_path: Path, monkeypatch) -> None:
+    session_id = "metadata-prime"
+    storage.ensure_gcc(tmp_path, None, None, session_id)
+    storage.ensure_branch(tmp_path, session_id, "main", "purpose")
+
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "active"})
+    with storage.StagedWrite() as staged:
+        storage.update_metadata(tmp_path, session_id, "main", {"owner": "me"}, staged)
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError("metadata was parsed again")
+
+    monkeypatch.setattr(storage.yaml, "load", _no_parse)
+    data = storage.read_metadata(tmp_path, session_id, "main")
+    assert data["status"] == "active"
+    assert data["owner"] == "me"
+
+
+def test_update_metadata_skips_identical_rewrite(tmp_path: Path) -> None:
+    session_id = "metadata-noop"
+    storage.ensure_gcc(tmp_path, None, None, session_id)
+    storage.ensure_branch(tmp_path, session_id, "main", "purpose")
+    path = storage.metadata_path(tmp_path, session_id, "main")
+
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "active"})
+    inode = path.stat().st_ino
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "active"})
+    with storage.StagedWrite() as staged:
+        storage.update_metadata(tmp_path, session_id, "main", {"status": "active"}, staged)
+        assert staged.paths == []
+    assert path.stat().st_ino == inode
+
+    storage.update_metadata(tmp_path, session_id, "main", {"status": "paused"})
+    assert path.stat().st_ino != inode
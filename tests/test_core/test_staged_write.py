@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gcc.core import commands, storage
+from gcc.core.exceptions import RepositoryError, StorageError
+from gcc.core.git_ops import add_and_commit, ensure_repo
+from gcc.core.storage import StagedWrite, session_root
+
+
+def test_staged_write_defers_until_exit(tmp_path: Path) -> None:
+    target = tmp_path / "notes.md"
+    target.write_text("base\n", encoding="utf-8")
+
+    with StagedWrite() as staged:
+        staged.append_text(target, "one\n")
+        staged.append_text(target, "two\n")
+        assert target.read_text(encoding="utf-8") == "base\n"
+        assert staged.read_text(target) == "base\none\ntwo\n"
+        assert staged.paths == [target]
+
+    assert target.read_text(encoding="utf-8") == "base\none\ntwo\n"
+
+
+def test_staged_write_discards_changes_on_error(tmp_path: Path) -> None:
+    target = tmp_path / "notes.md"
+    try:
+        with StagedWrite() as staged:
+            staged.write_text(target, "never written\n")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert not target.exists()
+
+
+def test_commit_with_all_updates_creates_single_git_commit(tmp_path: Path) -> None:
+    session_id = "staged-commit"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    repo_root = session_root(tmp_path, session_id)
+
+    def _count() -> int:
+        result = subprocess.run(
+            ["git", "rev-list", "--count", "HEAD"],
+            cwd=str(repo_root),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return int(result.stdout.strip())
+
+    before = _count()
+    commands.commit(
+        tmp_path,
+        "main",
+        "work",
+        None,
+        ["step one"],
+        {"status": "active"},
+        "roadmap update",
+        session_id,
+    )
+
+    assert _count() == before + 1
+    assert storage.read_metadata(tmp_path, session_id, "main")["status"] == "active"
+    assert "roadmap update" in storage.read_main(tmp_path, session_id)
+    assert "step one" in storage.log_path(tmp_path, session_id, "main").read_text(encoding="utf-8")
+
+
+def test_staged_write_skips_unchanged_rewrite(tmp_path: Path) -> None:
+    target = tmp_path / "metadata.yaml"
+    target.write_text("status: active\n", encoding="utf-8")
+    before = target.stat().st_ino
+
+    with StagedWrite() as staged:
+        staged.write_text(target, staged.read_text(target))
+
+    # No tmp+rename happened, so the inode is untouched.
+    assert target.stat().st_ino == before
+
+
+def test_merge_appends_source_commit_and_log_verbatim(tmp_path: Path) -> None:
+    session_id = "staged-merge"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "feature", "feature purpose", session_id)
+    commands.commit(tmp_path, "feature", "feature work", None, ["tried ü"], None, None, session_id)
+
+    source_commit = storage.commit_path(tmp_path, session_id, "feature").read_text(encoding="utf-8")
+    source_log = storage.log_path(tmp_path, session_id, "feature").read_text(encoding="utf-8")
+
+    commands.merge(tmp_path, "feature", "release", "merged", session_id)
+
+    merged_commit = storage.commit_path(tmp_path, session_id, "release").read_text(encoding="utf-8")
+    assert merged_commit.startswith("# Branch: release\n")
+    assert merged_commit.endswith("\n" + source_commit)
+    assert storage.log_path(tmp_path, session_id, "release").read_text(encoding="utf-8") == (
+        "\n== Merge from feature ==\n" + source_log + "\n"
+    )
+
+
+def test_append_file_is_visible_through_read_text(tmp_path: Path) -> None:
+    source = tmp_path / "source.md"
+    source.write_text("copied\n", encoding="utf-8")
+    target = tmp_path / "target.md"
+
+    with StagedWrite() as staged:
+        staged.append_text(target, "head\n")
+        staged.append_file(target, source)
+        assert staged.read_text(target) == "head\ncopied\n"
+
+    assert target.read_text(encoding="utf-8") == "head\ncopied\n"
+
+
+def test_parallel_flush_writes_every_file_and_reraises(tmp_path: Path) -> None:
+    first = tmp_path / "a.md"
+    second = tmp_path / "b.md"
+    with StagedWrite() as staged:
+        staged.append_text(first, "a\n")
+        staged.write_text(second, "b\n")
+    assert first.read_text(encoding="utf-8") == "a\n"
+    assert second.read_text(encoding="utf-8") == "b\n"
+
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    staged = StagedWrite()
+    staged.append_text(first, "again\n")
+    staged.write_text(blocker / "child.md", "unreachable\n")
+    with pytest.raises(StorageError):
+        staged.flush()
+    assert first.read_text(encoding="utf-8") == "a\nagain\n"
+
+
+def test_commit_stages_only_changed_files(tmp_path: Path) -> None:
+    session_id = "staged-changed"
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    repo_root = session_root(tmp_path, session_id)
+    git_log = repo_root / "git.log"
+    before = git_log.read_text(encoding="utf-8")
+
+    commands.commit(tmp_path, "main", "plain", None, None, None, None, session_id)
+
+    new_log = git_log.read_text(encoding="utf-8")[len(before):]
+    assert "add --pathspec-from-file=-" in new_log
+
+    files = subprocess.run(
+        ["git", "show", "--name-only", "--pretty=format:", "HEAD"],
+        cwd=str(repo_root),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert files == ["branches/main/commit.md"]
+
+
+def test_add_and_commit_without_changes_is_a_no_op(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    ensure_repo(repo_root)
+    tracked = repo_root / "notes.md"
+    tracked.write_text("x\n", encoding="utf-8")
+    add_and_commit(repo_root, [tracked], "first")
+    add_and_commit(repo_root, [tracked], "again")
+
+    log_text = (repo_root / "git.log").read_text(encoding="utf-8")
+    assert log_text.count("diff --cached --quiet") == 1
+
+
+def test_add_and_commit_rejects_paths_outside_repo(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    ensure_repo(repo_root)
+    outside = tmp_path / "elsewhere.md"
+    outside.write_text("x\n", encoding="utf-8")
+
+    with pytest.raises(RepositoryError, match="not under repository root"):
+        add_and_commit(repo_root, [outside], "escape")
+    with pytest.raises(RepositoryError, match="not under repository root"):
+        add_and_commit(repo_root, [repo_root / ".." / "elsewhere.md"], "escape")
+
+
+def test_add_and_commit_handles_unusual_file_names(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    ensure_repo(repo_root)
+    odd = repo_root / '"leading quote" and\ttab.md'
+    odd.write_text("x\n", encoding="utf-8")
+
+    add_and_commit(repo_root, [odd], "odd name")
+
+    files = subprocess.run(
+        ["git", "-c", "core.quotePath=false", "show", "-z", "--name-only", "--pretty=format:", "HEAD"],
+        cwd=str(repo_root),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip("\n\0").split("\0")
+    assert files == [odd.name]
+
+
+def test_write_text_leaves_no_temp_files(tmp_path: Path, monkeypatch) -> None:
+    target = tmp_path / "main.md"
+    storage._write_text(target, "first\n")
+    storage._write_text(target, "second\n")
+    assert [p.name for p in tmp_path.iterdir()] == ["main.md"]
+
+    def _fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage.os, "fsync", _fail)
+    with pytest.raises(StorageError):
+        storage._write_text(target, "third\n")
+    assert target.read_text(encoding="utf-8") == "second\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["main.md"]
+
+
+def test_update_main_appends_with_rewrite_semantics(tmp_path: Path) -> None:
+    session_id = "main-append"
+    storage.ensure_gcc(tmp_path, "goal", None, session_id)
+    path = storage.main_path(tmp_path, session_id)
+
+    for initial in ["", "roadmap\n", "roadmap\n\n\n", "roadmap", "roadmap  \n", "roadmap ü\n"]:
+        expected = (initial.rstrip() + "\n\n" if initial else "") + "next step\n"
+        for staged in (None, StagedWrite()):
+            path.write_text(initial, encoding="utf-8", newline="")
+            storage.update_main(tmp_path, session_id, "  next step \n", staged)
+            if staged is not None:
+                staged.flush()
+            assert path.read_text(encoding="utf-8") == expected
+
+    path.write_text("roadmap\n", encoding="utf-8")
+    inode = path.stat().st_ino
+    storage.update_main(tmp_path, session_id, "more", None)
+    # Appended in place rather than replaced through a temp file.
+    assert path.stat().st_ino == inode
+
+
+def test_read_utf8_matches_read_text(tmp_path: Path) -> None:
+    target = tmp_path / "text.md"
+    for raw in [b"", b"plain\n", b"crlf\r\nlines\r\n", b"lone\rcr", "ünï\r\n".encode("utf-8")]:
+        target.write_bytes(raw)
+        assert storage._read_utf8(target) == target.read_text(encoding="utf-8")
+
+
+def test_writes_create_missing_parent_directories(tmp_path: Path) -> None:
+    written = tmp_path / "a" / "b" / "metadata.yaml"
+    appended = tmp_path / "c" / "log.md"
+    with StagedWrite() as staged:
+        staged.write_text(written, "x: 1\n")
+        staged.append_text(appended, "entry\n")
+    assert written.read_text(encoding="utf-8") == "x: 1\n"
+    assert appended.read_text(encoding="utf-8") == "entry\n"
+
+
+def test_parallel_flush_raises_only_after_all_writes_finish(tmp_path: Path, monkeypatch) -> None:
+    import time
+
+    failing = tmp_path / "fail.md"
+    slow = tmp_path / "slow.md"
+    original = storage._write_text
+
+    def _write(path: Path, content: str) -> None:
+        if path == failing:
+            raise StorageError("disk full")
+        time.sleep(0.2)
+        original(path, content)
+
+    monkeypatch.setattr(storage, "_write_text", _write)
+    staged = StagedWrite()
+    staged.write_text(failing, "x\n")
+    staged.write_text(slow, "y\n")
+    with pytest.raises(StorageError, match="disk full"):
+        staged.flush()
+    assert slow.read_text(encoding="utf-8") == "y\n"
+
+
+def _merge_main_into_main(tmp_path: Path, session_id: str) -> None:
+    commands.init(tmp_path, "goal", [], session_id)
+    commands.branch(tmp_path, "main", "main purpose", session_id)
+    commands.commit(tmp_path, "main", "main work", None, ["tried ü"], None, None, session_id)
+
+    commit_path = storage.commit_path(tmp_path, session_id, "main")
+    log_path = storage.log_path(tmp_path, session_id, "main")
+    original_commit = commit_path.read_text(encoding="utf-8")
+    original_log = log_path.read_text(encoding="utf-8")
+
+    commands.merge(tmp_path, "main", None, "merged", session_id)
+
+    assert commit_path.read_text(encoding="utf-8") == original_commit + "\n" + original_commit
+    assert log_path.read_text(encoding="utf-8") == (
+        original_log + "\n== Merge from main ==\n" + original_log + "\n"
+    )
+
+
+def test_merge_branch_into_itself_copies_original_bytes(tmp_path: Path) -> None:
+    _merge_main_into_main(tmp_path, "self-merge")
+
+
+def test_merge_branch_into_itself_without_copy_file_range(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delattr(storage.os, "copy_file_range", raising=False)
+    _merge_main_into_main(tmp_path, "self-merge-fallback")
@@ -3,7 +3,7 @@ from pathlib import Path
 import json
 import pytest
 
-from gcc.logging.audit import AuditLogger, log_operation, get_audit_logger
+from gcc.logging.audit import AuditLogger, log_operation, get_audit_logger, reset_audit_logger
 
 
 def test_audit_logger_init(tmp_path: Path):
@@ -72,3 +72,170 @@ def test_log_operation_convenience():
         session_id="test",
         params={},
     )
+
+
+def test_audit_log_writes_utf8_lines(tmp_path: Path):
+    """Test non-ASCII params round-trip, one entry per line."""
+    audit = AuditLogger(tmp_path)
+    audit.log(action="a", session_id="s", user=None, params={"note": "ünï", "ids": [{1: "x"}]})
+    audit.log(action="b", session_id="s", user=None, params={})
+
+    lines = audit.log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["a", "b"]
+    assert json.loads(lines[0])["params"] == {"note": "ünï", "ids": [{"1": "x"}]}
+
+
+def test_buffered_audit_logger_batches_and_flushes(tmp_path: Path):
+    """Test background batching keeps order and flush() drains the queue."""
+    audit = AuditLogger(tmp_path, flush_interval_ms=50, buffer_size=4)
+    for i in range(10):
+        audit.log(action=f"op{i}", session_id="s", user=None, params={})
+    audit.flush()
+
+    lines = audit.log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in lines] == [f"op{i}" for i in range(10)]
+
+
+def test_audit_sanitize_matches_key_substrings(tmp_path: Path):
+    """Test redaction by key substring, case-insensitively and nested."""
+    audit = AuditLogger(tmp_path)
+    sanitized = audit._sanitize({
+        "GitHubToken": "abc",
+        "session_id": "s",
+        "author": {"name": "x"},
+        "retries": 3,
+        "note": "n" * 1200,
+        "nested": {"Password": "p", "count": 2},
+    })
+    assert sanitized["GitHubToken"] == "***REDACTED***"
+    assert sanitized["session_id"] == "s"
+    assert sanitized["author"] == {"name": "x"}
+    assert sanitized["retries"] == 3
+    assert sanitized["note"] == "n" * 1000 + "... (truncated)"
+    assert sanitized["nested"] == {"Password": "***REDACTED***", "count": 2}
+
+
+def test_audit_sanitize_returns_clean_params_unchanged(tmp_path: Path):
+    """Test clean params skip the copy and dirty ones are still copied."""
+    audit = AuditLogger(tmp_path)
+    clean = {"branch": "main", "limit": 5, "entries": ["a"]}
+    assert audit._sanitize(clean) is clean
+
+    dirty = {"branch": "main", "token": "t"}
+    assert audit._sanitize(dirty) == {"branch": "main", "token": "***REDACTED***"}
+    assert dirty["token"] == "t"
+
+
+def test_get_audit_logger_reads_environment_once(tmp_path: Path, monkeypatch):
+    """Test the resolved logger is reused until reset."""
+    monkeypatch.setenv("GCC_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("GCC_ENABLE_AUDIT_LOG", "false")
+    reset_audit_logger()
+    try:
+        assert get_audit_logger() is None
+        monkeypatch.setenv("GCC_ENABLE_AUDIT_LOG", "true")
+        assert get_audit_logger() is None
+
+        reset_audit_logger()
+        audit = get_audit_logger()
+        assert audit is not None and audit.log_dir == tmp_path
+        assert get_audit_logger() is audit
+    finally:
+        reset_audit_logger()
+
+
+def test_buffered_audit_logger_follows_replaced_file(tmp_path: Path):
+    """Test the worker's descriptor is reopened after audit.log is rotated."""
+    audit = AuditLogger(tmp_path, flush_interval_ms=10)
+    audit.log(action="before", session_id="s", user=None, params={})
+    audit.flush()
+    audit.log_path.rename(tmp_path / "audit.log.1")
+
+    audit.log(action="after", session_id="s", user=None, params={})
+    audit.flush()
+
+    assert [json.loads(line)["action"] for line in audit.log_path.read_text(encoding="utf-8").splitlines()] == ["after"]
+    rotated = (tmp_path / "audit.log.1").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in rotated] == ["before"]
+
+
+def test_audit_sanitize_handles_deep_and_shared_nesting(tmp_path: Path):
+    """Test nested dicts are sanitized at any depth without recursion."""
+    audit = AuditLogger(tmp_path)
+    deep = current = {}
+    for _ in range(2000):
+        current["next"] = {}
+        current = current["next"]
+    current["secret"] = "s"
+    shared = {"token": "t"}
+
+    sanitized = audit._sanitize({"deep": deep, "a": shared, "b": shared})
+    node = sanitized["deep"]
+    for _ in range(2000):
+        node = node["next"]
+    assert node == {"secret": "***REDACTED***"}
+    assert sanitized["a"] == sanitized["b"] == {"token": "***REDACTED***"}
+    assert shared == {"token": "t"}
+
+
+def test_get_audit_logger_concurrent_first_calls_share_one_logger(tmp_path: Path, monkeypatch):
+    """Test racing first lookups construct a single logger."""
+    import threading
+
+    monkeypatch.setenv("GCC_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("GCC_ENABLE_AUDIT_LOG", "true")
+    reset_audit_logger()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def _get():
+        barrier.wait()
+        results.append(get_audit_logger())
+
+    threads = [threading.Thread(target=_get) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results[0] is not None
+        assert all(logger is results[0] for logger in results)
+    finally:
+        reset_audit_logger()
+
+
+def test_audit_sanitize_still_catches_subclasses(tmp_path: Path):
+    """Test dict and str subclasses are sanitized like their bases."""
+    from collections import OrderedDict
+
+    class Text(str):
+        pass
+
+    audit = AuditLogger(tmp_path)
+    assert audit._sanitize({"meta": OrderedDict(token="t")}) == {"meta": {"token": "***REDACTED***"}}
+    assert audit._sanitize({"note": Text("n" * 1001)})["note"].endswith("... (truncated)")
+
+
+def test_reset_audit_logger_stops_batching_worker(tmp_path: Path, monkeypatch):
+    """Test reset closes the old logger's worker thread and descriptor."""
+    monkeypatch.setenv("GCC_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("GCC_ENABLE_AUDIT_LOG", "true")
+    monkeypatch.setenv("GCC_AUDIT_FLUSH_MS", "10")
+    reset_audit_logger()
+    try:
+        audit = get_audit_logger()
+        worker = audit._worker
+        audit.log(action="queued", session_id="s", user=None, params={})
+        reset_audit_logger()
+
+        assert not worker.is_alive()
+        assert audit._fd is None
+        lines = audit.log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["queued"]
+
+        # A closed logger still works, writing synchronously.
+        audit.log(action="late", session_id="s", user=None, params={})
+        audit.flush()
+        assert len(audit.log_path.read_text(encoding="utf-8").splitlines()) == 2
+    finally:
+        reset_audit_logger()
@@ -39,6 +39,47 @@ def test_logger_has_handlers(tmp_path: Path):
     # Should have file handler if log_dir provided
     assert len(logger.handlers) >= 2
     
-    # File handler should be RotatingFileHandler
-    from logging.handlers import RotatingFileHandler
-    assert any(isinstance(h, RotatingFileHandler) for h in logger.handlers)
+    # File handler should be RotatingFileHandler, fed through a queue
+    from logging.handlers import QueueHandler, RotatingFileHandler
+    assert any(isinstance(h, QueueHandler) for h in logger.handlers)
+    listener = GCCLogger._listeners["handler_test"]
+    assert any(isinstance(h, RotatingFileHandler) for h in listener.handlers)
+
+
+def test_concurrent_get_logger_attaches_handlers_once(tmp_path: Path):
+    """Test racing first calls share one logger with one set of handlers."""
+    import threading
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def _get():
+        barrier.wait()
+        results.append(GCCLogger.get_logger("racing", log_dir=tmp_path))
+
+    threads = [threading.Thread(target=_get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(logger is results[0] for logger in results)
+    assert len(results[0].handlers) == 2
+
+
+def test_file_handler_writes_in_background(tmp_path: Path):
+    """Test queued records, including tracebacks, reach gcc.log."""
+    logger = GCCLogger.get_logger("background_test", log_dir=tmp_path)
+
+    items = ["first"]
+    logger.info("value %s", items)
+    items.append("later")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+    GCCLogger._stop_listener("background_test")
+
+    text = (tmp_path / "gcc.log").read_text(encoding="utf-8")
+    assert "value ['first']" in text
+    assert "RuntimeError: boom" in text
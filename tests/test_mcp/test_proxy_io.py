@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import io
+import json
+
+import httpx
+import pytest
+
+from gcc.mcp import proxy
+
+
+def test_write_response_emits_one_utf8_json_line(capsysbinary) -> None:
+    proxy._write_response({"jsonrpc": "2.0", "id": 1, "result": {"text": "ünï"}})
+    out = capsysbinary.readouterr().out
+    assert out.endswith(b"\n") and out.count(b"\n") == 1
+    assert json.loads(out.decode("utf-8")) == {"jsonrpc": "2.0", "id": 1, "result": {"text": "ünï"}}
+
+
+def test_write_response_escapes_lone_surrogates(capsysbinary) -> None:
+    proxy._write_response({"id": 2, "result": "bad \ud800"})
+    out = capsysbinary.readouterr().out
+    assert json.loads(out.decode("ascii")) == {"id": 2, "result": "bad \ud800"}
+
+
+def test_post_reuses_one_client(monkeypatch) -> None:
+    seen = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["content-type"], json.loads(request.content)))
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(proxy, "_client", httpx.Client(transport=httpx.MockTransport(_handler)))
+    client = proxy._get_client()
+    assert proxy._post("/init", {"goal": "ü"}) == {"ok": True}
+    assert proxy._post("/log", {"entries": []}) == {"ok": True}
+    assert proxy._get_client() is client
+    assert seen == [
+        ("/init", "application/json", {"goal": "ü"}),
+        ("/log", "application/json", {"entries": []}),
+    ]
+
+
+def test_main_reads_requests_from_binary_stdin(monkeypatch, capsysbinary) -> None:
+    lines = [
+        b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\r\n',
+        b'{"jsonrpc": "2.0", "id": "list", "method": "tools/list"}\n',
+        b"\n",
+        b"not json\n",
+        '{"jsonrpc": "2.0", "id": 2, "method": "nope", "params": {"x": "ü"}}\n'.encode("utf-8"),
+        b'{"jsonrpc": "2.0", "id": 3, "method": "exit"}\n',
+    ]
+    monkeypatch.setattr(proxy.sys, "stdin", io.TextIOWrapper(io.BytesIO(b"".join(lines)), encoding="utf-8"))
+    proxy.main()
+
+    responses = [json.loads(line) for line in capsysbinary.readouterr().out.splitlines()]
+    assert [r["id"] for r in responses] == [1, "list", 2, 3]
+    assert responses[0]["result"] == {}
+    assert responses[1] == {"jsonrpc": "2.0", "id": "list", "result": {"tools": proxy.TOOLS}}
+    assert responses[2]["error"]["message"] == "Unsupported method: nope"
+
+
+def test_handle_tools_call_rejects_unknown_tool() -> None:
+    with pytest.raises(ValueError, match="Unknown tool: gcc_nope"):
+        proxy._handle_tools_call("gcc_nope", {})
+
+
+def test_main_dispatches_each_method(monkeypatch, capsysbinary) -> None:
+    monkeypatch.setattr(proxy, "_handle_tools_call", lambda name, arguments: {"tool": name, "args": arguments})
+    lines = [
+        b'{"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"protocolVersion": "2025-01-01"}}',
+        b'{"jsonrpc": "2.0", "method": "notifications/initialized"}',
+        b'{"jsonrpc": "2.0", "id": 2, "method": "resources/list"}',
+        b'{"jsonrpc": "2.0", "id": 3, "method": "prompts/list"}',
+        b'{"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {"name": "gcc_log", "arguments": {"a": 1}}}',
+        b'{"jsonrpc": "2.0", "id": 5, "method": "shutdown"}',
+        b'{"jsonrpc": "2.0", "id": 6, "method": "ping"}',
+    ]
+    monkeypatch.setattr(proxy.sys, "stdin", io.TextIOWrapper(io.BytesIO(b"\n".join(lines) + b"\n")))
+    proxy.main()
+
+    responses = [json.loads(line) for line in capsysbinary.readouterr().out.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, 5]
+    assert responses[0]["result"]["protocolVersion"] == "2025-01-01"
+    assert responses[1]["result"] == {"resources": []}
+    assert responses[2]["result"] == {"prompts": []}
+    assert json.loads(responses[3]["result"]["content"][0]["text"]) == {"tool": "gcc_log", "args": {"a": 1}}
+    assert responses[4]["result"] == {}
@@ -98,3 +98,12 @@ def test_namespace_prefix_is_applied_to_generated_session(monkeypatch) -> None:
 
     session_id = proxy._default_session_id()
     assert session_id.startswith("team-a-mcp-")
+
+
+def test_ensure_session_id_updates_arguments_in_place(monkeypatch) -> None:
+    _reset_session_env(monkeypatch)
+    monkeypatch.setenv(proxy.SESSION_ID_ENV, "shared-memory")
+
+    arguments = {"branch": "main"}
+    assert proxy._ensure_session_id(arguments) is arguments
+    assert arguments == {"branch": "main", "session_id": "shared-memory"}